@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from time import perf_counter
+
+from aac.domain.concurrent_history import ConcurrentHistory
+from aac.domain.history import History
+from aac.presets import get_preset
+
+OPS_PER_THREAD = 5_000
+RECORD_EVERY = 10  # 1 record_selection per 10 operations
+THREAD_COUNTS = [1, 2, 4, 8]
+PREFIXES = ["h", "he", "hel", "help", "hero", "hex", "wo", "wor"]
+
+# Blocking work per recorded event (e.g. a persistence listener's write)
+IO_SECONDS = 0.0005
+
+
+class _BlockingListener:
+    """
+    Listener that blocks without holding the GIL, like file or socket I/O.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        if self._seconds:
+            time.sleep(self._seconds)
+
+    def reset(self) -> None:
+        pass
+
+
+def _workload(suggest: Callable[[str], object], record: Callable[[str, str], object]) -> None:
+    for i in range(OPS_PER_THREAD):
+        text = PREFIXES[i % len(PREFIXES)]
+
+        if i % RECORD_EVERY == 0:
+            record(text, "hero")
+        else:
+            suggest(text)
+
+
+def run_global_lock(threads: int, io_seconds: float) -> float:
+    """
+    Baseline: plain History, every engine call behind one global lock.
+    """
+    history = History()
+    history.subscribe(_BlockingListener(io_seconds))
+    engine = get_preset("default").build(history)
+    lock = threading.Lock()
+
+    def suggest(text: str) -> object:
+        with lock:
+            return engine.suggest(text)
+
+    def record(text: str, value: str) -> object:
+        with lock:
+            engine.record_selection(text, value)
+        return None
+
+    return _run(threads, suggest, record)
+
+
+def run_striped(threads: int, io_seconds: float) -> float:
+    """
+    ConcurrentHistory: per-shard locks, no global serialization.
+    """
+    history = ConcurrentHistory()
+    history.subscribe(_BlockingListener(io_seconds))
+    engine = get_preset("default").build(history)
+    return _run(threads, engine.suggest, engine.record_selection)
+
+
+def _run(
+    threads: int,
+    suggest: Callable[[str], object],
+    record: Callable[[str, str], object],
+) -> float:
+    workers = [
+        threading.Thread(target=_workload, args=(suggest, record))
+        for _ in range(threads)
+    ]
+
+    start = perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = perf_counter() - start
+
+    return (threads * OPS_PER_THREAD) / elapsed
+
+
+def main() -> None:
+    """
+    Compare one global lock with lock striping on a mixed workload.
+
+    Pure-Python suggest/record work holds the GIL, so the CPU-bound run
+    cannot scale with threads under either scheme; striping only adds
+    overhead there. Striping pays off when a record blocks while
+    holding its lock (here: a listener doing I/O). A global lock then
+    stalls every reader and writer, while a shard lock only stalls
+    callers of the same shard.
+    """
+    print(f"Mixed workload: {OPS_PER_THREAD:,} ops/thread, 1 in {RECORD_EVERY} records")
+
+    for label, io_seconds in (
+        ("CPU-bound (GIL-limited; no scaling expected)", 0.0),
+        (f"{IO_SECONDS * 1e6:.0f} us blocking I/O per record", IO_SECONDS),
+    ):
+        print(f"\n{label}")
+        print(f"{'threads':>7s} | {'global lock':>14s} | {'striped':>14s}")
+
+        for threads in THREAD_COUNTS:
+            baseline = run_global_lock(threads, io_seconds)
+            striped = run_striped(threads, io_seconds)
+
+            print(f"{threads:7d} | {baseline:10,.0f} op/s | {striped:10,.0f} op/s")
+
+
+if __name__ == "__main__":
+    main()
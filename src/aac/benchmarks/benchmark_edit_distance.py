@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import gc
+import random
+import string
+import tracemalloc
+from collections.abc import Callable
+from time import perf_counter
+
+from aac.predictors.bk_tree import BKTree, Distance
+from aac.predictors.edit_distance import CandidateIndex, LinearIndex, levenshtein
+from aac.predictors.symspell import SymSpellIndex
+
+WORD_COUNTS = [1_000, 10_000, 100_000]
+MAX_DISTANCES = [1, 2]
+QUERY_COUNT = 50
+
+# The linear scan is the reference, but too slow to run beyond this
+LINEAR_MAX_WORDS = 10_000
+
+
+class _CountingDistance:
+    """levenshtein() that counts its evaluations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, a: str, b: str) -> int:
+        self.calls += 1
+        return levenshtein(a, b)
+
+
+def _vocabulary(n: int, rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10))))
+    return sorted(words)
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+
+
+def _build(
+    factory: Callable[[list[str], Distance], CandidateIndex],
+    words: list[str],
+    distance: Distance,
+) -> tuple[CandidateIndex, int]:
+    gc.collect()
+    tracemalloc.start()
+
+    index = factory(words, distance)
+
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return index, retained
+
+
+def main() -> None:
+    rng = random.Random(7)
+
+    factories: list[tuple[str, Callable[[list[str], Distance], CandidateIndex]]] = [
+        ("linear", lambda words, _: LinearIndex(words)),
+        ("bktree", lambda words, d: BKTree(words, distance=d)),
+        ("symspell", lambda words, d: SymSpellIndex(words, distance=d, max_distance=2)),
+    ]
+
+    try:
+        from aac.predictors.numpy_index import NumpyIndex
+    except ImportError:
+        print("NumPy not installed; skipping the numpy index")
+    else:
+        factories.append(("numpy", lambda words, _: NumpyIndex(words)))
+
+    print(
+        f"{'words':>8s} | {'index':8s} | {'memory':>10s} | {'k':>2s} | "
+        f"{'evals':>8s} | {'query':>10s}"
+    )
+
+    for n in WORD_COUNTS:
+        words = _vocabulary(n, rng)
+        queries = [_typo(rng.choice(words), rng) for _ in range(QUERY_COUNT)]
+        expected: dict[int, list[list[tuple[str, int]]]] = {}
+
+        for name, factory in factories:
+            if name == "linear" and n > LINEAR_MAX_WORDS:
+                continue
+
+            counter = _CountingDistance()
+            index, retained = _build(factory, words, counter)
+
+            for k in MAX_DISTANCES:
+                counter.calls = 0
+                start = perf_counter()
+                found = [index.search(q, k) for q in queries]
+                elapsed = (perf_counter() - start) / QUERY_COUNT
+
+                # Every index must agree with the first one measured
+                assert expected.setdefault(k, found) == found
+
+                # Scans do not go through the counted distance function
+                evals = n if name in ("linear", "numpy") else counter.calls / QUERY_COUNT
+                print(
+                    f"{n:8,d} | {name:8s} | {retained / 2**20:6.1f} MiB | {k:2d} | "
+                    f"{evals:8,.0f} | {elapsed * 1000:7.2f} ms"
+                )
+
+            del index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gc
+import random
+import string
+import tracemalloc
+from collections.abc import Callable
+from time import perf_counter
+
+from aac.predictors.compact_trie import CompactTrie
+from aac.predictors.trie import Trie
+
+WORD_COUNTS = [10_000, 100_000, 300_000]
+QUERIES = ["a", "co", "pre", "tion", "zz"] * 200
+QUERY_LIMIT = 10
+
+SUFFIXES = ["", "s", "ed", "ing", "er", "ers", "tion", "able"]
+
+
+def _vocabulary(n: int) -> list[str]:
+    """
+    Synthetic vocabulary with shared stems and suffixes.
+    """
+    rng = random.Random(42)
+    words: set[str] = set()
+
+    while len(words) < n:
+        stem = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        for suffix in SUFFIXES[: rng.randint(1, len(SUFFIXES))]:
+            words.add(stem + suffix)
+
+    return sorted(words)[:n]
+
+
+def _measure(
+    build: Callable[[list[str]], Trie | CompactTrie],
+    words: list[str],
+) -> tuple[Trie | CompactTrie, float, int]:
+    gc.collect()
+    tracemalloc.start()
+
+    start = perf_counter()
+    built = build(words)
+    elapsed = perf_counter() - start
+
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return built, elapsed, retained
+
+
+def _query_us(trie: Trie | CompactTrie) -> float:
+    start = perf_counter()
+    for q in QUERIES:
+        trie.find_prefix(q, limit=QUERY_LIMIT)
+    return (perf_counter() - start) / len(QUERIES) * 1e6
+
+
+def main() -> None:
+    print(f"{'words':>8s} | {'backend':8s} | {'build':>8s} | {'memory':>10s} | {'query':>9s}")
+
+    for n in WORD_COUNTS:
+        words = _vocabulary(n)
+
+        backends: list[tuple[str, Callable[[list[str]], Trie | CompactTrie]]] = [
+            ("Trie", Trie),
+            ("Compact", CompactTrie),
+        ]
+
+        for name, factory in backends:
+            trie, build_s, retained = _measure(factory, words)
+
+            print(
+                f"{n:8,d} | {name:8s} | {build_s:7.2f}s | "
+                f"{retained / 2**20:7.1f} MiB | {_query_us(trie):6.1f} µs"
+            )
+            del trie
+
+
+if __name__ == "__main__":
+    main()
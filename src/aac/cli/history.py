@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.domain.keys import KeyNormalizer
+from aac.domain.keys import rekey as rekey_history
+from aac.storage.base import HistoryStore
+from aac.storage.replica_store import merge_delta_files
+from aac.storage.shared_json_store import SharedJsonHistoryStore
+
+
+def _write(target: HistoryStore, history: History) -> None:
+    # Migrations replace the target; a shared store would merge instead
+    if isinstance(target, SharedJsonHistoryStore):
+        target.overwrite(history)
+    else:
+        target.save(history)
+
+
+def convert(*, source: HistoryStore, target: HistoryStore) -> None:
+    """
+    Copy persisted history from one storage format to another.
+    """
+    history = source.load()
+    _write(target, history)
+
+    prefixes = len(history.snapshot())
+    print(f"Converted history ({prefixes} prefixes)")
+
+
+def merge(*, inputs: list[Path], output: Path) -> None:
+    """
+    Merge replica delta files in one streaming pass.
+    """
+    written = merge_delta_files(inputs, output)
+    print(f"Merged {len(inputs)} histories into {output} ({written} records)")
+
+
+def rekey(*, source: HistoryStore, target: HistoryStore, key: KeyNormalizer) -> None:
+    """
+    Migrate persisted history to a new key normalization scheme.
+    """
+    history = source.load()
+    migrated = rekey_history(history, key)
+    _write(target, migrated)
+
+    before = len(history.snapshot())
+    after = len(migrated.snapshot())
+    print(f"Rekeyed history: {before} -> {after} prefixes")
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 from pathlib import Path
 
-from aac.cli import debug, explain, record, suggest
+from aac.cli import debug, explain, history, record, suggest
 from aac.cli.app import build_engine
+from aac.domain.keys import available_keys, parse_key
 from aac.presets import available_presets, describe_presets
+from aac.storage.base import HistoryStore
+from aac.storage.binary_store import BinaryHistoryStore
 from aac.storage.json_store import JsonHistoryStore
+from aac.storage.log_store import LogHistoryStore
+from aac.storage.replica_store import ReplicaHistoryStore
+from aac.storage.shared_json_store import SharedJsonHistoryStore
+from aac.storage.sqlite_store import SqliteHistoryStore
 
 DEFAULT_HISTORY_PATH = Path(".aac_history.json")
 DEFAULT_LIMIT = 10
 
+STORES: dict[str, Callable[[Path], HistoryStore]] = {
+    "json": JsonHistoryStore,
+    "shared": SharedJsonHistoryStore,
+    "log": LogHistoryStore,
+    "sqlite": SqliteHistoryStore,
+    "binary": BinaryHistoryStore,
+    "replica": ReplicaHistoryStore,
+}
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -32,6 +49,13 @@ def main() -> None:
         help="Path to persisted autocomplete history",
     )
 
+    parser.add_argument(
+        "--store",
+        default="json",
+        choices=sorted(STORES),
+        help="History persistence format",
+    )
+
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     subparsers.add_parser(
@@ -54,14 +78,64 @@ def main() -> None:
     debug_p = subparsers.add_parser("debug", help="Run the debug pipeline")
     debug_p.add_argument("text")
 
+    history_p = subparsers.add_parser("history", help="Manage persisted history")
+    history_sub = history_p.add_subparsers(dest="history_command", required=True)
+
+    convert_p = history_sub.add_parser(
+        "convert",
+        help="Convert persisted history between storage formats",
+    )
+    convert_p.add_argument("source", type=Path)
+    convert_p.add_argument("target", type=Path)
+    convert_p.add_argument("--from", dest="source_store", default="json", choices=sorted(STORES))
+    convert_p.add_argument("--to", dest="target_store", default="binary", choices=sorted(STORES))
+
+    merge_p = history_sub.add_parser(
+        "merge",
+        help="Merge replica history files from several machines (streaming)",
+    )
+    merge_p.add_argument("inputs", type=Path, nargs="+")
+    merge_p.add_argument("--output", "-o", type=Path, required=True)
+
+    rekey_p = history_sub.add_parser(
+        "rekey",
+        help="Migrate history to normalized keys (e.g. last-token)",
+    )
+    rekey_p.add_argument("source", type=Path)
+    rekey_p.add_argument("target", type=Path)
+    rekey_p.add_argument(
+        "--key",
+        type=parse_key,
+        default="last-token",
+        help=f"Comma-separated normalizers: {', '.join(available_keys())}",
+    )
+    rekey_p.add_argument("--from", dest="source_store", default="json", choices=sorted(STORES))
+    rekey_p.add_argument("--to", dest="target_store", default="json", choices=sorted(STORES))
+
     args = parser.parse_args()
 
     if args.command == "presets":
         print(describe_presets())
         return
 
+    if args.command == "history":
+        if args.history_command == "merge":
+            history.merge(inputs=args.inputs, output=args.output)
+        elif args.history_command == "rekey":
+            history.rekey(
+                source=STORES[args.source_store](args.source),
+                target=STORES[args.target_store](args.target),
+                key=args.key,
+            )
+        else:
+            history.convert(
+                source=STORES[args.source_store](args.source),
+                target=STORES[args.target_store](args.target),
+            )
+        return
+
     # Load persisted history
-    store = JsonHistoryStore(args.history_path)
+    store = STORES[args.store](args.history_path)
     persisted_history = store.load()
 
     # Build engine from preset and attach history
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from aac.engine.engine import AutocompleteEngine
-from aac.storage.json_store import JsonHistoryStore
+from aac.storage.base import HistoryStore
 
 
 def run(
     *,
     engine: AutocompleteEngine,
-    store: JsonHistoryStore,
+    store: HistoryStore,
     text: str,
     value: str,
 ) -> None:
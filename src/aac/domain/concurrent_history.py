@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import itertools
+import math
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from datetime import datetime, timezone
+
+from aac.domain.history import (
+    History,
+    HistoryBucket,
+    HistoryEntry,
+    HistoryListener,
+    RetentionPolicy,
+)
+
+
+class _Shard(History):
+    """
+    One lock-protected partition of a ConcurrentHistory.
+
+    Tracks a global sequence number per raw entry so entries from
+    all shards can be merged back into insertion order.
+    """
+
+    def __init__(
+        self,
+        *,
+        retention: RetentionPolicy | None,
+        clock: Callable[[], datetime | None],
+    ) -> None:
+        super().__init__(retention=retention)
+        self.lock = threading.RLock()
+        self._seqs: deque[int] = deque()
+        self._pending: Iterator[int] = iter(())
+        self._clock = clock
+
+    def _retention_clock(self) -> datetime | None:
+        # max_age is measured against the newest event of any shard
+        return self._clock()
+
+    def assign(self, seqs: Iterable[int]) -> None:
+        """
+        Provide sequence numbers for the next appended entries.
+        """
+        self._pending = iter(seqs)
+
+    def _append(self, prefix: str, value: str, timestamp: datetime) -> None:
+        super()._append(prefix, value, timestamp)
+        self._seqs.append(next(self._pending))
+
+    def _clear_entries(self) -> None:
+        super()._clear_entries()
+        self._seqs.clear()
+
+    def _pop_oldest(self) -> HistoryEntry:
+        self._seqs.popleft()
+        return super()._pop_oldest()
+
+    def sequenced(self) -> list[tuple[int, HistoryEntry]]:
+        return list(zip(self._seqs, self._entries, strict=True))
+
+
+class ConcurrentHistory(History):
+    """
+    Thread-safe History for multi-threaded serving.
+
+    Prefixes are partitioned across shards by hash; each shard is an
+    independent History guarded by its own lock (lock striping).
+
+    Concurrency model:
+        - record() locks only the shard owning the prefix
+        - Per-prefix reads (counts_for_prefix, windows, buckets) lock
+          the same single shard briefly and return O(matches) copies,
+          giving snapshot-consistent results without global copies
+        - count() sums per-shard indexes without locking
+        - Whole-history operations (entries, snapshot, replace,
+          subscribe) visit shards one at a time, except replace and
+          subscribe, which hold every lock in a fixed order
+        - Listeners are invoked under the owning shard's lock, so
+          per-prefix listener state is updated serially
+
+    Throughput:
+        Pure-Python reads and writes hold the GIL, so CPU-bound
+        workloads do not scale with threads under striping or a global
+        lock, and striping adds some overhead. It pays off when lock
+        holders block, e.g. listeners doing I/O: other shards keep
+        serving meanwhile (see benchmarks/benchmark_concurrency.py).
+
+    Notes:
+        - entries() preserves global insertion order via sequence numbers
+        - A RetentionPolicy's max_events is split evenly across shards;
+          max_age is measured against the newest event of any shard,
+          and each record also ages out one other shard round-robin
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        retention: RetentionPolicy | None = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+
+        super().__init__()
+
+        if retention is not None and retention.max_events is not None:
+            retention = dataclasses.replace(
+                retention,
+                max_events=math.ceil(retention.max_events / shards),
+            )
+
+        self._shards = [
+            _Shard(retention=retention, clock=self._retention_clock)
+            for _ in range(shards)
+        ]
+        self._seq = itertools.count()
+
+        # Global newest timestamp, shared by all shards' retention
+        self._newest_lock = threading.Lock()
+        self._sweeps = itertools.count()
+        self._sweep_batch = (
+            retention.batch_size
+            if retention is not None and retention.max_age is not None
+            else 0
+        )
+
+    def _advance(self, timestamp: datetime) -> None:
+        with self._newest_lock:
+            if self._newest is None or timestamp > self._newest:
+                self._newest = timestamp
+
+    def _sweep(self) -> None:
+        """
+        Age out events of one other shard, round-robin.
+
+        Shards that receive no records would otherwise keep events the
+        global max_age cutoff has passed. Busy shards are skipped.
+        """
+        if not self._sweep_batch:
+            return
+
+        shard = self._shards[next(self._sweeps) % len(self._shards)]
+        if shard.lock.acquire(blocking=False):
+            try:
+                shard._compact(self._sweep_batch)
+            finally:
+                shard.lock.release()
+
+    def _shard_index(self, prefix: str) -> int:
+        return hash(prefix) % len(self._shards)
+
+    def _shard(self, prefix: str) -> _Shard:
+        return self._shards[self._shard_index(prefix)]
+
+    # ------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------
+
+    def record(
+        self,
+        prefix: str,
+        value: str,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        prefix = str(prefix)
+        value = str(value)
+        shard = self._shard(prefix)
+
+        self._advance(timestamp)
+
+        with shard.lock:
+            shard.assign((next(self._seq),))
+            shard.record(prefix, value, timestamp=timestamp)
+
+            for listener in self._listeners:
+                listener.observe(prefix, value, timestamp)
+
+        self._sweep()
+
+    def record_bulk(
+        self,
+        prefix: str,
+        value: str,
+        count: int,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        prefix = str(prefix)
+        value = str(value)
+        shard = self._shard(prefix)
+
+        if count > 0:
+            self._advance(timestamp)
+
+        with shard.lock:
+            shard.record_bulk(prefix, value, count, timestamp=timestamp)
+
+            if count > 0:
+                for listener in self._listeners:
+                    listener.observe(prefix, value, timestamp, count)
+
+        self._sweep()
+
+    def subscribe(self, listener: HistoryListener, *, replay: bool = True) -> None:
+        with _all_locks(self._shards):
+            if replay:
+                self._replay(listener)
+            self._listeners.append(listener)
+
+    def prefix_lock(self, prefix: str) -> AbstractContextManager[object]:
+        return self._shard(str(prefix)).lock
+
+    def compact(self) -> int:
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                evicted += shard.compact()
+        return evicted
+
+    # ------------------------------------------------------------
+    # Read APIs
+    # ------------------------------------------------------------
+
+    def entries(self) -> Sequence[HistoryEntry]:
+        runs = []
+        for shard in self._shards:
+            with shard.lock:
+                runs.append(shard.sequenced())
+
+        return tuple(
+            entry
+            for _, entry in heapq.merge(*runs, key=lambda item: item[0])
+        )
+
+    def entries_for_prefix(self, prefix: str) -> Sequence[HistoryEntry]:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.entries_for_prefix(prefix)
+
+    def buckets(self) -> Sequence[HistoryBucket]:
+        runs = []
+        for shard in self._shards:
+            with shard.lock:
+                runs.append(shard.buckets())
+
+        return tuple(heapq.merge(*runs, key=lambda b: b.start))
+
+    def buckets_for_prefix(self, prefix: str) -> Sequence[HistoryBucket]:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.buckets_for_prefix(prefix)
+
+    def counts_for_prefix(self, prefix: str) -> dict[str, int]:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.counts_for_prefix(prefix)
+
+    def counts_for_prefix_since(
+        self,
+        prefix: str,
+        since: datetime,
+    ) -> dict[str, int]:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.counts_for_prefix_since(prefix, since)
+
+    def counts_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, int]:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.counts_for_prefix_between(prefix, start, end)
+
+    def total_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        shard = self._shard(str(prefix))
+        with shard.lock:
+            return shard.total_for_prefix_between(prefix, start, end)
+
+    def count(self, value: str) -> int:
+        return sum(shard.count(value) for shard in self._shards)
+
+    # ------------------------------------------------------------
+    # Persistence boundary
+    # ------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        merged: dict[str, dict[str, int]] = {}
+        for shard in self._shards:
+            with shard.lock:
+                merged.update(shard.snapshot())
+        return merged
+
+    def replace(self, other: History) -> None:
+        # Read `other` once and split it by shard before taking any lock
+        entries = other.entries()
+        buckets = other.buckets()
+        snapshot = other.snapshot()
+
+        slices: list[tuple[list[int], list[HistoryEntry], list[HistoryBucket]]] = [
+            ([], [], []) for _ in self._shards
+        ]
+        counts: list[dict[str, dict[str, int]]] = [{} for _ in self._shards]
+        newest: datetime | None = None
+
+        for seq, e in enumerate(entries):
+            seqs, shard_entries, _ = slices[self._shard_index(e.prefix)]
+            seqs.append(seq)
+            shard_entries.append(e)
+            if newest is None or e.timestamp > newest:
+                newest = e.timestamp
+
+        for b in buckets:
+            slices[self._shard_index(b.prefix)][2].append(b)
+            if newest is None or b.start > newest:
+                newest = b.start
+
+        for prefix, values in snapshot.items():
+            counts[self._shard_index(prefix)][prefix] = values
+
+        with _all_locks(self._shards):
+            self._seq = itertools.count(len(entries))
+            self._newest = newest
+
+            for shard, (seqs, shard_entries, shard_buckets), shard_counts in zip(
+                self._shards, slices, counts, strict=True
+            ):
+                shard.assign(seqs)
+                shard._load(shard_entries, shard_buckets, shard_counts, newest)
+
+            for listener in self._listeners:
+                listener.reset()
+                self._replay(listener)
+
+
+@contextmanager
+def _all_locks(shards: Sequence[_Shard]) -> Iterator[None]:
+    """
+    Hold every shard lock, acquired in index order (deadlock-free).
+    """
+    with ExitStack() as stack:
+        for shard in shards:
+            stack.enter_context(shard.lock)
+        yield
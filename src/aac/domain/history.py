@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Sequence
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(timestamp: datetime) -> int:
+    """
+    Convert a timezone-aware datetime to integer epoch microseconds.
+    """
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_us(us: int) -> datetime:
+    """
+    Convert epoch microseconds back to a UTC datetime.
+    """
+    return _EPOCH + timedelta(microseconds=us)
 
 
 @dataclass(frozen=True)
@@ -15,7 +36,7 @@ class HistoryEntry:
         prefix: The user input prefix at the time of selection.
         value: The completion value selected by the user.
         timestamp: When the selection occurred (UTC, timezone-aware).
-    
+
     Notes:
         - Entries are immutable once created.
         - Timestamps are always stored in UTC.
@@ -33,25 +54,192 @@ class HistoryEntry:
             )
 
 
+@dataclass(frozen=True)
+class HistoryBucket:
+    """
+    Aggregate of rolled-up or bulk-recorded events for one
+    (prefix, value) pair.
+
+    Attributes:
+        prefix: The user input prefix.
+        value: The completion value selected by the user.
+        start: Inclusive start of the bucket period (UTC).
+        count: Number of events folded into the bucket.
+    """
+    prefix: str
+    value: str
+    start: datetime
+    count: int
+
+
+HOURLY = timedelta(hours=1)
+DAILY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Bounds on the raw event log kept by History.
+
+    Events beyond either bound are rolled up into per-(prefix, value)
+    buckets of width `rollup` instead of being kept individually.
+
+    Attributes:
+        max_events: Maximum number of raw events retained.
+        max_age: Maximum age of raw events, measured against the
+                 newest recorded timestamp.
+        rollup: Bucket width for rolled-up events (e.g. HOURLY, DAILY).
+        batch_size: Maximum evictions performed per record() call,
+                    bounding the cost of incremental compaction.
+    """
+    max_events: int | None = None
+    max_age: timedelta | None = None
+    rollup: timedelta = HOURLY
+    batch_size: int = 64
+
+    def __post_init__(self) -> None:
+        if self.max_events is not None and self.max_events < 0:
+            raise ValueError("max_events must be non-negative")
+        if self.max_age is not None and self.max_age < timedelta(0):
+            raise ValueError("max_age must be non-negative")
+        if self.rollup <= timedelta(0):
+            raise ValueError("rollup must be positive")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+
+class _PostingList:
+    """
+    Timestamp-sorted events for a single prefix.
+
+    - In-order timestamps append in O(1); late events insert via bisect
+    - Range lookups cost O(log n) via bisect on the time column
+    - Oldest-first removals (retention) advance a head offset that is
+      trimmed lazily, keeping eviction amortized O(1)
+    """
+
+    __slots__ = ("times", "values", "head")
+
+    def __init__(self) -> None:
+        self.times = array("q")
+        self.values: list[str] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.times) - self.head
+
+    def add(self, ts_us: int, value: str) -> None:
+        if not self or ts_us >= self.times[-1]:
+            self.times.append(ts_us)
+            self.values.append(value)
+            return
+
+        i = bisect_right(self.times, ts_us, self.head)
+        self.times.insert(i, ts_us)
+        self.values.insert(i, value)
+
+    def remove(self, ts_us: int, value: str) -> None:
+        i = bisect_left(self.times, ts_us, self.head)
+        while self.values[i] != value:
+            i += 1
+
+        if i == self.head:
+            self.head += 1
+            if self.head * 2 >= len(self.times):
+                del self.times[: self.head]
+                del self.values[: self.head]
+                self.head = 0
+        else:
+            del self.times[i]
+            del self.values[i]
+
+    def span(self, start_us: int, end_us: int | None) -> tuple[int, int]:
+        """
+        Index range [lo, hi) of events with start_us <= t < end_us.
+        """
+        lo = bisect_left(self.times, start_us, self.head)
+        hi = len(self.times) if end_us is None else bisect_left(self.times, end_us, lo)
+        return lo, hi
+
+
+class HistoryListener(Protocol):
+    """
+    Observer of recorded history events.
+
+    Listeners let derived state (e.g. decayed counters) stay in sync
+    with History incrementally instead of rescanning all entries.
+    """
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        """
+        Called once per recorded event (or aggregate of `count`
+        events sharing a timestamp), after History is updated.
+        """
+        ...
+
+    def reset(self) -> None:
+        """
+        Called before History contents are replaced wholesale.
+        """
+        ...
+
+
 class History:
     """
     Append-only store of user completion events.
 
     This is the single source of truth for all learning signals.
-    
+
     Design guarantees:
         - Entries are immutable once recorded
-        - No deletion or in-place mutation
+        - No in-place mutation; retention rolls events up, never drops them
         - Safe to share across predictors and rankers
         - Persistence-friendly via explicit snapshot export
 
     This class intentionally separates:
         - In-memory domain representation (HistoryEntry)
         - Serialized representation (snapshot)
+
+    Indexing:
+        - Aggregate counts are maintained incrementally by record()
+        - prefix -> value -> count backs counts_for_prefix() and snapshot()
+        - value -> count backs count()
+        - Hot read paths cost O(matches), not O(history size)
+        - Listeners receive every event for their own derived state
+        - Per-prefix, timestamp-sorted posting lists answer time-window
+          queries in O(log n + k) via bisect
+
+    Retention:
+        - Optional RetentionPolicy bounds the raw event log
+        - Evicted events are rolled up into HistoryBucket aggregates,
+          oldest first in insertion order
+        - Compaction runs incrementally (batch_size per record())
+        - counts_for_prefix(), count() and snapshot() stay exact
+        - Time-filtered reads resolve rolled-up events to bucket
+          granularity (a bucket counts if its start is in range)
+        - record_bulk() adds pre-aggregated buckets directly (hydration)
     """
 
-    def __init__(self) -> None:
-        self._entries: list[HistoryEntry] = []
+    def __init__(self, *, retention: RetentionPolicy | None = None) -> None:
+        self._entries: deque[HistoryEntry] = deque()
+
+        # Derived indexes (rebuildable from _entries and _buckets)
+        self._counts: dict[str, dict[str, int]] = {}
+        self._value_counts: dict[str, int] = {}
+        self._postings: dict[str, _PostingList] = {}
+
+        self._listeners: list[HistoryListener] = []
+
+        # Rolled-up events: prefix -> (value, bucket start us) -> count
+        self._retention = retention
+        self._buckets: dict[str, dict[tuple[str, int], int]] = {}
+        self._newest: datetime | None = None
 
     # ------------------------------------------------------------
     # Recording
@@ -85,24 +273,298 @@ class History:
         if timestamp.tzinfo is None:
             raise ValueError("timestamp must be timezone-aware")
 
+        prefix = str(prefix)
+        value = str(value)
+
+        self._append(prefix, value, timestamp)
+        self._index(prefix, value)
+        self._post(prefix, value, timestamp)
+
+        for listener in self._listeners:
+            listener.observe(prefix, value, timestamp)
+
+        if self._newest is None or timestamp > self._newest:
+            self._newest = timestamp
+
+        if self._retention is not None:
+            self._compact(self._retention.batch_size)
+
+    def _append(self, prefix: str, value: str, timestamp: datetime) -> None:
+        """
+        Append a raw event to the entry log.
+
+        Storage hook: subclasses may use a different in-memory layout
+        as long as entries() reproduces the same events in order.
+        """
         self._entries.append(
             HistoryEntry(
-                prefix=str(prefix),
-                value=str(value),
+                prefix=prefix,
+                value=value,
                 timestamp=timestamp,
             )
         )
 
+    def _clear_entries(self) -> None:
+        """
+        Drop all raw events from the entry log (storage hook).
+        """
+        self._entries.clear()
+
+    def _raw_size(self) -> int:
+        """
+        Number of raw events in the entry log (storage hook).
+        """
+        return len(self._entries)
+
+    def _oldest_timestamp(self) -> datetime:
+        """
+        Timestamp of the oldest raw event (storage hook).
+        """
+        return self._entries[0].timestamp
+
+    def _pop_oldest(self) -> HistoryEntry:
+        """
+        Remove and return the oldest raw event (storage hook).
+        """
+        return self._entries.popleft()
+
+    def record_bulk(
+        self,
+        prefix: str,
+        value: str,
+        count: int,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """
+        Record `count` selections of one value as a single aggregate.
+
+        Intended for hydration from count-only snapshots: cost is O(1)
+        regardless of `count`, instead of `count` calls to record().
+
+        Parameters:
+            prefix: The user input prefix.
+            value: The completion selected by the user.
+            count: Number of selections (non-negative).
+            timestamp: Time attributed to every aggregated selection.
+                       If omitted, the current UTC time is used.
+
+        Notes:
+            - Counts, windows and listeners (e.g. decay) see exactly the
+              same signal as `count` individual records at `timestamp`
+            - The aggregate is exposed via buckets(), not entries()
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative")
+
+        if count == 0:
+            return
+
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        if timestamp.tzinfo is None:
+            raise ValueError("timestamp must be timezone-aware")
+
+        prefix = str(prefix)
+        value = str(value)
+
+        self._index(prefix, value, count)
+        self._aggregate(prefix, value, to_epoch_us(timestamp), count)
+
+        for listener in self._listeners:
+            listener.observe(prefix, value, timestamp, count)
+
+        if self._newest is None or timestamp > self._newest:
+            self._newest = timestamp
+
+    def _index(self, prefix: str, value: str, count: int = 1) -> None:
+        """
+        Fold events into the aggregate count indexes.
+        """
+        values = self._counts.get(prefix)
+        if values is None:
+            values = self._counts[prefix] = {}
+
+        values[value] = values.get(value, 0) + count
+        self._value_counts[value] = self._value_counts.get(value, 0) + count
+
+    def _post(self, prefix: str, value: str, timestamp: datetime) -> None:
+        """
+        Add a raw event to its prefix's time-sorted posting list.
+        """
+        postings = self._postings.get(prefix)
+        if postings is None:
+            postings = self._postings[prefix] = _PostingList()
+
+        postings.add(to_epoch_us(timestamp), value)
+
+    def subscribe(self, listener: HistoryListener, *, replay: bool = True) -> None:
+        """
+        Register a listener for recorded events.
+
+        By default existing entries are replayed into the listener
+        immediately, so late subscribers observe the same stream as
+        early ones. Pass replay=False for listeners that only care
+        about new events (e.g. persistence logs).
+        """
+        if replay:
+            self._replay(listener)
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: HistoryListener) -> None:
+        """
+        Stop notifying a previously subscribed listener.
+        """
+        self._listeners.remove(listener)
+
+    def prefix_lock(self, prefix: str) -> AbstractContextManager[object]:
+        """
+        Context in which events for `prefix` cannot be recorded.
+
+        record() notifies listeners inside the same context, so a
+        listener that reads a prefix's events under it cannot miss or
+        double-count a concurrent record. Plain History is not
+        thread-safe, so this is a no-op here.
+        """
+        return nullcontext()
+
+    def _replay(self, listener: HistoryListener) -> None:
+        for b in self.buckets():
+            listener.observe(b.prefix, b.value, b.start, b.count)
+
+        for e in self.entries():
+            listener.observe(e.prefix, e.value, e.timestamp)
+
+    # ------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------
+
+    def _over_retention(self, policy: RetentionPolicy) -> bool:
+        size = self._raw_size()
+        if size == 0:
+            return False
+
+        if policy.max_events is not None and size > policy.max_events:
+            return True
+
+        newest = self._retention_clock()
+        if policy.max_age is not None and newest is not None:
+            return self._oldest_timestamp() < newest - policy.max_age
+
+        return False
+
+    def _retention_clock(self) -> datetime | None:
+        """
+        Newest timestamp that max_age is measured against (hook).
+        """
+        return self._newest
+
+    def _compact(self, limit: int | None) -> int:
+        policy = self._retention
+        if policy is None:
+            return 0
+
+        width_us = policy.rollup // _MICROSECOND
+        evicted = 0
+
+        while (limit is None or evicted < limit) and self._over_retention(policy):
+            e = self._pop_oldest()
+
+            ts_us = to_epoch_us(e.timestamp)
+            self._postings[e.prefix].remove(ts_us, e.value)
+
+            self._aggregate(e.prefix, e.value, ts_us - ts_us % width_us, 1)
+
+            evicted += 1
+
+        return evicted
+
+    def _aggregate(self, prefix: str, value: str, start_us: int, count: int) -> None:
+        """
+        Add events to the (value, start) bucket of a prefix.
+        """
+        buckets = self._buckets.get(prefix)
+        if buckets is None:
+            buckets = self._buckets[prefix] = {}
+
+        key = (value, start_us)
+        buckets[key] = buckets.get(key, 0) + count
+
+    def compact(self) -> int:
+        """
+        Run compaction until the retention policy is satisfied.
+
+        record() already compacts incrementally; this is intended for
+        explicit maintenance (e.g. after hydration).
+
+        Returns:
+            Number of raw events rolled up into buckets.
+        """
+        return self._compact(None)
+
+    def buckets(self) -> Sequence[HistoryBucket]:
+        """
+        Immutable view of rolled-up aggregate buckets.
+
+        Returns:
+            A tuple of HistoryBucket objects ordered by bucket start.
+        """
+        return tuple(sorted(
+            (
+                b
+                for prefix in self._buckets
+                for b in self.buckets_for_prefix(prefix)
+            ),
+            key=lambda b: b.start,
+        ))
+
+    def buckets_for_prefix(self, prefix: str) -> Sequence[HistoryBucket]:
+        """
+        Return rolled-up buckets for a given prefix.
+
+        Parameters:
+            prefix: The prefix to filter by.
+
+        Returns:
+            A tuple of HistoryBucket objects.
+        """
+        prefix = str(prefix)
+        return tuple(
+            HistoryBucket(
+                prefix=prefix,
+                value=value,
+                start=from_epoch_us(start_us),
+                count=count,
+            )
+            for (value, start_us), count in self._buckets.get(prefix, {}).items()
+        )
+
+    def _add_bucket_counts(
+        self,
+        counts: dict[str, int],
+        prefix: str,
+        start_us: int,
+        end_us: int | None,
+    ) -> None:
+        for (value, bucket_us), count in self._buckets.get(prefix, {}).items():
+            if bucket_us < start_us:
+                continue
+            if end_us is not None and bucket_us >= end_us:
+                continue
+            counts[value] = counts.get(value, 0) + count
+
     # ------------------------------------------------------------
     # Read APIs
     # ------------------------------------------------------------
 
     def entries(self) -> Sequence[HistoryEntry]:
         """
-        Immutable view of all recorded history entries.
+        Immutable view of all retained raw history entries.
 
         Returns:
             A tuple of HistoryEntry objects in insertion order.
+            Rolled-up events are exposed via buckets() instead.
         """
         return tuple(self._entries)
 
@@ -114,12 +576,23 @@ class History:
             prefix: The prefix to filter by.
 
         Returns:
-            A tuple of HistoryEntry objects.
+            A tuple of HistoryEntry objects, oldest first (events with
+            equal timestamps in recording order), with timestamps
+            normalized to UTC.
+
+        Served from the prefix's posting list: O(matches), not a scan
+        of the whole entry log.
         """
         prefix = str(prefix)
+        postings = self._postings.get(prefix)
+        if postings is None:
+            return ()
+
+        times = postings.times
+        values = postings.values
         return tuple(
-            e for e in self._entries
-            if e.prefix == prefix
+            HistoryEntry(prefix=prefix, value=values[i], timestamp=from_epoch_us(times[i]))
+            for i in range(postings.head, len(times))
         )
 
     def counts_for_prefix(self, prefix: str) -> dict[str, int]:
@@ -133,16 +606,10 @@ class History:
             prefix: The prefix to aggregate counts for.
 
         Returns:
-            Mapping of completion value -> selection count.
+            Mapping of completion value -> selection count,
+            in first-selection order.
         """
-        prefix = str(prefix)
-        counts: dict[str, int] = defaultdict(int)
-
-        for e in self._entries:
-            if e.prefix == prefix:
-                counts[e.value] += 1
-
-        return dict(counts)
+        return dict(self._counts.get(str(prefix), {}))
 
     def counts_for_prefix_since(
         self,
@@ -164,17 +631,89 @@ class History:
         if since.tzinfo is None:
             raise ValueError("since must be timezone-aware")
 
+        return self._window_counts(str(prefix), to_epoch_us(since), None)
+
+    def counts_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, int]:
+        """
+        Count selections for a prefix within a half-open time window.
+
+        Intended for sliding-window ranking features.
+
+        Parameters:
+            prefix: The prefix to aggregate counts for.
+            start: Lower bound (inclusive) for entry timestamps.
+            end: Upper bound (exclusive) for entry timestamps.
+
+        Returns:
+            Mapping of completion value -> selection count.
+        """
+        if start.tzinfo is None or end.tzinfo is None:
+            raise ValueError("start and end must be timezone-aware")
+
+        return self._window_counts(
+            str(prefix),
+            to_epoch_us(start),
+            to_epoch_us(end),
+        )
+
+    def total_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        """
+        Total selections for a prefix within a half-open time window.
+
+        Costs O(log n) for raw events (no per-event iteration), which
+        makes it suitable for rate-style features.
+
+        Parameters:
+            prefix: The prefix to count selections for.
+            start: Lower bound (inclusive) for entry timestamps.
+            end: Upper bound (exclusive) for entry timestamps.
+
+        Returns:
+            Number of selections in the window.
+        """
+        if start.tzinfo is None or end.tzinfo is None:
+            raise ValueError("start and end must be timezone-aware")
+
         prefix = str(prefix)
-        counts: dict[str, int] = defaultdict(int)
+        start_us = to_epoch_us(start)
+        end_us = to_epoch_us(end)
 
-        for e in self._entries:
-            if e.prefix != prefix:
-                continue
-            if e.timestamp < since:
-                continue
-            counts[e.value] += 1
+        total = 0
+        postings = self._postings.get(prefix)
+        if postings is not None:
+            lo, hi = postings.span(start_us, end_us)
+            total = hi - lo
+
+        bucket_counts: dict[str, int] = {}
+        self._add_bucket_counts(bucket_counts, prefix, start_us, end_us)
+        return total + sum(bucket_counts.values())
 
-        return dict(counts)
+    def _window_counts(
+        self,
+        prefix: str,
+        start_us: int,
+        end_us: int | None,
+    ) -> dict[str, int]:
+        counts: dict[str, int] = {}
+
+        postings = self._postings.get(prefix)
+        if postings is not None:
+            lo, hi = postings.span(start_us, end_us)
+            for value in postings.values[lo:hi]:
+                counts[value] = counts.get(value, 0) + 1
+
+        self._add_bucket_counts(counts, prefix, start_us, end_us)
+        return counts
 
     def count(self, value: str) -> int:
         """
@@ -186,11 +725,7 @@ class History:
         Returns:
             Number of times the value was selected.
         """
-        value = str(value)
-        return sum(
-            1 for e in self._entries
-            if e.value == value
-        )
+        return self._value_counts.get(str(value), 0)
 
     # ------------------------------------------------------------
     # Persistence boundary
@@ -213,14 +748,9 @@ class History:
             - Stable, compact, and storage-friendly
             - Suitable for persistence, debugging, and inspection
         """
-        snapshot: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
-        for e in self._entries:
-            snapshot[e.prefix][e.value] += 1
-
         return {
             prefix: dict(values)
-            for prefix, values in snapshot.items()
+            for prefix, values in list(self._counts.items())
         }
 
     def replace(self, other: History) -> None:
@@ -228,6 +758,47 @@ class History:
         Replace contents with another History instance.
         Intended for persistence hydration.
         """
-        self._entries.clear()
-        self._entries.extend(other._entries)
+        entries = other.entries()
+        buckets = other.buckets()
+        newest = max(
+            [e.timestamp for e in entries] + [b.start for b in buckets],
+            default=None,
+        )
+        self._load(entries, buckets, other.snapshot(), newest)
+
+        for listener in self._listeners:
+            listener.reset()
+            self._replay(listener)
 
+    def _load(
+        self,
+        entries: Iterable[HistoryEntry],
+        buckets: Iterable[HistoryBucket],
+        counts: dict[str, dict[str, int]],
+        newest: datetime | None,
+    ) -> None:
+        """
+        Rebuild all state from another history's contents.
+
+        Takes plain data read through public APIs, so any History
+        implementation can be a source and callers can load a slice.
+        """
+        self._clear_entries()
+        self._postings = {}
+        for e in entries:
+            self._append(e.prefix, e.value, e.timestamp)
+            self._post(e.prefix, e.value, e.timestamp)
+
+        self._buckets = {}
+        for b in buckets:
+            slots = self._buckets.setdefault(b.prefix, {})
+            slots[(b.value, to_epoch_us(b.start))] = b.count
+
+        self._counts = counts
+        self._value_counts = {}
+        for values in self._counts.values():
+            for value, count in values.items():
+                self._value_counts[value] = self._value_counts.get(value, 0) + count
+
+        self._newest = newest
+        self._compact(None)
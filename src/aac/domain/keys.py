@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from aac.domain.history import History
+
+KeyNormalizer = Callable[[str], str]
+"""
+Maps raw input text to the History key it is recorded and queried under.
+
+Normalizers must be pure and idempotent (key(key(t)) == key(t)), so
+that already-normalized keys survive a second pass unchanged.
+"""
+
+
+def identity(text: str) -> str:
+    """Use the raw input text as key (legacy behavior)."""
+    return text
+
+
+def last_token(text: str) -> str:
+    """
+    Use the last whitespace-separated token as key.
+
+    Matches CompletionContext.prefix() without a cursor, so history
+    keys line up with what predictors complete.
+    """
+    parts = text.split()
+    return parts[-1] if parts else ""
+
+
+def casefold(text: str) -> str:
+    """Case-insensitive keys."""
+    return text.casefold()
+
+
+def bounded(max_length: int) -> KeyNormalizer:
+    """
+    Keep only the last `max_length` characters (nearest the cursor).
+    """
+    if max_length < 1:
+        raise ValueError("max_length must be at least 1")
+
+    def key(text: str) -> str:
+        return text[-max_length:]
+
+    return key
+
+
+def chain(*normalizers: KeyNormalizer) -> KeyNormalizer:
+    """
+    Apply normalizers left to right.
+    """
+    def key(text: str) -> str:
+        for normalize in normalizers:
+            text = normalize(text)
+        return text
+
+    return key
+
+
+_NAMED: dict[str, KeyNormalizer] = {
+    "identity": identity,
+    "last-token": last_token,
+    "casefold": casefold,
+}
+
+
+def available_keys() -> list[str]:
+    """Names accepted by parse_key()."""
+    return [*_NAMED, "bounded=<n>"]
+
+
+def parse_key(spec: str) -> KeyNormalizer:
+    """
+    Build a normalizer from a comma-separated spec.
+
+    Example:
+        "last-token,casefold,bounded=32"
+    """
+    normalizers: list[KeyNormalizer] = []
+
+    for name in (part.strip() for part in spec.split(",")):
+        if name.startswith("bounded="):
+            normalizers.append(bounded(int(name.removeprefix("bounded="))))
+        elif name in _NAMED:
+            normalizers.append(_NAMED[name])
+        else:
+            raise ValueError(f"Unknown key normalizer: {name!r}")
+
+    return chain(*normalizers)
+
+
+def rekey(history: History, key: KeyNormalizer) -> History:
+    """
+    Copy History with every prefix passed through `key`.
+
+    Migration path for histories recorded under a different key
+    scheme: events whose normalized prefixes collide are merged, and
+    events whose prefix normalizes to "" are dropped (they can never
+    be queried). Timestamps and buckets are preserved.
+    """
+    migrated = History()
+
+    for b in history.buckets():
+        prefix = key(b.prefix)
+        if prefix:
+            migrated.record_bulk(prefix, b.value, b.count, timestamp=b.start)
+
+    for e in history.entries():
+        prefix = key(e.prefix)
+        if prefix:
+            migrated.record(prefix, e.value, timestamp=e.timestamp)
+
+    return migrated
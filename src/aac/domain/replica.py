@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+
+from aac.domain.history import History
+
+_Key = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class DeltaRecord:
+    """
+    One G-counter component of a replicated history.
+
+    Attributes:
+        replica: Replica that recorded the selections.
+        prefix: User input prefix.
+        value: Selected completion.
+        count: Total selections of (prefix, value) made on `replica`
+               (absolute, not an increment).
+        seq: Event id (per-replica sequence number) of the latest
+             selection included in `count`.
+    """
+
+    replica: str
+    prefix: str
+    value: str
+    count: int
+    seq: int
+
+    def __post_init__(self) -> None:
+        if self.count < 0 or self.seq < 0:
+            raise ValueError("count and seq must be non-negative")
+
+    @property
+    def key(self) -> _Key:
+        return (self.replica, self.prefix, self.value)
+
+
+class ReplicaState:
+    """
+    G-counter replication state for a History.
+
+    Every (replica, prefix, value) has a monotonically growing counter
+    owned by the replica that records the selections. Merging takes
+    the per-component maximum, so applying deltas is idempotent,
+    commutative and associative, and never loses or double-counts
+    selections.
+
+    Each local selection gets an event id (the local replica's next
+    sequence number); clock() is the resulting version vector, and
+    export(since=clock) returns only components changed after it.
+
+    Design notes:
+        - Attached as a HistoryListener: local records are tracked
+          without changes to History or the engine
+        - apply() feeds only the increase of each component into the
+          History via record_bulk(), so cost is linear in the delta
+        - History.replace() keeps every replica's counts: replayed
+          selections some replica already counts stay attributed to
+          it, only the excess is attributed to the local replica
+        - export() keeps the sorted key order between calls and an
+          index of component updates by event id, so a delta costs
+          O(k log k) for k changed components, not a sort of the
+          whole state
+    """
+
+    def __init__(self, replica: str) -> None:
+        if not replica:
+            raise ValueError("replica id must be non-empty")
+
+        self._replica = replica
+        self._counters: dict[_Key, tuple[int, int]] = {}
+        self._clock: dict[str, int] = {}
+        self._history: History | None = None
+        self._applying = False
+
+        # (prefix, value) -> selections already counted by some
+        # replica; set by reset() and consumed by the replay after it
+        self._baseline: dict[tuple[str, str], int] = {}
+
+        # Sorted keys of _counters, and keys added since
+        self._order: list[_Key] = []
+        self._unsorted: set[_Key] = set()
+
+        # replica -> (seq, key) per component update, sorted by seq;
+        # entries superseded by a later update are skipped and pruned
+        self._updates: dict[str, list[tuple[int, _Key]]] = {}
+        self._components: dict[str, int] = {}
+
+    @property
+    def replica(self) -> str:
+        return self._replica
+
+    def attach(self, history: History, *, replay: bool = False) -> None:
+        """
+        Track local selections recorded into `history` from now on.
+
+        With replay=True, existing contents this state does not
+        already count are attributed to the local replica as well.
+        """
+        if self._history is not None:
+            self._history.unsubscribe(self)
+
+        if replay:
+            self.reset()
+        else:
+            self._baseline = {}
+
+        self._history = history
+        history.subscribe(self, replay=replay)
+
+    def clock(self) -> dict[str, int]:
+        """
+        Version vector: highest event id seen per replica.
+        """
+        return dict(self._clock)
+
+    # ------------------------------------------------------------
+    # HistoryListener
+    # ------------------------------------------------------------
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        if self._applying:
+            return
+
+        known = self._baseline.get((prefix, value))
+        if known:
+            absorbed = min(known, count)
+            if absorbed < known:
+                self._baseline[(prefix, value)] = known - absorbed
+            else:
+                del self._baseline[(prefix, value)]
+
+            count -= absorbed
+            if not count:
+                return
+
+        seq = self._clock.get(self._replica, 0) + 1
+        self._clock[self._replica] = seq
+
+        key = (self._replica, prefix, value)
+        current, _ = self._counters.get(key, (0, 0))
+        self._update(key, current + count, seq)
+
+    def reset(self) -> None:
+        # Counters are kept: the replay that follows is absorbed up to
+        # what each (prefix, value) already counts, and only the
+        # excess is recorded as new local selections
+        baseline: dict[tuple[str, str], int] = {}
+        for (_, prefix, value), (count, _) in self._counters.items():
+            baseline[(prefix, value)] = baseline.get((prefix, value), 0) + count
+        self._baseline = baseline
+
+    # ------------------------------------------------------------
+    # Delta exchange
+    # ------------------------------------------------------------
+
+    def export(self, since: Mapping[str, int] | None = None) -> list[DeltaRecord]:
+        """
+        Components changed after version vector `since`.
+
+        Returns:
+            DeltaRecords sorted by (replica, prefix, value); pass
+            since=None (or {}) for the full state.
+        """
+        if since:
+            keys = sorted(
+                key
+                for replica, updates in self._updates.items()
+                for seq, key in updates[bisect.bisect_left(updates, (since.get(replica, 0) + 1,)):]
+                if self._counters[key][1] == seq
+            )
+        else:
+            if self._unsorted:
+                # Appending a sorted run lets sort() merge in linear time
+                self._order.extend(sorted(self._unsorted))
+                self._order.sort()
+                self._unsorted.clear()
+            keys = self._order
+
+        counters = self._counters
+        return [DeltaRecord(*key, *counters[key]) for key in keys]
+
+    def apply(self, records: Iterable[DeltaRecord]) -> int:
+        """
+        Merge remote components into this state and its History.
+
+        Returns:
+            Number of selections added to the History.
+        """
+        history = self._history
+        added = 0
+
+        self._applying = True
+        try:
+            for r in records:
+                current, current_seq = self._counters.get(r.key, (0, 0))
+
+                if r.count > current:
+                    if history is not None:
+                        history.record_bulk(r.prefix, r.value, r.count - current)
+                    added += r.count - current
+
+                self._update(r.key, max(current, r.count), max(current_seq, r.seq))
+
+                if r.seq > self._clock.get(r.replica, 0):
+                    self._clock[r.replica] = r.seq
+        finally:
+            self._applying = False
+
+        return added
+
+
+    def _update(self, key: _Key, count: int, seq: int) -> None:
+        previous = self._counters.get(key)
+        self._counters[key] = (count, seq)
+
+        if previous is None:
+            self._unsorted.add(key)
+            self._components[key[0]] = self._components.get(key[0], 0) + 1
+        elif previous[1] == seq:
+            return
+
+        updates = self._updates.setdefault(key[0], [])
+        if updates and (seq, key) < updates[-1]:
+            bisect.insort(updates, (seq, key))
+        else:
+            updates.append((seq, key))
+
+        if len(updates) > 2 * self._components[key[0]] + 64:
+            updates[:] = [(s, k) for s, k in updates if self._counters[k][1] == s]
+
+
+def merge_deltas(*streams: Iterable[DeltaRecord]) -> Iterator[DeltaRecord]:
+    """
+    Merge key-sorted delta streams into one key-sorted stream.
+
+    Components present in several streams are combined by maximum,
+    so memory use is O(1) regardless of input size.
+
+    Raises:
+        ValueError: if an input stream is not sorted by key.
+    """
+    merged = heapq.merge(*(_checked(s) for s in streams), key=lambda r: r.key)
+
+    pending: DeltaRecord | None = None
+    for r in merged:
+        if pending is None:
+            pending = r
+        elif r.key == pending.key:
+            pending = DeltaRecord(
+                r.replica,
+                r.prefix,
+                r.value,
+                max(r.count, pending.count),
+                max(r.seq, pending.seq),
+            )
+        else:
+            yield pending
+            pending = r
+
+    if pending is not None:
+        yield pending
+
+
+def _checked(records: Iterable[DeltaRecord]) -> Iterator[DeltaRecord]:
+    previous: _Key | None = None
+    for r in records:
+        if previous is not None and r.key < previous:
+            raise ValueError("delta stream is not sorted by (replica, prefix, value)")
+        previous = r.key
+        yield r
@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from typing import TypedDict
 
 from aac.domain.history import History
+from aac.domain.keys import KeyNormalizer, identity
 from aac.domain.types import (
     CompletionContext,
     Predictor,
@@ -48,6 +49,7 @@ class AutocompleteEngine:
     - Explanation final scores must reconcile with ranking scores
     - Projection to Suggestion happens only at API boundaries
     - History has a single source of truth
+    - History is recorded and queried under the same normalized key
     """
 
     def __init__(
@@ -55,7 +57,11 @@ class AutocompleteEngine:
         predictors: Sequence[Predictor | WeightedPredictor],
         ranker: Ranker | Sequence[Ranker] | None = None,
         history: History | None = None,
+        key: KeyNormalizer | None = None,
     ) -> None:
+        # History key normalization (see aac.domain.keys)
+        self._key: KeyNormalizer = key or identity
+
         # Normalize predictors to WeightedPredictor
         self._predictors: list[WeightedPredictor] = []
         for p in predictors:
@@ -144,7 +150,7 @@ class AutocompleteEngine:
         original_ids = {id(s) for s in ranked}
 
         for ranker in self._rankers:
-            ranked = ranker.rank(ctx.text, ranked)
+            ranked = ranker.rank(self._key(ctx.text), ranked)
 
             assert {id(s) for s in ranked} == original_ids, (
                 f"Ranker {ranker.__class__.__name__} modified suggestion set"
@@ -223,7 +229,7 @@ class AutocompleteEngine:
         aggregated: dict[str, RankingExplanation] = {}
 
         for ranker in self._rankers:
-            for exp in ranker.explain(ctx.text, ranked):
+            for exp in ranker.explain(self._key(ctx.text), ranked):
                 if exp.value not in aggregated:
                     aggregated[exp.value] = exp
                 else:
@@ -260,9 +266,12 @@ class AutocompleteEngine:
         Predictors may optionally implement a `record(...)` hook.
         This is intentionally duck-typed to avoid forcing
         learning behavior on all predictors.
+
+        The selection is recorded under the engine's normalized key,
+        the same key rankers are queried with.
         """
         ctx = CompletionContext(text)
-        self._history.record(ctx.text, value)
+        self._history.record(self._key(ctx.text), value)
 
         for weighted in self._predictors:
             record = getattr(weighted.predictor, "record", None)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+Distance = Callable[[str, str], int]
+
+
+class _BKNode:
+    __slots__ = ("word", "order", "alive", "children")
+
+    def __init__(self, word: str, order: int) -> None:
+        self.word = word
+        self.order = order
+        self.alive = True
+        self.children: dict[int, _BKNode] = {}
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over a word set under a metric distance.
+
+    Every child edge is labelled with the child's distance to its
+    parent. By the triangle inequality, a query within `max_distance`
+    of some word can only be found under edges labelled
+    d(query, node) +- max_distance, so search() skips whole subtrees.
+
+    Contract:
+        search() returns every live word within `max_distance`, in
+        insertion order, exactly as a linear scan would.
+
+    Design notes:
+        - remove() only marks the node dead: its edge labels still
+          route searches to the words below it. Re-adding the word
+          revives the node (moving it to the end of insertion order)
+        - search() looks up the child edges in [d - k, d + k] by label
+          instead of iterating a child dict, so a child added by a
+          concurrent add() is simply seen or not seen
+        - `distance` must be a metric (e.g. levenshtein); evaluations
+          can be counted by wrapping it
+    """
+
+    def __init__(self, words: Iterable[str] = (), *, distance: Distance) -> None:
+        self._distance = distance
+        self._root: _BKNode | None = None
+        self._size = 0
+        self._next = 0
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> bool:
+        """
+        Add `word`.
+
+        Returns:
+            True if the word was not present before.
+        """
+        order = self._next
+        self._next += 1
+
+        node = self._root
+        if node is None:
+            self._root = _BKNode(word, order)
+            self._size += 1
+            return True
+
+        while True:
+            d = self._distance(word, node.word)
+            if d == 0:
+                if node.alive:
+                    return False
+                node.order = order
+                node.alive = True
+                self._size += 1
+                return True
+
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = _BKNode(word, order)
+                self._size += 1
+                return True
+            node = child
+
+    def remove(self, word: str) -> bool:
+        """
+        Remove `word`.
+
+        Returns:
+            True if the word was present.
+        """
+        node = self._root
+        while node is not None:
+            d = self._distance(word, node.word)
+            if d == 0:
+                if not node.alive:
+                    return False
+                node.alive = False
+                self._size -= 1
+                return True
+            node = node.children.get(d)
+        return False
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Words within `max_distance` of `query`.
+
+        Returns:
+            (word, distance) pairs in insertion order.
+        """
+        if self._root is None or max_distance < 0:
+            return []
+
+        distance = self._distance
+        found: list[tuple[int, str, int]] = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            d = distance(query, node.word)
+
+            if d <= max_distance and node.alive:
+                found.append((node.order, node.word, d))
+
+            children = node.children
+            for label in range(max(1, d - max_distance), d + max_distance + 1):
+                child = children.get(label)
+                if child is not None:
+                    stack.append(child)
+
+        found.sort()
+        return [(word, d) for _, word, d in found]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# Build-time state signature: (terminal, ((char, child id), ...))
+_Signature = tuple[bool, tuple[tuple[str, int], ...]]
+
+
+class _Unfinished:
+    """Build-time node on the path of the most recently added word."""
+
+    __slots__ = ("terminal", "edges")
+
+    def __init__(self) -> None:
+        self.terminal = False
+        self.edges: list[tuple[str, int]] = []
+
+
+class CompactTrie:
+    """
+    Immutable, memory-compact prefix index over a fixed vocabulary.
+
+    Structure:
+        - Minimal acyclic automaton (DAWG): shared prefixes *and*
+          shared suffixes are stored once
+        - Path compression: chains of single-child, non-terminal
+          states collapse into one radix edge with a string label
+        - Flat tables instead of node objects:
+            node edge offsets   -> array('I')  (CSR, nodes + 1)
+            node terminal flags -> bytearray
+            edge first char     -> array('I')  (sorted per node)
+            edge label offset   -> array('I')  into one label string
+            edge label length   -> array('I')
+            edge target         -> array('I')
+
+    Contract:
+        find_prefix() matches Trie.find_prefix(): up to `limit` words
+        starting with the prefix, in lexicographic order.
+
+    Design notes:
+        - Built in one pass over the sorted vocabulary with the
+          incremental (Daciuk et al.) minimization algorithm; only
+          the current word's path is held as Python objects
+        - Words are not stored; they are reconstructed from edge
+          labels during traversal
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        unique = sorted(set(words))
+        states, root = _build(unique)
+
+        self._size = len(unique)
+        self._freeze(states, root)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------
+
+    def _freeze(self, states: list[_Signature], root: int) -> None:
+        def compress(char: str, target: int) -> tuple[str, int]:
+            label = [char]
+            terminal, edges = states[target]
+            while not terminal and len(edges) == 1:
+                char, target = edges[0]
+                label.append(char)
+                terminal, edges = states[target]
+            return "".join(label), target
+
+        ids: dict[int, int] = {root: 0}
+        order = [root]
+
+        node_edges = array("I", [0])
+        terminal = bytearray()
+        edge_char = array("I")
+        label_start = array("I")
+        label_len = array("I")
+        edge_target = array("I")
+
+        labels: list[str] = []
+        label_offset = 0
+
+        # Breadth-first over reachable (compressed) states
+        i = 0
+        while i < len(order):
+            state_terminal, edges = states[order[i]]
+            terminal.append(1 if state_terminal else 0)
+
+            for char, child in edges:
+                label, target = compress(char, child)
+
+                if target not in ids:
+                    ids[target] = len(order)
+                    order.append(target)
+
+                edge_char.append(ord(char))
+                label_start.append(label_offset)
+                label_len.append(len(label))
+                edge_target.append(ids[target])
+
+                labels.append(label)
+                label_offset += len(label)
+
+            node_edges.append(len(edge_target))
+            i += 1
+
+        self._node_edges = node_edges
+        self._terminal = terminal
+        self._edge_char = edge_char
+        self._label_start = label_start
+        self._label_len = label_len
+        self._edge_target = edge_target
+        self._labels = "".join(labels)
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def _label(self, edge: int) -> str:
+        start = self._label_start[edge]
+        return self._labels[start:start + self._label_len[edge]]
+
+    def _edge(self, node: int, char: str) -> int | None:
+        lo = self._node_edges[node]
+        hi = self._node_edges[node + 1]
+        code = ord(char)
+
+        i = bisect_left(self._edge_char, code, lo, hi)
+        if i < hi and self._edge_char[i] == code:
+            return i
+        return None
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+
+        located = self._locate(word)
+        return (
+            located is not None
+            and located[1] == word
+            and bool(self._terminal[located[0]])
+        )
+
+    def _locate(self, prefix: str) -> tuple[int, str] | None:
+        """
+        Walk `prefix` from the root.
+
+        Returns:
+            (node, text) where text is the prefix extended to the end
+            of the edge it stops in, or None if nothing matches.
+        """
+        node = 0
+        pos = 0
+        text = ""
+
+        while pos < len(prefix):
+            edge = self._edge(node, prefix[pos])
+            if edge is None:
+                return None
+
+            label = self._label(edge)
+            rest = prefix[pos:]
+
+            if rest.startswith(label):
+                pos += len(label)
+            elif label.startswith(rest):
+                pos = len(prefix)
+            else:
+                return None
+
+            text += label
+            node = self._edge_target[edge]
+
+        return node, text
+
+    def find_prefix(self, prefix: str, *, limit: int) -> list[str]:
+        located = self._locate(prefix)
+        if located is None or limit <= 0:
+            return []
+
+        node, text = located
+        results: list[str] = []
+
+        # Iterative DFS; edges are pushed in reverse to pop in order
+        stack = [(node, text)]
+        while stack:
+            node, text = stack.pop()
+
+            if self._terminal[node]:
+                results.append(text)
+                if len(results) >= limit:
+                    break
+
+            lo = self._node_edges[node]
+            hi = self._node_edges[node + 1]
+            for edge in range(hi - 1, lo - 1, -1):
+                stack.append((self._edge_target[edge], text + self._label(edge)))
+
+        return results
+
+
+def _build(words: list[str]) -> tuple[list[_Signature], int]:
+    """
+    Incrementally build a minimal acyclic automaton from sorted words.
+
+    Returns:
+        (states, root id) where states[i] is (terminal, edges).
+    """
+    states: list[_Signature] = []
+    register: dict[_Signature, int] = {}
+
+    def freeze(node: _Unfinished) -> int:
+        signature = (node.terminal, tuple(node.edges))
+        sid = register.get(signature)
+        if sid is None:
+            sid = register[signature] = len(states)
+            states.append(signature)
+        return sid
+
+    path = [_Unfinished()]
+    chars: list[str] = []
+    previous = ""
+
+    def minimize(depth: int) -> None:
+        while len(path) > depth + 1:
+            child = path.pop()
+            char = chars.pop()
+            path[-1].edges.append((char, freeze(child)))
+
+    for word in words:
+        common = 0
+        limit = min(len(word), len(previous))
+        while common < limit and word[common] == previous[common]:
+            common += 1
+
+        minimize(common)
+
+        for char in word[common:]:
+            path.append(_Unfinished())
+            chars.append(char)
+
+        path[-1].terminal = True
+        previous = word
+
+    minimize(0)
+    return states, freeze(path[0])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from typing import Protocol
 
 from aac.domain.types import (
     CompletionContext,
@@ -10,39 +11,227 @@ from aac.domain.types import (
     Suggestion,
     ensure_context,
 )
+from aac.predictors.bk_tree import BKTree
+from aac.predictors.symspell import SymSpellIndex
+from aac.predictors.trie import Trie
 
 
 def levenshtein(a: str, b: str) -> int:
     """
-    Compute Levenshtein edit distance using a space-optimized DP.
+    Compute Levenshtein edit distance.
 
     Cost model:
     - insertion: 1
     - deletion: 1
     - substitution: 1
     """
+    return _bit_parallel(a, b, None)
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance, computed only as far as `max_distance`.
+
+    Returns:
+        The exact distance if it is at most `max_distance`, otherwise
+        max_distance + 1 (as soon as that is certain).
+    """
+    if max_distance < 0:
+        return 0 if a == b else max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    return _bit_parallel(a, b, max_distance)
+
+
+def _bit_parallel(a: str, b: str, cutoff: int | None) -> int:
+    """
+    Myers / Hyyro bit-vector edit distance.
+
+    The shorter string is the pattern: bit i of each vector describes
+    row i of the current DP column, so a whole column is updated with
+    a handful of integer operations (Python ints have no width limit).
+    `score` tracks the last row; since every remaining column moves it
+    by at most 1, the result is known to exceed `cutoff` once
+    score - remaining > cutoff.
+    """
     if a == b:
         return 0
+    if len(a) > len(b):
+        a, b = b, a
     if not a:
-        return len(b)
-    if not b:
-        return len(a)
-
-    prev = list(range(len(b) + 1))
-    for i, ca in enumerate(a, start=1):
-        curr = [i]
-        for j, cb in enumerate(b, start=1):
-            cost = 0 if ca == cb else 1
-            curr.append(
-                min(
-                    prev[j] + 1,        # deletion
-                    curr[j - 1] + 1,    # insertion
-                    prev[j - 1] + cost  # substitution
-                )
-            )
-        prev = curr
+        return len(b) if cutoff is None or len(b) <= cutoff else cutoff + 1
+
+    peq: dict[str, int] = {}
+    for i, ch in enumerate(a):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+
+    pv = mask   # vertical +1 deltas
+    mv = 0      # vertical -1 deltas
+    score = len(a)
+    remaining = len(b)
+
+    for ch in b:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+
+        remaining -= 1
+        if cutoff is not None and score - remaining > cutoff:
+            return cutoff + 1
+
+        # Row 0 grows by one per column (global alignment)
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
 
-    return prev[-1]
+    return score
+
+
+class CandidateIndex(Protocol):
+    """
+    Vocabulary index answering "which words are within distance k".
+
+    Whole-word indexes (build_index) must return exactly the
+    (word, levenshtein distance) pairs within `max_distance`, in
+    insertion order.
+    """
+
+    def add(self, word: str) -> bool: ...
+
+    def remove(self, word: str) -> bool: ...
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]: ...
+
+
+class LinearIndex:
+    """
+    Reference index: compares the query against every word.
+
+    The vocabulary is an insertion-ordered set (dict keys): updates
+    are O(1), and a word given twice is indexed once, like every other
+    CandidateIndex. search() iterates a tuple of the keys taken when
+    it starts.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._words = dict.fromkeys(words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def add(self, word: str) -> bool:
+        if word in self._words:
+            return False
+        self._words[word] = None
+        return True
+
+    def remove(self, word: str) -> bool:
+        if word not in self._words:
+            return False
+        del self._words[word]
+        return True
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        found: list[tuple[str, int]] = []
+        for word in tuple(self._words):
+            distance = bounded_levenshtein(query, word, max_distance)
+            if distance <= max_distance:
+                found.append((word, distance))
+        return found
+
+
+class FuzzyPrefixIndex:
+    """
+    Completion index: words with a prefix within k edits of the query.
+
+    Walks a Trie carrying one DP row per node (see Trie.iter_fuzzy),
+    so "helo" also reaches "helium". search() returns
+    (word, prefix distance) pairs ordered by distance, then word.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._trie = Trie(words)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def add(self, word: str) -> bool:
+        return self._trie.insert(word)
+
+    def remove(self, word: str) -> bool:
+        return self._trie.remove(word)
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        # Stable sort keeps lexicographic order within a distance
+        return sorted(self._trie.iter_fuzzy(query, max_distance), key=lambda m: m[1])
+
+
+def _linear(words: Iterable[str], max_distance: int) -> CandidateIndex:
+    return LinearIndex(words)
+
+
+def _bk_tree(words: Iterable[str], max_distance: int) -> CandidateIndex:
+    return BKTree(words, distance=levenshtein)
+
+
+def _symspell(words: Iterable[str], max_distance: int) -> CandidateIndex:
+    return SymSpellIndex(words, distance=levenshtein, max_distance=max_distance)
+
+
+def _numpy(words: Iterable[str], max_distance: int) -> CandidateIndex:
+    try:
+        from aac.predictors.numpy_index import NumpyIndex
+    except ImportError:
+        # Optional dependency: same results, pure-Python speed
+        return LinearIndex(words)
+    return NumpyIndex(words)
+
+
+_INDEXES: dict[str, Callable[[Iterable[str], int], CandidateIndex]] = {
+    "linear": _linear,
+    "bktree": _bk_tree,
+    "symspell": _symspell,
+    "numpy": _numpy,
+}
+
+
+def available_indexes() -> list[str]:
+    """Names accepted by EditDistancePredictor(index=...)."""
+    return [*_INDEXES, "symspell=<prefix_length>"]
+
+
+def build_index(spec: str, words: Iterable[str], max_distance: int) -> CandidateIndex:
+    """
+    Build a candidate index from its name.
+
+    Example:
+        build_index("symspell=5", words, max_distance=2)
+    """
+    if spec.startswith("symspell="):
+        return SymSpellIndex(
+            words,
+            distance=levenshtein,
+            max_distance=max_distance,
+            prefix_length=int(spec.removeprefix("symspell=")),
+        )
+
+    factory = _INDEXES.get(spec)
+    if factory is None:
+        raise ValueError(f"Unknown index {spec!r}; expected one of {available_indexes()}")
+
+    return factory(words, max_distance)
 
 
 class EditDistancePredictor(Predictor):
@@ -56,6 +245,27 @@ class EditDistancePredictor(Predictor):
 
     Emits a weak signal that should be combined
     with stronger predictors and rankers.
+
+    Indexes (identical results, in vocabulary order):
+        - "linear": compare against every word (default)
+        - "bktree": BK-tree pruned by the triangle inequality; far
+          fewer distance evaluations on large vocabularies
+        - "symspell" / "symspell=<prefix_length>": symmetric-delete
+          index; candidates come from hash lookups, so cost barely
+          grows with vocabulary size (best for max_distance <= 2)
+        - "numpy": vectorized scan over an encoded vocabulary matrix;
+          falls back to "linear" when NumPy is not installed
+
+    Modes:
+        - "word": the typed prefix is compared against whole words
+        - "prefix": fuzzy completion; a word matches when one of its
+          prefixes is within `max_distance` edits of the typed prefix
+          (ordered by distance, then word; `index` does not apply)
+
+    `max_results` caps the number of suggestions (closest first in
+    prefix mode). Vocabulary updates (add_word / remove_word) go to
+    the index. Every index stores the vocabulary as a set: a word
+    listed twice in `vocabulary` yields one suggestion, not two.
     """
 
     name = "edit_distance"
@@ -66,10 +276,42 @@ class EditDistancePredictor(Predictor):
         *,
         max_distance: int = 2,
         base_score: float = 1.0,
+        index: str = "linear",
+        mode: str = "word",
+        max_results: int | None = None,
     ) -> None:
-        self._vocabulary = tuple(vocabulary)
+        self._index: CandidateIndex
+
+        if mode == "word":
+            self._index = build_index(index, vocabulary, max_distance)
+        elif mode == "prefix":
+            if index != "linear":
+                raise ValueError("index only applies to mode='word'")
+            self._index = FuzzyPrefixIndex(vocabulary)
+        else:
+            raise ValueError(f"Unknown mode {mode!r}; expected 'word' or 'prefix'")
+
         self._max_distance = max_distance
         self._base_score = base_score
+        self._max_results = max_results
+
+    def add_word(self, word: str) -> bool:
+        """
+        Add `word` to the vocabulary.
+
+        Returns:
+            True if the word was not present before.
+        """
+        return self._index.add(word)
+
+    def remove_word(self, word: str) -> bool:
+        """
+        Remove `word` from the vocabulary.
+
+        Returns:
+            True if the word was present.
+        """
+        return self._index.remove(word)
 
     def predict(self, ctx: CompletionContext | str) -> list[ScoredSuggestion]:
         ctx = ensure_context(ctx)
@@ -80,12 +322,9 @@ class EditDistancePredictor(Predictor):
 
         results: list[ScoredSuggestion] = []
 
-        for word in self._vocabulary:
-            distance = levenshtein(prefix, word)
-
-            if distance > self._max_distance:
-                continue
+        matches = self._index.search(prefix, self._max_distance)
 
+        for word, distance in matches[: self._max_results]:
             # Penalize by distance
             score = self._base_score / (1 + distance)
 
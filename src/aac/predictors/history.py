@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from aac.domain.history import History
+from aac.domain.keys import KeyNormalizer
 from aac.domain.types import (
     CompletionContext,
     Predictor,
@@ -18,16 +19,26 @@ class HistoryPredictor(Predictor):
     Emits candidates previously selected by the user.
     Score reflects raw usage frequency.
     Confidence reflects dominance among historical matches.
+
+    With a `key` normalizer, history is recorded and queried under
+    key(ctx.text); otherwise it is queried by ctx.prefix() and
+    recorded under ctx.text (legacy behavior).
     """
 
     name = "history"
 
-    def __init__(self, history: History) -> None:
+    def __init__(
+        self,
+        history: History,
+        *,
+        key: KeyNormalizer | None = None,
+    ) -> None:
         self._history = history
+        self._key = key
 
     def predict(self, ctx: CompletionContext | str) -> list[ScoredSuggestion]:
         ctx = ensure_context(ctx)
-        prefix = ctx.prefix()
+        prefix = ctx.prefix() if self._key is None else self._key(ctx.text)
 
         if not prefix:
             return []
@@ -63,4 +74,5 @@ class HistoryPredictor(Predictor):
         Record user selection feedback for future recall.
         """
         ctx = ensure_context(ctx)
-        self._history.record(ctx.text, value)
+        key = ctx.text if self._key is None else self._key(ctx.text)
+        self._history.record(key, value)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+# Rows reserved on the first allocation
+_MIN_CAPACITY = 16
+
+
+def _encode(word: str) -> Any:
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32)
+
+
+class NumpyIndex:
+    """
+    Vectorized linear scan over the whole vocabulary (requires NumPy).
+
+    The vocabulary is encoded once into a zero-padded uint32 code-point
+    matrix plus a lengths vector. A query runs the Levenshtein DP one
+    query character at a time for all candidate words at once, so the
+    Python-level work is O(len(query)) array operations.
+
+    Contract:
+        search() returns exactly what LinearIndex.search() returns.
+
+    Design notes:
+        - Words whose length differs from the query by more than
+          `max_distance` are filtered out before the DP
+        - The insertion dependency within a row is resolved with a
+          running minimum of (row[j] - j), keeping each row vectorized
+        - Words whose row minimum exceeds `max_distance` are dropped
+          after every row; the scan stops once none are left
+        - add() fills a word's row before appending it to `_words`,
+          and search() reads the word count before the matrices, so
+          it only scans rows that were complete in the (possibly
+          regrown) arrays it picked up; remove() clears an alive flag
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        unique = list(dict.fromkeys(words))
+        capacity = max(_MIN_CAPACITY, len(unique))
+        width = max((len(w) for w in unique), default=0)
+
+        codes = np.zeros((capacity, width), dtype=np.uint32)
+        lengths = np.zeros(capacity, dtype=np.int32)
+        alive = np.zeros(capacity, dtype=bool)
+
+        for wid, word in enumerate(unique):
+            codes[wid, : len(word)] = _encode(word)
+            lengths[wid] = len(word)
+            alive[wid] = True
+
+        self._state: tuple[Any, Any, Any] = (codes, lengths, alive)
+        self._words: list[str | None] = list(unique)
+        self._ids = {word: wid for wid, word in enumerate(unique)}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, word: str) -> bool:
+        if word in self._ids:
+            return False
+
+        wid = len(self._words)
+        codes, lengths, alive = self._state
+
+        if wid >= codes.shape[0] or len(word) > codes.shape[1]:
+            codes, lengths, alive = self._grow(wid + 1, len(word))
+
+        codes[wid, : len(word)] = _encode(word)
+        lengths[wid] = len(word)
+        alive[wid] = True
+
+        self._words.append(word)
+        self._ids[word] = wid
+        return True
+
+    def remove(self, word: str) -> bool:
+        wid = self._ids.pop(word, None)
+        if wid is None:
+            return False
+
+        self._state[2][wid] = False
+        self._words[wid] = None
+        return True
+
+    def _grow(self, rows: int, width: int) -> tuple[Any, Any, Any]:
+        codes, lengths, alive = self._state
+        old_rows, old_width = codes.shape
+
+        # Only a full matrix doubles; wider words just widen it
+        capacity = old_rows if rows <= old_rows else max(rows, 2 * old_rows, _MIN_CAPACITY)
+        width = max(width, old_width)
+
+        grown_codes = np.zeros((capacity, width), dtype=np.uint32)
+        grown_codes[:old_rows, :old_width] = codes
+        grown_lengths = np.zeros(capacity, dtype=np.int32)
+        grown_lengths[:old_rows] = lengths
+        grown_alive = np.zeros(capacity, dtype=bool)
+        grown_alive[:old_rows] = alive
+
+        self._state = (grown_codes, grown_lengths, grown_alive)
+        return self._state
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        if max_distance < 0:
+            return []
+
+        # Word count first: every published row exists in any later state
+        words = self._words
+        count = len(words)
+        codes, lengths, alive = self._state
+
+        m = len(query)
+        ids = np.flatnonzero(
+            alive[:count] & (np.abs(lengths[:count] - m) <= max_distance)
+        )
+        if ids.size == 0:
+            return []
+
+        width = min(codes.shape[1], m + max_distance)
+        candidates = codes[ids, :width]
+        candidate_lengths = lengths[ids]
+
+        cols = np.arange(width + 1, dtype=np.int32)
+        row = np.tile(cols, (ids.size, 1))
+
+        for i, code in enumerate(_encode(query), start=1):
+            step = np.empty_like(row)
+            step[:, 0] = i
+            np.minimum(
+                row[:, :-1] + (candidates != code),  # substitution
+                row[:, 1:] + 1,                      # deletion
+                out=step[:, 1:],
+            )
+            # Insertion: row[j] = min over t <= j of step[t] + (j - t)
+            row = np.minimum.accumulate(step - cols, axis=1) + cols
+
+            # Row minima never decrease, so these words are out of reach
+            keep = row.min(axis=1) <= max_distance
+            if not keep.all():
+                ids = ids[keep]
+                if ids.size == 0:
+                    return []
+                row = row[keep]
+                candidates = candidates[keep]
+                candidate_lengths = candidate_lengths[keep]
+
+        distances = row[np.arange(ids.size), candidate_lengths]
+        hits = distances <= max_distance
+
+        found: list[tuple[str, int]] = []
+        for wid, distance in zip(ids[hits].tolist(), distances[hits].tolist(), strict=True):
+            word = words[wid]
+            if word is not None:
+                found.append((word, int(distance)))
+        return found
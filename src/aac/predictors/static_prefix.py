@@ -14,13 +14,41 @@ from aac.domain.types import (
 
 class StaticPrefixPredictor(Predictor):
     """
-    Deterministic prefix-based predictor over a fixed vocabulary.
+    Deterministic prefix-based predictor over a vocabulary.
+
+    The vocabulary is an insertion-ordered set: add_word() and
+    remove_word() are O(1), and predict() walks a tuple copy of the
+    words, so an update made meanwhile applies to the next call.
     """
 
     name = "static_prefix"
 
     def __init__(self, vocabulary: Iterable[str]) -> None:
-        self._vocabulary = tuple(dict.fromkeys(vocabulary))
+        self._vocabulary = dict.fromkeys(vocabulary)
+
+    def add_word(self, word: str) -> bool:
+        """
+        Add `word` to the vocabulary.
+
+        Returns:
+            True if the word was not present before.
+        """
+        if word in self._vocabulary:
+            return False
+        self._vocabulary[word] = None
+        return True
+
+    def remove_word(self, word: str) -> bool:
+        """
+        Remove `word` from the vocabulary.
+
+        Returns:
+            True if the word was present.
+        """
+        if word not in self._vocabulary:
+            return False
+        del self._vocabulary[word]
+        return True
 
     def predict(self, ctx: CompletionContext | str) -> list[ScoredSuggestion]:
         ctx = ensure_context(ctx)
@@ -31,7 +59,7 @@ class StaticPrefixPredictor(Predictor):
 
         results: list[ScoredSuggestion] = []
 
-        for word in self._vocabulary:
+        for word in tuple(self._vocabulary):
             if word == prefix or not word.startswith(prefix):
                 continue
 
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from aac.predictors.bk_tree import Distance
+
+
+def deletes(word: str, max_deletes: int) -> set[str]:
+    """
+    All strings obtained by deleting up to `max_deletes` characters.
+    """
+    found = {word}
+    frontier = {word}
+
+    for _ in range(max_deletes):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found |= frontier
+
+    return found
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete candidate index (SymSpell).
+
+    Every word's prefix of `prefix_length` characters is expanded into
+    its deletion variants (up to `max_distance` deletions), each mapped
+    to the ids of the words producing it. Two strings within edit
+    distance k share a variant obtainable with at most k deletions from
+    each, so a query only looks up its own variants and verifies the
+    hits with the full distance.
+
+    Contract:
+        search() returns every live word within `max_distance`, in
+        insertion order, exactly as a linear scan would. Queries with a
+        larger distance than the index was built for fall back to a
+        linear scan.
+
+    Memory:
+        Each word contributes at most sum(C(prefix_length, d)) for
+        d <= max_distance variants regardless of its length, e.g. 29
+        for the defaults (prefix_length=7, max_distance=2). Truncation
+        only adds candidates to verify; it never loses matches.
+
+    Design notes:
+        - Each variant maps to a tuple of word ids that add() rebinds
+          to a longer copy, so a search verifies whichever complete
+          tuple it looked up
+        - Removed words leave a None slot so ids stay stable;
+          re-adding a word moves it to the end of insertion order
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str] = (),
+        *,
+        distance: Distance,
+        max_distance: int = 2,
+        prefix_length: int = 7,
+    ) -> None:
+        if max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must exceed max_distance")
+
+        self._distance = distance
+        self._max_distance = max_distance
+        self._prefix_length = prefix_length
+
+        self._words: list[str | None] = []
+        self._ids: dict[str, int] = {}
+        self._variants: dict[str, tuple[int, ...]] = {}
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def max_distance(self) -> int:
+        return self._max_distance
+
+    @property
+    def prefix_length(self) -> int:
+        return self._prefix_length
+
+    def add(self, word: str) -> bool:
+        """
+        Add `word`.
+
+        Returns:
+            True if the word was not present before.
+        """
+        if word in self._ids:
+            return False
+
+        wid = len(self._words)
+        self._words.append(word)
+
+        variants = self._variants
+        for variant in deletes(word[: self._prefix_length], self._max_distance):
+            variants[variant] = (*variants.get(variant, ()), wid)
+
+        self._ids[word] = wid
+        return True
+
+    def remove(self, word: str) -> bool:
+        """
+        Remove `word`.
+
+        Returns:
+            True if the word was present.
+        """
+        wid = self._ids.pop(word, None)
+        if wid is None:
+            return False
+
+        self._words[wid] = None
+
+        variants = self._variants
+        for variant in deletes(word[: self._prefix_length], self._max_distance):
+            remaining = tuple(i for i in variants[variant] if i != wid)
+            if remaining:
+                variants[variant] = remaining
+            else:
+                del variants[variant]
+
+        return True
+
+    def search(self, query: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Words within `max_distance` of `query`.
+
+        Returns:
+            (word, distance) pairs in insertion order.
+        """
+        if max_distance < 0:
+            return []
+
+        words = self._words
+        if max_distance > self._max_distance:
+            candidates: Iterable[int] = range(len(words))
+        else:
+            variants = self._variants
+            ids: set[int] = set()
+            for variant in deletes(query[: self._prefix_length], max_distance):
+                ids.update(variants.get(variant, ()))
+            candidates = sorted(ids)
+
+        distance = self._distance
+        found: list[tuple[str, int]] = []
+
+        for wid in candidates:
+            word = words[wid]
+            if word is None or abs(len(word) - len(query)) > max_distance:
+                continue
+
+            d = distance(query, word)
+            if d <= max_distance:
+                found.append((word, d))
+
+        return found
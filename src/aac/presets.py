@@ -4,6 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from aac.domain.history import History
+from aac.domain.keys import last_token
 from aac.domain.types import WeightedPredictor
 from aac.engine.engine import AutocompleteEngine
 from aac.predictors.edit_distance import EditDistancePredictor
@@ -48,7 +49,7 @@ def _default_engine(history: History | None) -> AutocompleteEngine:
             weight=1.0,
         ),
         WeightedPredictor(
-            predictor=HistoryPredictor(history),
+            predictor=HistoryPredictor(history, key=last_token),
             weight=1.5,
         ),
     ]
@@ -57,6 +58,7 @@ def _default_engine(history: History | None) -> AutocompleteEngine:
         predictors=predictors,
         ranker=[ScoreRanker()],
         history=history,
+        key=last_token,
     )
 
 
@@ -77,7 +79,7 @@ def _recency_boosted_engine(history: History | None) -> AutocompleteEngine:
             weight=1.0,
         ),
         WeightedPredictor(
-            predictor=HistoryPredictor(history),
+            predictor=HistoryPredictor(history, key=last_token),
             weight=1.0,
         ),
     ]
@@ -95,6 +97,7 @@ def _recency_boosted_engine(history: History | None) -> AutocompleteEngine:
         predictors=predictors,
         ranker=rankers,
         history=history,
+        key=last_token,
     )
 
 
@@ -132,13 +135,14 @@ def _robust_engine(history: History | None) -> AutocompleteEngine:
             weight=1.0,
         ),
         WeightedPredictor(
-            predictor=HistoryPredictor(history),
+            predictor=HistoryPredictor(history, key=last_token),
             weight=1.2,
         ),
         WeightedPredictor(
             predictor=EditDistancePredictor(
                 vocabulary=vocabulary,
                 max_distance=2,
+                index="symspell",
             ),
             weight=0.4,  # intentionally weak fallback signal
         ),
@@ -157,6 +161,7 @@ def _robust_engine(history: History | None) -> AutocompleteEngine:
         predictors=predictors,
         ranker=rankers,
         history=history,
+        key=last_token,
     )
 
 
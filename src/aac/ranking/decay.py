@@ -42,6 +42,183 @@ def utcnow() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+# ---------------------------------------------------------------------
+# Decayed counter store
+# ---------------------------------------------------------------------
+
+class DecayedCounts:
+    """
+    Incrementally maintained recency-decayed counts per (prefix, value).
+
+    Each pair keeps one accumulator expressed against a reference epoch
+    (the newest event time seen for that pair):
+
+        acc = sum(0.5 ** ((ref - t_i) / half_life))
+
+    Reading at `now >= ref` rescales lazily:
+
+        decayed = acc * 0.5 ** ((now - ref) / half_life)
+
+    which is algebraically identical to summing DecayFunction.weight()
+    over every event. Writes renormalize the accumulator to the newest
+    event, so values stay bounded by the event count and never overflow.
+
+    Hydration:
+        Without `history`, every observed event is accumulated. With
+        `history` (subscribe with replay=False), a prefix is only
+        tracked once it is needed:
+            - a prefix whose first-ever event is observed is tracked
+              live from that event on; whether an event is the first
+              is checked against the history once per prefix
+            - any other prefix is hydrated from the history's buckets
+              and entries on its first at(), under
+              History.prefix_lock(), and tracked live afterwards
+        Cold start and memory are therefore proportional to the
+        prefixes actually read, not to history size.
+
+    Tolerance:
+        Results match the per-event formula to within a relative error
+        of about 1e-9 (float rounding of one multiply-add per event and
+        epoch-second timestamp conversion). Prefixes hydrated from
+        rolled-up buckets weight each bucket at its start time.
+
+    Notes:
+        - Implements the HistoryListener protocol
+        - Reads cost O(values for prefix), independent of history size
+        - Events newer than `now` are clamped to weight 1.0 by
+          DecayFunction; at() returns None in that case so callers can
+          fall back to an exact per-event computation
+        - Accumulators of live-tracked prefixes are fed at record time,
+          so History retention and rollup never change their results
+    """
+
+    def __init__(self, decay: DecayFunction, history: History | None = None) -> None:
+        self._decay = decay
+        self._history = history
+
+        # prefix -> value -> (accumulator, reference epoch seconds)
+        self._acc: dict[str, dict[str, tuple[float, float]]] = {}
+
+        # prefix -> newest event epoch seconds
+        self._latest: dict[str, float] = {}
+
+        # Prefixes with events predating tracking; hydrated when read
+        self._cold: set[str] = set()
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        if timestamp.tzinfo is None:
+            raise ValueError("History timestamps must be timezone-aware")
+
+        values = self._acc.get(prefix)
+        if values is None:
+            if prefix in self._cold:
+                return
+
+            # Decided once per prefix, not per event: on some backends
+            # (e.g. SqliteHistory) reading counts forces a flush
+            history = self._history
+            if history is not None and sum(history.counts_for_prefix(prefix).values()) != count:
+                # Older events exist: hydrate from history when read
+                self._cold.add(prefix)
+                return
+            values = {}
+
+        self._fold(prefix, values, value, timestamp.timestamp(), count)
+
+        # Publish new prefixes only once fully initialized
+        if prefix not in self._acc:
+            self._acc[prefix] = values
+
+    def _fold(
+        self,
+        prefix: str,
+        values: dict[str, tuple[float, float]],
+        value: str,
+        t: float,
+        count: int,
+    ) -> None:
+        # Newest time first: a reader seeing the new slot also sees a
+        # `latest` at least as new, and takes the exact path if needed
+        if t > self._latest.get(prefix, float("-inf")):
+            self._latest[prefix] = t
+
+        half_life = self._decay.half_life_seconds
+
+        # Slots are replaced, never mutated, so concurrent readers
+        # always see a consistent (accumulator, reference) pair
+        slot = values.get(value)
+        if slot is None:
+            values[value] = (float(count), t)
+        elif t >= slot[1]:
+            # Renormalize to the newer event
+            acc = slot[0] * 0.5 ** ((t - slot[1]) / half_life) + count
+            values[value] = (acc, t)
+        else:
+            acc = slot[0] + count * 0.5 ** ((slot[1] - t) / half_life)
+            values[value] = (acc, slot[1])
+
+    def reset(self) -> None:
+        # With a history, the replay that follows only re-tracks
+        # single-event prefixes; the rest hydrate again when read
+        self._acc.clear()
+        self._latest.clear()
+        self._cold.clear()
+
+    def _hydrate(self, prefix: str) -> dict[str, tuple[float, float]] | None:
+        history = self._history
+        if history is None:
+            return None
+
+        with history.prefix_lock(prefix):
+            values = self._acc.get(prefix)
+            if values is not None:
+                return values
+
+            values = {}
+            for b in history.buckets_for_prefix(prefix):
+                self._fold(prefix, values, b.value, b.start.timestamp(), b.count)
+            for e in history.entries_for_prefix(prefix):
+                self._fold(prefix, values, e.value, e.timestamp.timestamp(), 1)
+
+            if not values:
+                # Nothing recorded yet; the first event starts tracking
+                return None
+
+            self._acc[prefix] = values
+            return values
+
+    def at(self, prefix: str, now: datetime) -> dict[str, float] | None:
+        """
+        Decayed counts for a prefix evaluated at `now`.
+
+        Returns:
+            Mapping of value -> decayed count, or None if the prefix
+            has events newer than `now`.
+        """
+        values = self._acc.get(prefix)
+        if values is None:
+            values = self._hydrate(prefix)
+        if not values:
+            return {}
+
+        t_now = now.timestamp()
+        if t_now < self._latest.get(prefix, float("-inf")):
+            return None
+
+        half_life = self._decay.half_life_seconds
+
+        return {
+            value: acc * 0.5 ** ((t_now - ref) / half_life)
+            for value, (acc, ref) in list(values.items())
+        }
+
+
 # ---------------------------------------------------------------------
 # Ranker
 # ---------------------------------------------------------------------
@@ -70,17 +247,46 @@ class DecayRanker(Ranker, LearnsFromHistory):
         self._weight = weight
         self._now = now
 
+        # Hydrated per prefix on first use, not replayed up front
+        self._counts: DecayedCounts | None = DecayedCounts(decay, history)
+        history.subscribe(self._counts, replay=False)
+
+    def close(self) -> None:
+        """
+        Stop tracking the history.
+
+        Rankers built over a long-lived History should be closed when
+        discarded; an unclosed ranker stays subscribed and keeps
+        updating its counts on every record. A closed ranker still
+        ranks, computing decayed counts per event.
+        """
+        if self._counts is not None:
+            self.history.unsubscribe(self._counts)
+            self._counts = None
+
     def _now_utc(self) -> datetime:
         return self._now if self._now is not None else utcnow()
 
     def _decayed_counts(self, prefix: str) -> dict[str, float]:
         now = self._now_utc()
+
+        if self._counts is not None:
+            decayed = self._counts.at(prefix, now)
+            if decayed is not None:
+                return decayed
+
+        # Events newer than `now` need per-event clamping.
+        # Rolled-up buckets are weighted at their start time, so their
+        # relative error is bounded by 2 ** (rollup / half_life) - 1.
         counts: dict[str, float] = defaultdict(float)
 
-        for entry in self.history.entries():
-            if entry.prefix != prefix:
-                continue
+        for bucket in self.history.buckets_for_prefix(prefix):
+            counts[bucket.value] += bucket.count * self._decay.weight(
+                now=now,
+                event_time=bucket.start,
+            )
 
+        for entry in self.history.entries_for_prefix(prefix):
             counts[entry.value] += self._decay.weight(
                 now=now,
                 event_time=entry.timestamp,
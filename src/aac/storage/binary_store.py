@@ -0,0 +1,574 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from aac.domain.history import (
+    History,
+    HistoryBucket,
+    HistoryEntry,
+    HistoryListener,
+    from_epoch_us,
+    to_epoch_us,
+)
+from aac.storage.atomic import atomic_write_bytes
+from aac.storage.base import HistoryStore
+
+MAGIC = b"AACH"
+VERSION = 1
+
+# magic, version, reserved, string count, prefix count,
+# string table offset, prefix index offset, value totals offset
+_HEADER = struct.Struct("<4sHHIIQQQ")
+_OFFSET = struct.Struct("<Q")
+_INDEX_RECORD = struct.Struct("<IQ")
+
+_Buffer = bytes | mmap.mmap
+
+
+# ------------------------------------------------------------
+# Varint encoding
+# ------------------------------------------------------------
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data: _Buffer, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n // 2 if n % 2 == 0 else -(n + 1) // 2
+
+
+# ------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------
+
+def encode_snapshot(history: History) -> bytes:
+    """
+    Serialize History into the binary snapshot format.
+
+    Layout:
+        header
+        per-prefix blocks:
+            counts   varint n, (value id, count)*
+            buckets  varint n, (value id, zigzag start delta, count)*
+            entries  varint n, (seq delta, value id, zigzag ts delta)*
+        string table: (count + 1) u64 offsets, then UTF-8 data
+        prefix index: (prefix id u32, block offset u64)*, sorted by
+                      UTF-8 prefix bytes
+        value totals: varint n, (value id, total)*
+
+    Entries keep a global sequence number so entries() can restore
+    insertion order across prefixes.
+    """
+    strings: list[str] = []
+    ids: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        sid = ids.get(s)
+        if sid is None:
+            sid = ids[s] = len(strings)
+            strings.append(s)
+        return sid
+
+    counts = history.snapshot()
+
+    buckets: dict[str, list[HistoryBucket]] = {}
+    for b in history.buckets():
+        buckets.setdefault(b.prefix, []).append(b)
+
+    entries: dict[str, list[tuple[int, HistoryEntry]]] = {}
+    for seq, e in enumerate(history.entries()):
+        entries.setdefault(e.prefix, []).append((seq, e))
+
+    out = bytearray(_HEADER.size)
+    offsets: dict[int, int] = {}
+    totals: dict[int, int] = {}
+
+    for prefix in counts:
+        offsets[intern(prefix)] = len(out)
+
+        values = counts[prefix]
+        _write_varint(out, len(values))
+        for value, count in values.items():
+            vid = intern(value)
+            totals[vid] = totals.get(vid, 0) + count
+            _write_varint(out, vid)
+            _write_varint(out, count)
+
+        prefix_buckets = buckets.get(prefix, [])
+        _write_varint(out, len(prefix_buckets))
+        prev = 0
+        for b in prefix_buckets:
+            start_us = to_epoch_us(b.start)
+            _write_varint(out, intern(b.value))
+            _write_varint(out, _zigzag(start_us - prev))
+            _write_varint(out, b.count)
+            prev = start_us
+
+        prefix_entries = entries.get(prefix, [])
+        _write_varint(out, len(prefix_entries))
+        prev_seq = 0
+        prev = 0
+        for seq, e in prefix_entries:
+            ts_us = to_epoch_us(e.timestamp)
+            _write_varint(out, seq - prev_seq)
+            _write_varint(out, intern(e.value))
+            _write_varint(out, _zigzag(ts_us - prev))
+            prev_seq = seq
+            prev = ts_us
+
+    strings_offset = len(out)
+    encoded = [s.encode("utf-8") for s in strings]
+    position = 0
+    for data in encoded:
+        out += _OFFSET.pack(position)
+        position += len(data)
+    out += _OFFSET.pack(position)
+    for data in encoded:
+        out += data
+
+    index_offset = len(out)
+    for sid in sorted(offsets, key=lambda sid: encoded[sid]):
+        out += _INDEX_RECORD.pack(sid, offsets[sid])
+
+    totals_offset = len(out)
+    _write_varint(out, len(totals))
+    for vid, total in totals.items():
+        _write_varint(out, vid)
+        _write_varint(out, total)
+
+    _HEADER.pack_into(
+        out,
+        0,
+        MAGIC,
+        VERSION,
+        0,
+        len(strings),
+        len(offsets),
+        strings_offset,
+        index_offset,
+        totals_offset,
+    )
+    return bytes(out)
+
+
+# ------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _Block:
+    counts: dict[str, int]
+    buckets: tuple[tuple[str, int, int], ...]
+    entries: tuple[tuple[int, str, int], ...]
+
+
+class BinarySnapshot:
+    """
+    Read-only, lazily decoded view of a binary history snapshot.
+
+    Design notes:
+        - Opening only validates the header; nothing else is parsed
+        - Prefix lookups binary-search the sorted prefix index in place
+        - Per-prefix blocks and strings are decoded on first access
+          and cached, so cost is proportional to prefixes touched
+        - Value totals (for count()) are decoded on first use
+    """
+
+    def __init__(self, data: _Buffer) -> None:
+        if len(data) < _HEADER.size:
+            raise ValueError("not a history snapshot: truncated header")
+
+        (
+            magic,
+            version,
+            _,
+            self._string_count,
+            self._prefix_count,
+            self._strings_offset,
+            self._index_offset,
+            self._totals_offset,
+        ) = _HEADER.unpack_from(data, 0)
+
+        if magic != MAGIC:
+            raise ValueError("not a history snapshot: bad magic")
+        if version != VERSION:
+            raise ValueError(f"unsupported history snapshot version: {version}")
+
+        self._data = data
+        self._string_data = (
+            self._strings_offset + (self._string_count + 1) * _OFFSET.size
+        )
+        self._strings: dict[int, str] = {}
+        self._blocks: dict[str, _Block | None] = {}
+        self._totals: dict[str, int] | None = None
+
+    @classmethod
+    def open(cls, path: Path) -> BinarySnapshot:
+        """
+        Memory-map a snapshot file.
+
+        Raises:
+            ValueError: if the file is not a history snapshot
+                (including an empty file, which cannot be mapped).
+        """
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError("not a history snapshot: truncated header")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return cls(data)
+        except ValueError:
+            data.close()
+            raise
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    # ------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------
+
+    def _string_bytes(self, sid: int) -> bytes:
+        at = self._strings_offset + sid * _OFFSET.size
+        (start,) = _OFFSET.unpack_from(self._data, at)
+        (end,) = _OFFSET.unpack_from(self._data, at + _OFFSET.size)
+        return bytes(self._data[self._string_data + start:self._string_data + end])
+
+    def _string(self, sid: int) -> str:
+        s = self._strings.get(sid)
+        if s is None:
+            s = self._strings[sid] = self._string_bytes(sid).decode("utf-8")
+        return s
+
+    def _index_record(self, i: int) -> tuple[int, int]:
+        sid, offset = _INDEX_RECORD.unpack_from(
+            self._data,
+            self._index_offset + i * _INDEX_RECORD.size,
+        )
+        return sid, offset
+
+    def _find(self, prefix: str) -> int | None:
+        key = prefix.encode("utf-8")
+        lo, hi = 0, self._prefix_count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            sid, offset = self._index_record(mid)
+            probe = self._string_bytes(sid)
+            if probe == key:
+                return offset
+            if probe < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return None
+
+    def prefixes(self) -> Iterator[str]:
+        """
+        All prefixes in the snapshot, in sorted (UTF-8 byte) order.
+        """
+        for i in range(self._prefix_count):
+            yield self._string(self._index_record(i)[0])
+
+    def scan(self) -> Iterator[tuple[str, _Block]]:
+        """
+        Every prefix with its decoded block, in prefixes() order.
+
+        Blocks are decoded straight from the mapping and not cached,
+        so a full scan does not pin the whole snapshot in memory.
+        """
+        for i in range(self._prefix_count):
+            sid, offset = self._index_record(i)
+            yield self._string(sid), self._decode_block(offset)
+
+    def _block(self, prefix: str) -> _Block | None:
+        if prefix in self._blocks:
+            return self._blocks[prefix]
+
+        offset = self._find(prefix)
+        block = None if offset is None else self._decode_block(offset)
+        self._blocks[prefix] = block
+        return block
+
+    def _decode_block(self, pos: int) -> _Block:
+        data = self._data
+
+        counts: dict[str, int] = {}
+        n, pos = _read_varint(data, pos)
+        for _ in range(n):
+            vid, pos = _read_varint(data, pos)
+            count, pos = _read_varint(data, pos)
+            counts[self._string(vid)] = count
+
+        buckets: list[tuple[str, int, int]] = []
+        n, pos = _read_varint(data, pos)
+        prev = 0
+        for _ in range(n):
+            vid, pos = _read_varint(data, pos)
+            delta, pos = _read_varint(data, pos)
+            count, pos = _read_varint(data, pos)
+            prev += _unzigzag(delta)
+            buckets.append((self._string(vid), prev, count))
+
+        entries: list[tuple[int, str, int]] = []
+        n, pos = _read_varint(data, pos)
+        seq = 0
+        prev = 0
+        for _ in range(n):
+            seq_delta, pos = _read_varint(data, pos)
+            vid, pos = _read_varint(data, pos)
+            delta, pos = _read_varint(data, pos)
+            seq += seq_delta
+            prev += _unzigzag(delta)
+            entries.append((seq, self._string(vid), prev))
+
+        return _Block(counts, tuple(buckets), tuple(entries))
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def counts(self, prefix: str) -> dict[str, int]:
+        block = self._block(prefix)
+        return {} if block is None else dict(block.counts)
+
+    def buckets(self, prefix: str) -> tuple[tuple[str, int, int], ...]:
+        """(value, start_us, count) aggregates for a prefix."""
+        block = self._block(prefix)
+        return () if block is None else block.buckets
+
+    def entries(self, prefix: str) -> tuple[tuple[int, str, int], ...]:
+        """(seq, value, timestamp_us) raw events for a prefix."""
+        block = self._block(prefix)
+        return () if block is None else block.entries
+
+    def value_total(self, value: str) -> int:
+        if self._totals is None:
+            totals: dict[str, int] = {}
+            n, pos = _read_varint(self._data, self._totals_offset)
+            for _ in range(n):
+                vid, pos = _read_varint(self._data, pos)
+                total, pos = _read_varint(self._data, pos)
+                totals[self._string(vid)] = total
+            self._totals = totals
+
+        return self._totals.get(value, 0)
+
+
+# ------------------------------------------------------------
+# History overlay
+# ------------------------------------------------------------
+
+class MappedHistory(History):
+    """
+    History layered over a read-only BinarySnapshot.
+
+    The snapshot answers reads in place; new records go to the
+    in-memory History and are merged into every read, so loading is
+    O(1) and per-prefix reads only decode the prefixes they touch.
+
+    Notes:
+        - Whole-history reads (entries, buckets, snapshot) visit and
+          cache every prefix in the snapshot
+        - subscribe(replay=True) streams the snapshot prefix by prefix
+          without caching it: listeners see each prefix's buckets then
+          entries, then the in-memory records, rather than one global
+          buckets-then-entries pass
+        - replace() detaches the snapshot entirely
+    """
+
+    def __init__(self, base: BinarySnapshot) -> None:
+        super().__init__()
+        self._base: BinarySnapshot | None = base
+
+    def entries(self) -> Sequence[HistoryEntry]:
+        base = self._base
+        if base is None:
+            return super().entries()
+
+        runs = [
+            [(seq, prefix, value, ts_us) for seq, value, ts_us in base.entries(prefix)]
+            for prefix in base.prefixes()
+        ]
+        merged = tuple(
+            HistoryEntry(prefix=prefix, value=value, timestamp=from_epoch_us(ts_us))
+            for _, prefix, value, ts_us in heapq.merge(*runs)
+        )
+        return merged + tuple(super().entries())
+
+    def entries_for_prefix(self, prefix: str) -> Sequence[HistoryEntry]:
+        prefix = str(prefix)
+        own = tuple(super().entries_for_prefix(prefix))
+        if self._base is None:
+            return own
+
+        base = [
+            HistoryEntry(prefix=prefix, value=value, timestamp=from_epoch_us(ts_us))
+            for _, value, ts_us in self._base.entries(prefix)
+        ]
+        # Oldest first like History; the sort is stable for equal times
+        return tuple(sorted(base + list(own), key=lambda e: e.timestamp))
+
+    def buckets(self) -> Sequence[HistoryBucket]:
+        base = self._base
+        if base is None:
+            return super().buckets()
+
+        return tuple(sorted(
+            [
+                b
+                for prefix in base.prefixes()
+                for b in self._base_buckets(prefix)
+            ] + list(super().buckets()),
+            key=lambda b: b.start,
+        ))
+
+    def buckets_for_prefix(self, prefix: str) -> Sequence[HistoryBucket]:
+        prefix = str(prefix)
+        return self._base_buckets(prefix) + tuple(super().buckets_for_prefix(prefix))
+
+    def _base_buckets(self, prefix: str) -> tuple[HistoryBucket, ...]:
+        if self._base is None:
+            return ()
+
+        return tuple(
+            HistoryBucket(
+                prefix=prefix,
+                value=value,
+                start=from_epoch_us(start_us),
+                count=count,
+            )
+            for value, start_us, count in self._base.buckets(prefix)
+        )
+
+    def counts_for_prefix(self, prefix: str) -> dict[str, int]:
+        prefix = str(prefix)
+        if self._base is None:
+            return super().counts_for_prefix(prefix)
+
+        counts = self._base.counts(prefix)
+        for value, count in super().counts_for_prefix(prefix).items():
+            counts[value] = counts.get(value, 0) + count
+        return counts
+
+    def _window_counts(
+        self,
+        prefix: str,
+        start_us: int,
+        end_us: int | None,
+    ) -> dict[str, int]:
+        counts = super()._window_counts(prefix, start_us, end_us)
+        if self._base is None:
+            return counts
+
+        def in_window(ts_us: int) -> bool:
+            return ts_us >= start_us and (end_us is None or ts_us < end_us)
+
+        for value, start, count in self._base.buckets(prefix):
+            if in_window(start):
+                counts[value] = counts.get(value, 0) + count
+
+        for _, value, ts_us in self._base.entries(prefix):
+            if in_window(ts_us):
+                counts[value] = counts.get(value, 0) + 1
+
+        return counts
+
+    def total_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        if self._base is None:
+            return super().total_for_prefix_between(prefix, start, end)
+
+        return sum(self.counts_for_prefix_between(prefix, start, end).values())
+
+    def count(self, value: str) -> int:
+        value = str(value)
+        base = 0 if self._base is None else self._base.value_total(value)
+        return base + super().count(value)
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        own = super().snapshot()
+        if self._base is None:
+            return own
+
+        merged = {prefix: self._base.counts(prefix) for prefix in self._base.prefixes()}
+        for prefix, values in own.items():
+            counts = merged.setdefault(prefix, {})
+            for value, count in values.items():
+                counts[value] = counts.get(value, 0) + count
+        return merged
+
+    def replace(self, other: History) -> None:
+        self._base = None
+        super().replace(other)
+
+    def _replay(self, listener: HistoryListener) -> None:
+        base = self._base
+        if base is not None:
+            for prefix, block in base.scan():
+                for value, start_us, count in block.buckets:
+                    listener.observe(prefix, value, from_epoch_us(start_us), count)
+                for _, value, ts_us in block.entries:
+                    listener.observe(prefix, value, from_epoch_us(ts_us))
+
+        for b in super().buckets():
+            listener.observe(b.prefix, b.value, b.start, b.count)
+
+        for e in super().entries():
+            listener.observe(e.prefix, e.value, e.timestamp)
+
+
+class BinaryHistoryStore(HistoryStore):
+    """
+    Binary snapshot persistence for History.
+
+    load() memory-maps the snapshot and returns a MappedHistory, so
+    cold start does not parse the file. save() re-encodes the full
+    history and replaces the file atomically (existing mappings keep
+    reading the old file until they are dropped).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def load(self) -> History:
+        if not self._path.exists():
+            return History()
+
+        return MappedHistory(BinarySnapshot.open(self._path))
+
+    def save(self, history: History) -> None:
+        atomic_write_bytes(self._path, encode_snapshot(history))
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+
+from aac.domain.history import History, HistoryBucket, HistoryEntry, HistoryListener
+from aac.storage.log_store import apply_log_line, load_checkpoint, log_path
+
+
+class _FollowedHistory(History):
+    """
+    Stable History view over the follower's current generation.
+
+    Every read goes to whichever History is current when it starts.
+    swap() installs a new generation with one reference assignment, so
+    readers never wait on a rebuild and never see a half-loaded one.
+
+    Listeners subscribe to the view. On swap, listeners subscribed
+    with replay=True are reset and replayed from the new generation
+    before it is published, outside the lock; listeners subscribed
+    with replay=False rebuild lazily from the history, so they are
+    only reset, under the lock, as the generation is published.
+    """
+
+    def __init__(self, target: History) -> None:
+        super().__init__()
+        self._target = target
+
+        # Generation being replayed into listeners by swap(), if any
+        self._next: History | None = None
+
+        # Listeners subscribed with replay=False
+        self._lazy: list[HistoryListener] = []
+
+        # Serializes records and swaps; returned by prefix_lock()
+        self._lock = threading.RLock()
+
+    @property
+    def target(self) -> History:
+        return self._target
+
+    def swap(self, target: History) -> None:
+        with self._lock:
+            eager = [
+                listener for listener in self._listeners
+                if listener not in self._lazy
+            ]
+            self._next = target
+
+        # Nothing records into `target` before it is published, and
+        # record() skips these listeners meanwhile
+        try:
+            for listener in eager:
+                listener.reset()
+                target._replay(listener)
+        finally:
+            with self._lock:
+                self._target = target
+                self._next = None
+
+                for listener in self._lazy:
+                    listener.reset()
+
+    def subscribe(self, listener: HistoryListener, *, replay: bool = True) -> None:
+        with self._lock:
+            super().subscribe(listener, replay=replay)
+            if not replay:
+                self._lazy.append(listener)
+
+    def unsubscribe(self, listener: HistoryListener) -> None:
+        with self._lock:
+            super().unsubscribe(listener)
+            if listener in self._lazy:
+                self._lazy.remove(listener)
+
+    def _observers(self) -> list[HistoryListener]:
+        # Mid-swap, replayed listeners already track the next generation
+        return self._listeners if self._next is None else self._lazy
+
+    # ------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------
+
+    def record(
+        self,
+        prefix: str,
+        value: str,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        prefix = str(prefix)
+        value = str(value)
+
+        with self._lock:
+            self._target.record(prefix, value, timestamp=timestamp)
+
+            for listener in self._observers():
+                listener.observe(prefix, value, timestamp)
+
+    def record_bulk(
+        self,
+        prefix: str,
+        value: str,
+        count: int,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        prefix = str(prefix)
+        value = str(value)
+
+        with self._lock:
+            self._target.record_bulk(prefix, value, count, timestamp=timestamp)
+
+            if count > 0:
+                for listener in self._observers():
+                    listener.observe(prefix, value, timestamp, count)
+
+    def prefix_lock(self, prefix: str) -> AbstractContextManager[object]:
+        return self._lock
+
+    def compact(self) -> int:
+        return self._target.compact()
+
+    def _replay(self, listener: HistoryListener) -> None:
+        # A listener subscribing mid-swap follows the next generation
+        target = self._next if self._next is not None else self._target
+        target._replay(listener)
+
+    # ------------------------------------------------------------
+    # Read APIs
+    # ------------------------------------------------------------
+
+    def entries(self) -> Sequence[HistoryEntry]:
+        return self._target.entries()
+
+    def entries_for_prefix(self, prefix: str) -> Sequence[HistoryEntry]:
+        return self._target.entries_for_prefix(prefix)
+
+    def buckets(self) -> Sequence[HistoryBucket]:
+        return self._target.buckets()
+
+    def buckets_for_prefix(self, prefix: str) -> Sequence[HistoryBucket]:
+        return self._target.buckets_for_prefix(prefix)
+
+    def counts_for_prefix(self, prefix: str) -> dict[str, int]:
+        return self._target.counts_for_prefix(prefix)
+
+    def counts_for_prefix_since(
+        self,
+        prefix: str,
+        since: datetime,
+    ) -> dict[str, int]:
+        return self._target.counts_for_prefix_since(prefix, since)
+
+    def counts_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, int]:
+        return self._target.counts_for_prefix_between(prefix, start, end)
+
+    def total_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        return self._target.total_for_prefix_between(prefix, start, end)
+
+    def count(self, value: str) -> int:
+        return self._target.count(value)
+
+    # ------------------------------------------------------------
+    # Persistence boundary
+    # ------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        return self._target.snapshot()
+
+    def replace(self, other: History) -> None:
+        with self._lock:
+            self._target.replace(other)
+
+            for listener in self._listeners:
+                listener.reset()
+                self._replay(listener)
+
+
+class LogFollower:
+    """
+    Keeps an in-memory History in sync with a LogHistoryStore written
+    by other processes.
+
+    The follower remembers the checkpoint generation and the byte
+    offset it has consumed in the matching event log. poll() compares
+    the checkpoint's identity (inode, mtime, size) and the log size
+    against that position and applies only newly appended events.
+
+    Usage:
+        follower = LogFollower(path, factory=ConcurrentHistory)
+        engine = preset.build(follower.history)
+        follower.start(interval=0.5)
+
+    Design notes:
+        - New events go through History.record()/record_bulk(), so
+          listeners (e.g. decay rankers) stay in sync incrementally
+        - Cost per poll is O(new events); only a new checkpoint (log
+          rotation) triggers a rebuild, which loads a fresh History
+          from `factory` off to the side
+        - `history` is a stable view that delegates to the current
+          generation; a rebuild swaps the generation behind it in one
+          assignment, so readers keep serving the old one meanwhile
+          and never block on the load. A History passed in receives
+          the first generation only; build engines over the view
+        - `factory` defaults to the class of `history` (or History);
+          pass it for histories that need constructor arguments
+        - A partially written final line is left for the next poll
+        - The followed History must be read-only for this process: do
+          not attach it to a LogHistoryStore, or events would be
+          appended to the log a second time
+        - With start(), events are applied from a background thread;
+          use ConcurrentHistory so readers only contend on per-prefix
+          shard locks, never on file I/O
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        history: History | None = None,
+        *,
+        factory: Callable[[], History] | None = None,
+    ) -> None:
+        self._path = path
+        self._factory: Callable[[], History] = (
+            factory if factory is not None
+            else type(history) if history is not None
+            else History
+        )
+        self._history = _FollowedHistory(History())
+
+        self._generation = 0
+        self._offset = 0
+        self._checkpoint_id: tuple[int, int, int] | None = None
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        self._rebuild(history)
+
+    @property
+    def history(self) -> History:
+        """View of the current generation; stable across rebuilds."""
+        return self._history
+
+    def poll(self) -> int:
+        """
+        Apply changes written since the last poll.
+
+        Returns:
+            Number of log lines applied (0 after a rebuild).
+        """
+        if self._stat_checkpoint() != self._checkpoint_id:
+            self._rebuild()
+            return 0
+
+        return self._tail(self._history)
+
+    # ------------------------------------------------------------
+    # Background polling
+    # ------------------------------------------------------------
+
+    def start(self, interval: float = 0.5) -> None:
+        """
+        Poll from a daemon thread every `interval` seconds.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval,),
+            name="aac-log-follower",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop background polling.
+        """
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> LogFollower:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.poll()
+            except OSError:
+                # Files mid-rotation; retry on the next tick
+                continue
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _stat_checkpoint(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _rebuild(self, into: History | None = None) -> None:
+        checkpoint_id = self._stat_checkpoint()
+
+        fresh = self._factory()
+        self._generation, _ = load_checkpoint(fresh, self._path)
+        self._offset = 0
+        self._tail(fresh)
+
+        if into is not None:
+            into.replace(fresh)
+            fresh = into
+
+        self._checkpoint_id = checkpoint_id
+        self._history.swap(fresh)
+
+    def _tail(self, history: History) -> int:
+        path = log_path(self._path, self._generation)
+
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+
+        if size <= self._offset:
+            return 0
+
+        with path.open("rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # Only consume complete lines
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+
+        applied = 0
+        for line in data[:end].splitlines():
+            if apply_log_line(history, line):
+                applied += 1
+
+        return applied
@@ -1,12 +1,58 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 from aac.domain.history import History
+from aac.storage.atomic import atomic_write_text
 from aac.storage.base import HistoryStore
 
 
+def hydrate_counts(
+    history: History,
+    data: object,
+    *,
+    timestamp: datetime,
+) -> None:
+    """
+    Load a count snapshot ({prefix: {value: count}}) into History.
+
+    Notes:
+        - Coerces all keys to strings to guard against
+          legacy snapshots containing non-string keys.
+        - Ignores malformed entries instead of failing.
+        - Snapshots carry no timestamps: all selections are
+          attributed to `timestamp`.
+    """
+    if not isinstance(data, dict):
+        return
+
+    for prefix, values in data.items():
+        prefix_str = str(prefix)
+
+        if not isinstance(values, dict):
+            continue
+
+        for value, count in values.items():
+            value_str = str(value)
+
+            try:
+                count_int = int(count)
+            except (TypeError, ValueError):
+                continue
+
+            if count_int <= 0:
+                continue
+
+            history.record_bulk(
+                prefix_str,
+                value_str,
+                count_int,
+                timestamp=timestamp,
+            )
+
+
 class JsonHistoryStore(HistoryStore):
     """
     JSON-backed persistence for History.
@@ -34,38 +80,19 @@ class JsonHistoryStore(HistoryStore):
             if no file exists.
 
         Notes:
-            - Coerces all keys to strings to guard against
-              legacy snapshots containing non-string keys.
-            - Ignores malformed entries instead of failing.
+            - Sanitization rules are documented on hydrate_counts().
+            - Hydrates via History.record_bulk(), so load cost is
+              O(distinct prefix/value pairs), not O(total selections).
         """
         history = History()
+        loaded_at = datetime.now(timezone.utc)
 
         if not self._path.exists():
             return history
 
         data = json.loads(self._path.read_text(encoding="utf-8"))
 
-        if not isinstance(data, dict):
-            return history
-
-        for prefix, values in data.items():
-            prefix_str = str(prefix)
-
-            if not isinstance(values, dict):
-                continue
-
-            for value, count in values.items():
-                value_str = str(value)
-
-                try:
-                    count_int = int(count)
-                except (TypeError, ValueError):
-                    continue
-
-                # Rehydrate counts via repeated recording to preserve semantics
-                for _ in range(count_int):
-                    history.record(prefix_str, value_str)
-
+        hydrate_counts(history, data, timestamp=loaded_at)
         return history
 
     def save(self, history: History) -> None:
@@ -73,14 +100,13 @@ class JsonHistoryStore(HistoryStore):
         Persist history snapshot to disk.
 
         Assumes History.snapshot() returns a fully
-        JSON-serializable structure.
+        JSON-serializable structure. The file is replaced atomically,
+        so a crash mid-save never leaves a truncated snapshot.
         """
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-
         snapshot = history.snapshot()
 
-        self._path.write_text(
+        atomic_write_text(
+            self._path,
             json.dumps(snapshot, indent=2, sort_keys=True),
-            encoding="utf-8",
         )
 
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from aac.domain.history import History, from_epoch_us, to_epoch_us
+from aac.storage.atomic import atomic_write_text
+from aac.storage.base import HistoryStore
+from aac.storage.json_store import hydrate_counts
+
+SNAPSHOT_VERSION = 1
+
+
+class LogHistoryStore(HistoryStore):
+    """
+    Write-ahead-log persistence for History.
+
+    Files:
+        <path>              Versioned JSON checkpoint (entries + buckets)
+        <path>.<gen>.log    Append-only event log for checkpoint <gen>
+
+    Log format (one compact JSON array per line):
+        [prefix, value, timestamp_us]           single selection
+        [prefix, value, timestamp_us, count]    aggregate (record_bulk)
+
+    Responsibilities:
+        - Append every recorded event with a single write() call
+        - Periodically checkpoint into a snapshot and start a fresh log
+        - Load by replaying checkpoint + log tail
+
+    Design notes:
+        - The store subscribes to the History it loads, so recording is
+          O(1) and save() only checkpoints when due
+        - Timestamps are persisted, unlike count-only JSON snapshots
+        - Checkpoints are written atomically; the generation number in
+          the snapshot selects the matching log, so a crash between
+          snapshot and log rotation never double-applies events
+        - A torn final log line (crash mid-append) is ignored on load
+        - Legacy count snapshots at <path> are migrated on first save
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        checkpoint_every: int = 10_000,
+        sync: bool = False,
+    ) -> None:
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+
+        self._path = path
+        self._checkpoint_every = checkpoint_every
+        self._sync = sync
+
+        self._generation = 0
+        self._fd: int | None = None
+        self._attached: History | None = None
+
+        # Log lines appended since the last checkpoint
+        self._pending = 0
+        # Attached history was replaced wholesale or needs migrating
+        self._stale = False
+
+    @property
+    def generation(self) -> int:
+        """Current checkpoint generation."""
+        return self._generation
+
+    def log_path(self, generation: int | None = None) -> Path:
+        """
+        Path of the event log for a checkpoint generation.
+        """
+        gen = self._generation if generation is None else generation
+        return log_path(self._path, gen)
+
+    # ------------------------------------------------------------
+    # HistoryStore
+    # ------------------------------------------------------------
+
+    def load(self) -> History:
+        """
+        Load history from checkpoint + log tail.
+
+        Returns:
+            History populated from storage and attached to this store,
+            so subsequent records are appended to the log.
+        """
+        history = History()
+        self._generation, self._stale = load_checkpoint(history, self._path)
+
+        self._pending = replay_log(history, self.log_path())
+        self._attach(history)
+        return history
+
+    def save(self, history: History) -> None:
+        """
+        Persist history.
+
+        Events of the attached history are already in the log; this
+        only checkpoints when due (or when given a different history).
+        """
+        if (
+            history is not self._attached
+            or self._stale
+            or self._pending >= self._checkpoint_every
+        ):
+            self.checkpoint(history)
+
+    # ------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------
+
+    def checkpoint(self, history: History) -> None:
+        """
+        Write a full snapshot and rotate to an empty log.
+        """
+        generation = self._generation + 1
+
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "generation": generation,
+            "buckets": [
+                [b.prefix, b.value, to_epoch_us(b.start), b.count]
+                for b in history.buckets()
+            ],
+            "entries": [
+                [e.prefix, e.value, to_epoch_us(e.timestamp)]
+                for e in history.entries()
+            ],
+        }
+        atomic_write_text(self._path, json.dumps(payload, separators=(",", ":")))
+
+        old_log = self.log_path()
+        self._close_log()
+        self._generation = generation
+        old_log.unlink(missing_ok=True)
+
+        self._pending = 0
+        self._stale = False
+        self._attach(history)
+
+    def close(self) -> None:
+        """
+        Release the open log file descriptor.
+        """
+        self._close_log()
+
+    # ------------------------------------------------------------
+    # HistoryListener
+    # ------------------------------------------------------------
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        record: list[Any] = [prefix, value, to_epoch_us(timestamp)]
+        if count != 1:
+            record.append(count)
+
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+
+        fd = self._log_fd()
+        os.write(fd, line.encode("utf-8"))
+        if self._sync:
+            os.fsync(fd)
+
+        self._pending += 1
+
+    def reset(self) -> None:
+        self._stale = True
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _attach(self, history: History) -> None:
+        if self._attached is history:
+            return
+
+        if self._attached is not None:
+            self._attached.unsubscribe(self)
+
+        self._attached = history
+        history.subscribe(self, replay=False)
+
+    def _log_fd(self) -> int:
+        if self._fd is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(
+                self.log_path(),
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o644,
+            )
+        return self._fd
+
+    def _close_log(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def log_path(path: Path, generation: int) -> Path:
+    """
+    Event log path for checkpoint `generation` of snapshot `path`.
+    """
+    return path.with_name(f"{path.name}.{generation}.log")
+
+
+def load_checkpoint(history: History, path: Path) -> tuple[int, bool]:
+    """
+    Load the checkpoint at `path` into History.
+
+    Returns:
+        (generation, legacy) where legacy is True for a count-only
+        JSON snapshot that still needs migrating. A missing file is
+        generation 0.
+    """
+    if not path.exists():
+        return 0, False
+
+    data: object = json.loads(path.read_text(encoding="utf-8"))
+
+    if isinstance(data, dict) and "version" in data:
+        apply_snapshot(history, data)
+        return int(data.get("generation", 0)), False
+
+    hydrate_counts(history, data, timestamp=datetime.now(timezone.utc))
+    return 0, True
+
+
+def apply_snapshot(history: History, data: dict[str, Any]) -> None:
+    """
+    Load a versioned checkpoint (buckets + entries) into History.
+    """
+    for row in data.get("buckets", []):
+        try:
+            prefix, value, start_us, count = row
+            history.record_bulk(
+                str(prefix),
+                str(value),
+                int(count),
+                timestamp=from_epoch_us(int(start_us)),
+            )
+        except (TypeError, ValueError):
+            continue
+
+    for row in data.get("entries", []):
+        try:
+            prefix, value, ts_us = row
+            history.record(
+                str(prefix),
+                str(value),
+                timestamp=from_epoch_us(int(ts_us)),
+            )
+        except (TypeError, ValueError):
+            continue
+
+
+def apply_log_line(history: History, line: bytes) -> bool:
+    """
+    Apply one log line to History.
+
+    Returns:
+        False if the line is malformed (e.g. torn by a crash).
+    """
+    try:
+        record = json.loads(line)
+        prefix, value, ts_us, *rest = record
+        timestamp = from_epoch_us(int(ts_us))
+        count = int(rest[0]) if rest else 1
+        if count < 0:
+            raise ValueError("count must be non-negative")
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+    if count == 1:
+        history.record(str(prefix), str(value), timestamp=timestamp)
+    else:
+        history.record_bulk(str(prefix), str(value), count, timestamp=timestamp)
+
+    return True
+
+
+def replay_log(history: History, path: Path) -> int:
+    """
+    Apply every well-formed line of an event log.
+
+    Returns:
+        Number of lines applied.
+    """
+    if not path.exists():
+        return 0
+
+    applied = 0
+    with path.open("rb") as f:
+        for line in f:
+            if apply_log_line(history, line):
+                applied += 1
+
+    return applied
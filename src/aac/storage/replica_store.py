@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.domain.replica import DeltaRecord, ReplicaState, merge_deltas
+from aac.storage.base import HistoryStore
+
+
+def read_deltas(path: Path) -> Iterator[DeltaRecord]:
+    """
+    Stream DeltaRecords from a JSON-lines delta file.
+
+    Each line is a compact array: [replica, prefix, value, count, seq].
+    Malformed lines are skipped.
+    """
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                replica, prefix, value, count, seq = json.loads(line)
+                yield DeltaRecord(str(replica), str(prefix), str(value), int(count), int(seq))
+            except (TypeError, ValueError):
+                continue
+
+
+def write_deltas(path: Path, records: Iterable[DeltaRecord]) -> int:
+    """
+    Stream DeltaRecords to a JSON-lines delta file.
+
+    The file is written next to `path` and renamed into place, so
+    `path` may also be one of the inputs of `records`.
+
+    Returns:
+        Number of records written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+
+    written = 0
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(
+                    [r.replica, r.prefix, r.value, r.count, r.seq],
+                    separators=(",", ":"),
+                ))
+                f.write("\n")
+                written += 1
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    return written
+
+
+def merge_delta_files(inputs: Iterable[Path], output: Path) -> int:
+    """
+    Merge key-sorted delta files into `output` in one streaming pass.
+
+    Returns:
+        Number of records written.
+    """
+    return write_deltas(output, merge_deltas(*(read_deltas(p) for p in inputs)))
+
+
+class ReplicaHistoryStore(HistoryStore):
+    """
+    History persisted as replicated G-counter state.
+
+    The file holds the full delta set (sorted JSON lines), so files
+    from different machines can be merged with `aac history merge`
+    or exchanged incrementally via export_delta()/apply_delta().
+
+    Design notes:
+        - load() streams the file into History via record_bulk() and
+          attaches a ReplicaState that tracks new local selections
+        - Saving a History not loaded by this store keeps the
+          attribution of selections the file (or the loaded state)
+          already counts; only the excess is attributed to the local
+          replica
+        - Like count snapshots, selection timestamps are not persisted
+    """
+
+    def __init__(self, path: Path, *, replica: str | None = None) -> None:
+        self._path = path
+        self._state = ReplicaState(replica or socket.gethostname())
+        self._attached: History | None = None
+
+    @property
+    def replica(self) -> str:
+        return self._state.replica
+
+    def load(self) -> History:
+        history = History()
+        self._state = ReplicaState(self._state.replica)
+        self._state.attach(history)
+        self._attached = history
+
+        if self._path.exists():
+            self._state.apply(read_deltas(self._path))
+
+        return history
+
+    def save(self, history: History) -> None:
+        if history is not self._attached:
+            if self._attached is None and self._path.exists():
+                self._state.apply(read_deltas(self._path))
+            self._state.attach(history, replay=True)
+            self._attached = history
+
+        write_deltas(self._path, self._state.export())
+
+    # ------------------------------------------------------------
+    # Delta exchange
+    # ------------------------------------------------------------
+
+    def clock(self) -> dict[str, int]:
+        """Version vector of the loaded history."""
+        return self._state.clock()
+
+    def export_delta(self, since: Mapping[str, int] | None = None) -> list[DeltaRecord]:
+        """Components changed after version vector `since`."""
+        return self._state.export(since)
+
+    def apply_delta(self, records: Iterable[DeltaRecord]) -> int:
+        """
+        Merge remote components into the loaded history.
+
+        Returns:
+            Number of selections added.
+        """
+        return self._state.apply(records)
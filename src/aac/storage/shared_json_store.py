@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.storage.atomic import atomic_write_text
+from aac.storage.json_store import JsonHistoryStore, hydrate_counts
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+class _DeltaTracker:
+    """
+    HistoryListener collecting counts recorded since the last save.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, dict[str, int]] = {}
+
+    def observe(
+        self,
+        prefix: str,
+        value: str,
+        timestamp: datetime,
+        count: int = 1,
+    ) -> None:
+        values = self.counts.setdefault(prefix, {})
+        values[value] = values.get(value, 0) + count
+
+    def reset(self) -> None:
+        # The replay that follows makes the whole new contents a delta
+        self.counts = {}
+
+
+class SharedJsonHistoryStore(JsonHistoryStore):
+    """
+    JSON history file shared safely by several processes.
+
+    Every process records into its own in-memory History; save()
+    merges only the selections recorded since the last save into the
+    current on-disk snapshot, under an exclusive advisory lock.
+    Concurrent recorders therefore never overwrite each other.
+
+    Design notes:
+        - The file format is unchanged (plain count snapshot)
+        - Locks are taken on a sidecar `<path>.lock` file, because the
+          snapshot itself is replaced by atomic rename on every save
+        - Deltas come from a listener on the loaded History, so only
+          the new selections are added, never a stale copy. Each save
+          is still a full rewrite: the file is read, merged and
+          replaced under the lock, O(file size) per save, because the
+          format is a plain snapshot. Use LogHistoryStore when saves
+          must cost O(delta)
+        - Saving a History that was not loaded by this store merges
+          its whole contents as a delta, as does saving one that was
+          replace()d; later saves merge only new selections
+        - overwrite() replaces the file wholesale, like
+          JsonHistoryStore.save()
+        - Selections saved by other processes become visible on the
+          next load()
+
+    Requires fcntl (POSIX).
+    """
+
+    def __init__(self, path: Path) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedJsonHistoryStore requires fcntl (POSIX)")
+
+        super().__init__(path)
+        self._lock_path = path.with_name(f"{path.name}.lock")
+        self._attached: History | None = None
+        self._delta = _DeltaTracker()
+
+    def load(self) -> History:
+        """
+        Load history under a shared lock and start tracking deltas.
+        """
+        with self._locked(fcntl.LOCK_SH):
+            history = super().load()
+
+        self._attach(history)
+        return history
+
+    def save(self, history: History) -> None:
+        """
+        Merge selections recorded since the last save into the file.
+
+        A History this store is not tracking is merged in full.
+        """
+        if history is not self._attached:
+            self._merge(history.snapshot())
+            self._attach(history)
+            return
+
+        delta = self._delta.counts
+        if not delta:
+            return
+
+        self._merge(delta)
+        self._delta.counts = {}
+
+    def overwrite(self, history: History) -> None:
+        """
+        Replace the file with `history`, discarding other processes'
+        selections, and track `history` from now on.
+        """
+        with self._locked(fcntl.LOCK_EX):
+            super().save(history)
+        self._attach(history)
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _attach(self, history: History) -> None:
+        if self._attached is not None:
+            self._attached.unsubscribe(self._delta)
+
+        self._delta = _DeltaTracker()
+        self._attached = history
+        history.subscribe(self._delta, replay=False)
+
+    def _merge(self, delta: dict[str, dict[str, int]]) -> None:
+        # Read-modify-write of the whole snapshot
+        with self._locked(fcntl.LOCK_EX):
+            merged = self._read()
+            for prefix, values in delta.items():
+                counts = merged.setdefault(prefix, {})
+                for value, count in values.items():
+                    counts[value] = counts.get(value, 0) + count
+
+            atomic_write_text(
+                self._path,
+                json.dumps(merged, indent=2, sort_keys=True),
+            )
+
+    def _read(self) -> dict[str, dict[str, int]]:
+        # Sanitize through a throwaway History (same rules as load())
+        if not self._path.exists():
+            return {}
+
+        current = History()
+        hydrate_counts(
+            current,
+            json.loads(self._path.read_text(encoding="utf-8")),
+            timestamp=datetime.now(timezone.utc),
+        )
+        return current.snapshot()
+
+    @contextmanager
+    def _locked(self, mode: int) -> Iterator[None]:
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock_path.open("a") as f:
+            fcntl.flock(f.fileno(), mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
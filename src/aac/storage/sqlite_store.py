@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from aac.domain.history import (
+    History,
+    HistoryBucket,
+    HistoryEntry,
+    HistoryListener,
+    from_epoch_us,
+    to_epoch_us,
+)
+from aac.storage.base import HistoryStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    prefix TEXT NOT NULL,
+    value TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    n INTEGER NOT NULL DEFAULT 1,
+    bucket INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS events_prefix_value ON events (prefix, value);
+CREATE INDEX IF NOT EXISTS events_prefix_ts ON events (prefix, ts);
+CREATE INDEX IF NOT EXISTS events_value ON events (value);
+"""
+
+_INSERT = "INSERT INTO events (prefix, value, ts, n, bucket) VALUES (?, ?, ?, ?, ?)"
+
+_Row = tuple[str, str, int, int, int]
+
+# Rows fetched per lock acquisition while replaying to a listener
+_REPLAY_BATCH = 1024
+
+
+class SqliteHistory(History):
+    """
+    History backed by a SQLite database instead of process memory.
+
+    Schema:
+        events(id, prefix, value, ts, n, bucket)
+            - Raw selections: n = 1, bucket = 0
+            - record_bulk() aggregates: n = count, bucket = 1
+        Indexes on (prefix, value), (prefix, ts) and (value)
+
+    Query pushdown:
+        - counts_for_prefix(), the time-window counts and count() are
+          single indexed GROUP BY / SUM queries
+        - Nothing is cached in memory, so memory stays bounded
+          regardless of history size
+
+    Concurrency:
+        - WAL journal mode: readers never block the single writer, and
+          several processes can share one database file
+        - Writes are buffered and committed in batches of `batch_size`
+          as one transaction; every read flushes first, so reads always
+          observe this instance's own writes
+        - Listeners only observe events recorded through this instance
+        - One connection shared across threads: a lock serializes the
+          write buffer and every statement, and reads fetch their rows
+          under it, so background flushers, log followers and
+          multi-threaded servers can use the same instance
+
+    Notes:
+        - Retention policies are not supported; SQLite holds the full
+          event log cheaply on disk
+    """
+
+    def __init__(self, path: Path, *, batch_size: int = 256) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        super().__init__()
+
+        self.path = path
+        self._batch_size = batch_size
+        self._pending: list[_Row] = []
+        # Guards _pending and the connection (flush() re-enters)
+        self._lock = threading.RLock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------
+
+    def record(
+        self,
+        prefix: str,
+        value: str,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        if timestamp.tzinfo is None:
+            raise ValueError("timestamp must be timezone-aware")
+
+        prefix = str(prefix)
+        value = str(value)
+
+        with self._lock:
+            self._write((prefix, value, to_epoch_us(timestamp), 1, 0))
+
+            for listener in self._listeners:
+                listener.observe(prefix, value, timestamp)
+
+    def record_bulk(
+        self,
+        prefix: str,
+        value: str,
+        count: int,
+        *,
+        timestamp: datetime | None = None,
+    ) -> None:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+
+        if count == 0:
+            return
+
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        if timestamp.tzinfo is None:
+            raise ValueError("timestamp must be timezone-aware")
+
+        prefix = str(prefix)
+        value = str(value)
+
+        with self._lock:
+            self._write((prefix, value, to_epoch_us(timestamp), count, 1))
+
+            for listener in self._listeners:
+                listener.observe(prefix, value, timestamp, count)
+
+    def prefix_lock(self, prefix: str) -> AbstractContextManager[object]:
+        return self._lock
+
+    def _write(self, row: _Row) -> None:
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Commit buffered writes in a single transaction.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+
+            with self._conn:
+                self._conn.executemany(_INSERT, self._pending)
+            self._pending.clear()
+
+    def close(self) -> None:
+        """
+        Flush buffered writes and close the database connection.
+        """
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def _replay(self, listener: HistoryListener) -> None:
+        # Stream rows in batches instead of materializing the whole
+        # history; the lock is only held while fetching
+        with self._lock:
+            self.flush()
+            cursor = self._conn.execute(
+                "SELECT prefix, value, ts, n, bucket FROM events ORDER BY bucket DESC, id"
+            )
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_REPLAY_BATCH)
+            if not rows:
+                return
+
+            for prefix, value, ts, n, bucket in rows:
+                if bucket:
+                    listener.observe(prefix, value, from_epoch_us(ts), n)
+                else:
+                    listener.observe(prefix, value, from_epoch_us(ts))
+
+    # ------------------------------------------------------------
+    # Read APIs
+    # ------------------------------------------------------------
+
+    def buckets(self) -> Sequence[HistoryBucket]:
+        return tuple(
+            HistoryBucket(prefix=p, value=v, start=from_epoch_us(ts), count=n)
+            for p, v, ts, n in self._query(
+                "SELECT prefix, value, ts, SUM(n) FROM events WHERE bucket = 1 "
+                "GROUP BY prefix, value, ts ORDER BY ts, MIN(id)"
+            )
+        )
+
+    def buckets_for_prefix(self, prefix: str) -> Sequence[HistoryBucket]:
+        prefix = str(prefix)
+        return tuple(
+            HistoryBucket(prefix=prefix, value=v, start=from_epoch_us(ts), count=n)
+            for v, ts, n in self._query(
+                "SELECT value, ts, SUM(n) FROM events "
+                "WHERE prefix = ? AND bucket = 1 "
+                "GROUP BY value, ts ORDER BY MIN(id)",
+                (prefix,),
+            )
+        )
+
+    def entries(self) -> Sequence[HistoryEntry]:
+        return tuple(
+            HistoryEntry(prefix=p, value=v, timestamp=from_epoch_us(ts))
+            for p, v, ts in self._query(
+                "SELECT prefix, value, ts FROM events WHERE bucket = 0 ORDER BY id"
+            )
+        )
+
+    def entries_for_prefix(self, prefix: str) -> Sequence[HistoryEntry]:
+        prefix = str(prefix)
+        return tuple(
+            HistoryEntry(prefix=prefix, value=v, timestamp=from_epoch_us(ts))
+            for v, ts in self._query(
+                "SELECT value, ts FROM events "
+                "WHERE prefix = ? AND bucket = 0 ORDER BY ts, id",
+                (prefix,),
+            )
+        )
+
+    def counts_for_prefix(self, prefix: str) -> dict[str, int]:
+        return dict(self._query(
+            "SELECT value, SUM(n) FROM events WHERE prefix = ? "
+            "GROUP BY value ORDER BY MIN(id)",
+            (str(prefix),),
+        ))
+
+    def counts_for_prefix_since(
+        self,
+        prefix: str,
+        since: datetime,
+    ) -> dict[str, int]:
+        if since.tzinfo is None:
+            raise ValueError("since must be timezone-aware")
+
+        return dict(self._query(
+            "SELECT value, SUM(n) FROM events WHERE prefix = ? AND ts >= ? "
+            "GROUP BY value ORDER BY MIN(id)",
+            (str(prefix), to_epoch_us(since)),
+        ))
+
+    def counts_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, int]:
+        if start.tzinfo is None or end.tzinfo is None:
+            raise ValueError("start and end must be timezone-aware")
+
+        return dict(self._query(
+            "SELECT value, SUM(n) FROM events "
+            "WHERE prefix = ? AND ts >= ? AND ts < ? "
+            "GROUP BY value ORDER BY MIN(id)",
+            (str(prefix), to_epoch_us(start), to_epoch_us(end)),
+        ))
+
+    def total_for_prefix_between(
+        self,
+        prefix: str,
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        if start.tzinfo is None or end.tzinfo is None:
+            raise ValueError("start and end must be timezone-aware")
+
+        return self._scalar(
+            "SELECT COALESCE(SUM(n), 0) FROM events "
+            "WHERE prefix = ? AND ts >= ? AND ts < ?",
+            (str(prefix), to_epoch_us(start), to_epoch_us(end)),
+        )
+
+    def count(self, value: str) -> int:
+        return self._scalar(
+            "SELECT COALESCE(SUM(n), 0) FROM events WHERE value = ?",
+            (str(value),),
+        )
+
+    # ------------------------------------------------------------
+    # Persistence boundary
+    # ------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        snapshot: dict[str, dict[str, int]] = {}
+        for prefix, value, count in self._query(
+            "SELECT prefix, value, SUM(n) FROM events "
+            "GROUP BY prefix, value ORDER BY MIN(id)"
+        ):
+            snapshot.setdefault(prefix, {})[value] = count
+        return snapshot
+
+    def replace(self, other: History) -> None:
+        rows: list[_Row] = [
+            (b.prefix, b.value, to_epoch_us(b.start), b.count, 1)
+            for b in other.buckets()
+        ]
+        rows.extend(
+            (e.prefix, e.value, to_epoch_us(e.timestamp), 1, 0)
+            for e in other.entries()
+        )
+
+        with self._lock:
+            self._pending.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM events")
+                self._conn.executemany(_INSERT, rows)
+
+        for listener in self._listeners:
+            listener.reset()
+            self._replay(listener)
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _query(
+        self,
+        sql: str,
+        params: tuple[object, ...] = (),
+    ) -> list[tuple[Any, ...]]:
+        with self._lock:
+            self.flush()
+            return self._conn.execute(sql, params).fetchall()
+
+    def _scalar(self, sql: str, params: tuple[object, ...]) -> int:
+        row = self._query(sql, params)[0]
+        return int(row[0])
+
+
+class SqliteHistoryStore(HistoryStore):
+    """
+    SQLite-backed persistence for History.
+
+    load() returns a SqliteHistory that writes through to the
+    database, so save() of that history is just a flush. Saving any
+    other History replaces the database contents in one transaction.
+    """
+
+    def __init__(self, path: Path, *, batch_size: int = 256) -> None:
+        self._path = path
+        self._batch_size = batch_size
+
+    def load(self) -> History:
+        return SqliteHistory(self._path, batch_size=self._batch_size)
+
+    def save(self, history: History) -> None:
+        if isinstance(history, SqliteHistory) and history.path == self._path:
+            history.flush()
+            return
+
+        target = SqliteHistory(self._path, batch_size=self._batch_size)
+        try:
+            target.replace(history)
+        finally:
+            target.close()
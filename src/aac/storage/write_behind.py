@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from types import TracebackType
+
+from aac.domain.history import History
+from aac.storage.base import HistoryStore
+
+
+@dataclass(frozen=True)
+class FlushStats:
+    """
+    Write-behind persistence metrics.
+
+    Latencies are wall-clock seconds spent in the wrapped store's save().
+    """
+
+    flushes: int = 0
+    saves: int = 0
+    coalesced: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.flushes if self.flushes else 0.0
+
+
+class WriteBehindStore(HistoryStore):
+    """
+    Asynchronous, coalescing wrapper around any HistoryStore.
+
+    save() only marks the history dirty and returns immediately; a
+    background thread persists it through the wrapped store once
+    `max_pending` saves have accumulated or `interval` seconds have
+    passed, whichever comes first. Any number of saves between two
+    flushes cost a single write.
+
+    Usage:
+        with WriteBehindStore(JsonHistoryStore(path)) as store:
+            history = store.load()
+            ...
+            store.save(history)   # non-blocking
+        # pending state is flushed on exit
+
+    Design notes:
+        - Durability and atomicity come from the wrapped store
+          (JsonHistoryStore writes via temp file + fsync + rename)
+        - flush() persists synchronously; close() flushes and stops
+          the background thread
+        - A failure in the background flush is re-raised by the next
+          flush() or close() instead of being lost, unless a later
+          flush has persisted the state successfully since
+        - The wrapped store's save() runs on the flusher thread, so it
+          must not be bound to the thread that created it (all
+          bundled stores, including SqliteHistoryStore, qualify)
+        - The history is read from the flusher thread; with heavy
+          concurrent recording use ConcurrentHistory
+    """
+
+    def __init__(
+        self,
+        store: HistoryStore,
+        *,
+        max_pending: int = 100,
+        interval: float = 1.0,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self._store = store
+        self._max_pending = max_pending
+        self._interval = interval
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty: History | None = None
+        self._pending = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._stats = FlushStats()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="aac-write-behind",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def stats(self) -> FlushStats:
+        """Current flush metrics."""
+        return self._stats
+
+    # ------------------------------------------------------------
+    # HistoryStore
+    # ------------------------------------------------------------
+
+    def load(self) -> History:
+        return self._store.load()
+
+    def save(self, history: History) -> None:
+        """
+        Schedule history for persistence (non-blocking).
+        """
+        with self._cond:
+            if self._closed:
+                raise ValueError("store is closed")
+
+            self._dirty = history
+            self._pending += 1
+            self._stats = dataclasses.replace(self._stats, saves=self._stats.saves + 1)
+
+            if self._pending >= self._max_pending:
+                self._cond.notify()
+
+    # ------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------
+
+    def flush(self) -> None:
+        """
+        Persist pending state now and surface background failures.
+        """
+        self._flush()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Flush pending state and stop the background thread.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> WriteBehindStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        # After a failed flush, wait a full interval before retrying
+        backoff = False
+
+        while True:
+            with self._cond:
+                if not self._closed and (backoff or self._pending < self._max_pending):
+                    self._cond.wait(self._interval)
+                if self._closed:
+                    return
+
+            try:
+                self._flush()
+                backoff = False
+            except Exception as exc:
+                with self._cond:
+                    self._error = exc
+                backoff = True
+
+    def _flush(self) -> None:
+        with self._write_lock:
+            with self._cond:
+                history = self._dirty
+                pending = self._pending
+                self._dirty = None
+                self._pending = 0
+
+            if history is None:
+                return
+
+            start = perf_counter()
+            try:
+                self._store.save(history)
+            except BaseException:
+                with self._cond:
+                    # Keep newer saves; otherwise retry this one later
+                    if self._dirty is None:
+                        self._dirty = history
+                        self._pending += pending
+                raise
+            latency = perf_counter() - start
+
+            with self._cond:
+                # Everything pending is now persisted: earlier failures
+                # no longer describe the store's state
+                self._error = None
+                stats = self._stats
+                self._stats = dataclasses.replace(
+                    stats,
+                    flushes=stats.flushes + 1,
+                    coalesced=stats.coalesced + pending - 1,
+                    last_latency=latency,
+                    max_latency=max(stats.max_latency, latency),
+                    total_latency=stats.total_latency + latency,
+                )
+
+    def _raise_error(self) -> None:
+        with self._cond:
+            error = self._error
+            self._error = None
+
+        if error is not None:
+            raise error
+
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from aac.cli.main import main
+from aac.storage.binary_store import BinaryHistoryStore
+from aac.storage.json_store import JsonHistoryStore
+from aac.storage.shared_json_store import SharedJsonHistoryStore
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["aac", *args])
+    main()
+
+
+def _seed(path: Path) -> None:
+    store = JsonHistoryStore(path)
+    history = store.load()
+    history.record("git com", "commit")
+    history.record("he", "hello")
+    store.save(history)
+
+
+def test_history_convert_json_to_binary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "h.json"
+    target = tmp_path / "h.bin"
+    _seed(source)
+
+    _run(monkeypatch, "history", "convert", str(source), str(target))
+
+    assert BinaryHistoryStore(target).load().snapshot() == (
+        JsonHistoryStore(source).load().snapshot()
+    )
+
+
+def test_history_rekey_to_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "h.json"
+    target = tmp_path / "rekeyed.json"
+    _seed(source)
+
+    _run(monkeypatch, "history", "rekey", str(source), str(target))
+
+    assert json.loads(target.read_text()) == {"com": {"commit": 1}, "he": {"hello": 1}}
+
+
+def test_history_rekey_in_place_replaces_shared_store(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "h.json"
+    _seed(path)
+
+    _run(monkeypatch, "history", "rekey", str(path), str(path), "--to", "shared")
+
+    # Migrations overwrite the target instead of merging into it
+    assert SharedJsonHistoryStore(path).load().snapshot() == {
+        "com": {"commit": 1},
+        "he": {"hello": 1},
+    }
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+from aac.domain.compact_history import CompactHistory
+from aac.domain.history import History
+from aac.presets import get_preset
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _fill(history: History) -> None:
+    history.record("he", "hello", timestamp=T0)
+    history.record("he", "help", timestamp=T0 + timedelta(minutes=1))
+    history.record("wo", "world", timestamp=T0 + timedelta(minutes=2))
+    history.record("he", "hello", timestamp=T0 + timedelta(minutes=3))
+
+
+def test_compact_history_matches_reference() -> None:
+    reference = History()
+    compact = CompactHistory()
+    _fill(reference)
+    _fill(compact)
+
+    assert compact.entries() == reference.entries()
+    assert compact.entries_for_prefix("he") == reference.entries_for_prefix("he")
+    assert compact.snapshot() == reference.snapshot()
+    assert compact.count("hello") == 2
+
+    since = T0 + timedelta(minutes=1)
+    assert compact.counts_for_prefix_since("he", since) == {"help": 1, "hello": 1}
+    assert compact.entries_for_prefix("missing") == ()
+
+
+def test_compact_history_normalizes_timestamps_to_utc() -> None:
+    history = CompactHistory()
+    local = datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=-5)))
+
+    history.record("he", "hello", timestamp=local)
+
+    stored = history.entries()[0].timestamp
+    assert stored == local
+    assert stored.tzinfo == timezone.utc
+
+
+def test_compact_history_replace_and_presets() -> None:
+    source = History()
+    _fill(source)
+
+    compact = CompactHistory()
+    compact.record("x", "y")
+    compact.replace(source)
+
+    assert compact.entries() == source.entries()
+
+    engine = get_preset("default").build(compact)
+    engine.record_selection("he", "hero")
+
+    assert compact.count("hero") >= 1
+    assert "hero" in [s.value for s in engine.suggest("he")]
+
+
+def test_compact_history_postings_share_interned_values() -> None:
+    history = CompactHistory()
+    for minutes in range(3):
+        # A fresh string object per event, as a deserializer produces
+        history.record("he", "".join(["hel", "lo"]), timestamp=T0 + timedelta(minutes=minutes))
+
+    values = history._postings["he"].values
+    assert all(v is values[0] for v in values)
+    assert history.counts_for_prefix_since("he", T0) == {"hello": 3}
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from aac.domain.concurrent_history import ConcurrentHistory
+from aac.domain.history import History, HistoryEntry, RetentionPolicy
+from aac.presets import get_preset
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _fill(history: History) -> None:
+    for i, (prefix, value) in enumerate(
+        [("he", "hello"), ("wo", "world"), ("he", "help"), ("x", "xyz"), ("he", "hello")]
+    ):
+        history.record(prefix, value, timestamp=T0 + timedelta(minutes=i))
+
+
+def test_concurrent_history_matches_reference() -> None:
+    reference = History()
+    history = ConcurrentHistory(shards=4)
+    _fill(reference)
+    _fill(history)
+
+    assert history.entries() == reference.entries()
+    assert history.snapshot() == reference.snapshot()
+    assert history.counts_for_prefix("he") == reference.counts_for_prefix("he")
+    assert history.count("hello") == 2
+    assert history.counts_for_prefix_since("he", T0 + timedelta(minutes=2)) == {
+        "help": 1,
+        "hello": 1,
+    }
+
+
+def test_concurrent_history_replace_preserves_order() -> None:
+    source = History(retention=RetentionPolicy(max_events=3))
+    _fill(source)
+
+    history = ConcurrentHistory(shards=3)
+    history.record("old", "value")
+    history.replace(source)
+
+    assert history.entries() == source.entries()
+    assert history.snapshot() == source.snapshot()
+    assert sum(b.count for b in history.buckets()) == 2
+
+
+def test_concurrent_history_replace_reads_source_once() -> None:
+    class _Counting(History):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reads = 0
+
+        def entries(self) -> Sequence[HistoryEntry]:
+            self.reads += 1
+            return super().entries()
+
+    source = _Counting()
+    _fill(source)
+
+    history = ConcurrentHistory(shards=8)
+    history.replace(source)
+
+    assert source.reads == 1
+    assert history.entries() == source.entries()
+    assert history.counts_for_prefix("he") == {"hello": 2, "help": 1}
+
+    # Sequence numbers continue after the loaded entries
+    history.record("x", "xylophone", timestamp=T0 + timedelta(hours=1))
+    assert history.entries()[-1].value == "xylophone"
+
+
+def test_concurrent_records_are_not_lost() -> None:
+    history = ConcurrentHistory(shards=8)
+    engine = get_preset("default").build(history)
+    per_thread = 500
+
+    def worker(n: int) -> None:
+        for i in range(per_thread):
+            history.record(f"p{i % 7}", f"v{n}")
+            engine.suggest(f"p{i % 7}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(history.entries()) == 6 * per_thread
+    assert sum(history.count(f"v{n}") for n in range(6)) == 6 * per_thread
+
+
+def test_concurrent_history_ages_out_idle_shards() -> None:
+    history = ConcurrentHistory(
+        shards=2,
+        retention=RetentionPolicy(max_age=timedelta(hours=1), batch_size=8),
+    )
+    idle = "he"
+    busy = next(p for p in ("wo", "x", "y", "z", "ab", "cd") if history._shard(p) is not history._shard(idle))
+
+    history.record(idle, "hello", timestamp=T0)
+    for i in range(4):
+        history.record(busy, "world", timestamp=T0 + timedelta(hours=2, minutes=i))
+
+    # The idle shard's event is past the global cutoff and rolled up
+    assert history.entries_for_prefix(idle) == ()
+    assert history.counts_for_prefix(idle) == {"hello": 1}
+    assert sum(b.count for b in history.buckets_for_prefix(idle)) == 1
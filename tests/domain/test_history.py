@@ -31,3 +31,52 @@ def test_history_counts_by_prefix() -> None:
         "hello": 2,
         "help": 1,
     }
+
+
+def test_history_count_across_prefixes() -> None:
+    history = History()
+
+    history.record("he", "hello")
+    history.record("h", "hello")
+    history.record("he", "help")
+
+    assert history.count("hello") == 2
+    assert history.count("help") == 1
+    assert history.count("missing") == 0
+
+
+def test_history_counts_are_isolated_copies() -> None:
+    history = History()
+    history.record("he", "hello")
+
+    counts = history.counts_for_prefix("he")
+    counts["hello"] = 99
+
+    assert history.counts_for_prefix("he") == {"hello": 1}
+    assert history.counts_for_prefix("missing") == {}
+
+
+def test_history_snapshot_matches_entries() -> None:
+    history = History()
+
+    history.record("he", "hello")
+    history.record("he", "hello")
+    history.record("wo", "world")
+
+    assert history.snapshot() == {
+        "he": {"hello": 2},
+        "wo": {"world": 1},
+    }
+
+
+def test_history_replace_copies_indexes() -> None:
+    source = History()
+    source.record("he", "help")
+
+    target = History()
+    target.record("wo", "world")
+    target.replace(source)
+
+    assert target.snapshot() == {"he": {"help": 1}}
+    assert target.count("world") == 0
+    assert target.count("help") == 1
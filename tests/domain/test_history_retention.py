@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aac.domain.compact_history import CompactHistory
+from aac.domain.history import DAILY, History, RetentionPolicy
+from aac.domain.types import ScoredSuggestion, Suggestion
+from aac.ranking.decay import DecayFunction, DecayRanker
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _fill(history: History, n: int = 10) -> None:
+    for i in range(n):
+        value = "hello" if i % 2 else "help"
+        history.record("he", value, timestamp=T0 + timedelta(minutes=20 * i))
+
+
+@pytest.mark.parametrize("cls", [History, CompactHistory])
+def test_max_events_rolls_up_and_keeps_counts_exact(cls: type[History]) -> None:
+    reference = History()
+    history = cls(retention=RetentionPolicy(max_events=4))
+    _fill(reference)
+    _fill(history)
+
+    assert len(history.entries()) == 4
+    assert history.entries() == reference.entries()[-4:]
+    assert sum(b.count for b in history.buckets()) == 6
+
+    assert history.counts_for_prefix("he") == reference.counts_for_prefix("he")
+    assert history.snapshot() == reference.snapshot()
+    assert history.count("hello") == reference.count("hello")
+
+
+def test_max_age_rolls_up_into_daily_buckets() -> None:
+    history = History(
+        retention=RetentionPolicy(max_age=timedelta(hours=1), rollup=DAILY)
+    )
+    _fill(history)
+
+    newest = T0 + timedelta(minutes=180)
+    assert all(e.timestamp >= newest - timedelta(hours=1) for e in history.entries())
+    assert {b.start for b in history.buckets()} == {T0}
+
+    # Buckets count toward windows starting at or before the bucket start
+    assert history.counts_for_prefix_since("he", T0) == {"help": 5, "hello": 5}
+
+
+def test_compaction_is_incremental() -> None:
+    history = History(
+        retention=RetentionPolicy(max_age=timedelta(hours=1), batch_size=2)
+    )
+    for _ in range(10):
+        history.record("he", "hello", timestamp=T0)
+
+    history.record("he", "help", timestamp=T0 + DAILY)
+
+    # Only batch_size evictions happen per record()
+    assert len(history.entries()) == 9
+    assert history.compact() == 8
+    assert [e.value for e in history.entries()] == ["help"]
+
+
+def test_replace_applies_retention() -> None:
+    history = History()
+    _fill(history)
+
+    bounded = History(retention=RetentionPolicy(max_events=2))
+    bounded.replace(history)
+
+    assert len(bounded.entries()) == 2
+    assert bounded.snapshot() == history.snapshot()
+
+
+def test_decay_scores_unaffected_by_rollup() -> None:
+    now = T0 + timedelta(hours=4)
+    decay = DecayFunction(half_life_seconds=3600)
+    suggestions = [
+        ScoredSuggestion(Suggestion("hello"), 0.0),
+        ScoredSuggestion(Suggestion("help"), 0.0),
+    ]
+
+    full = History()
+    bounded = History(retention=RetentionPolicy(max_events=1))
+    full_ranker = DecayRanker(full, decay, now=now)
+    bounded_ranker = DecayRanker(bounded, decay, now=now)
+    _fill(full)
+    _fill(bounded)
+
+    expected = full_ranker.explain("he", suggestions)
+    actual = bounded_ranker.explain("he", suggestions)
+
+    for e, a in zip(expected, actual, strict=True):
+        assert math.isclose(e.history_boost, a.history_boost, rel_tol=1e-9)
+
+
+def test_retention_policy_validation() -> None:
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_events=-1)
+
+    with pytest.raises(ValueError):
+        RetentionPolicy(rollup=timedelta(0))
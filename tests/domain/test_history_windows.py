@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aac.domain.compact_history import CompactHistory
+from aac.domain.concurrent_history import ConcurrentHistory
+from aac.domain.history import History, RetentionPolicy
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _brute(history: History, prefix: str, start: datetime, end: datetime) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for e in history.entries():
+        if e.prefix == prefix and start <= e.timestamp < end:
+            counts[e.value] = counts.get(e.value, 0) + 1
+    return counts
+
+
+@pytest.mark.parametrize("cls", [History, CompactHistory])
+def test_window_queries_match_brute_force(cls: type[History]) -> None:
+    rng = random.Random(7)
+    history = cls()
+
+    # Mostly in-order timestamps with some late arrivals
+    for i in range(500):
+        offset = i if rng.random() > 0.1 else rng.randrange(0, i + 1)
+        history.record(
+            rng.choice(["he", "wo"]),
+            rng.choice(["hello", "help", "hero"]),
+            timestamp=T0 + timedelta(seconds=offset),
+        )
+
+    for _ in range(50):
+        a, b = sorted(rng.sample(range(520), 2))
+        start = T0 + timedelta(seconds=a)
+        end = T0 + timedelta(seconds=b)
+
+        expected = _brute(history, "he", start, end)
+
+        assert history.counts_for_prefix_between("he", start, end) == expected
+        assert history.total_for_prefix_between("he", start, end) == sum(expected.values())
+        assert history.counts_for_prefix_since("he", start) == _brute(
+            history, "he", start, T0 + timedelta(days=1)
+        )
+
+
+def test_window_queries_include_rolled_up_buckets() -> None:
+    history = History(retention=RetentionPolicy(max_events=2))
+    for minutes in (0, 10, 70, 80, 90):
+        history.record("he", "hello", timestamp=T0 + timedelta(minutes=minutes))
+
+    # Raw: 80, 90. Buckets: T0 (x2), T0+1h (x1)
+    assert history.counts_for_prefix_since("he", T0) == {"hello": 5}
+    assert history.total_for_prefix_between("he", T0 + timedelta(hours=1), T0 + timedelta(hours=2)) == 3
+    assert history.counts_for_prefix_between("he", T0, T0 + timedelta(minutes=85)) == {"hello": 4}
+
+
+def test_window_queries_require_aware_datetimes() -> None:
+    history = History()
+
+    with pytest.raises(ValueError):
+        history.counts_for_prefix_between("he", datetime(2024, 1, 1), T0)
+
+
+@pytest.mark.parametrize("cls", [History, CompactHistory, ConcurrentHistory])
+def test_entries_for_prefix_are_served_oldest_first(cls: type[History]) -> None:
+    history = cls(retention=RetentionPolicy(max_events=40, batch_size=1))
+    rng = random.Random(3)
+
+    for i in range(120):
+        offset = i if rng.random() > 0.2 else rng.randrange(0, i + 1)
+        history.record(rng.choice(["he", "wo"]), f"v{i}", timestamp=T0 + timedelta(seconds=offset))
+
+    for prefix in ("he", "wo", "missing"):
+        expected = sorted(
+            (e for e in history.entries() if e.prefix == prefix),
+            key=lambda e: e.timestamp,
+        )
+        assert list(history.entries_for_prefix(prefix)) == expected
+
+
+def test_entries_for_prefix_does_not_scan_the_log() -> None:
+    history = History()
+    history.record("he", "hello", timestamp=T0)
+    history.record("wo", "world", timestamp=T0)
+
+    history._entries.clear()
+
+    assert [e.value for e in history.entries_for_prefix("he")] == ["hello"]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from aac.domain.history import History
+from aac.domain.keys import bounded, casefold, chain, last_token, parse_key, rekey
+from aac.presets import get_preset
+
+
+def test_normalizers() -> None:
+    assert last_token("  git commit --am") == "--am"
+    assert last_token("   ") == ""
+    assert casefold("HeLLo") == "hello"
+    assert bounded(3)("abcdef") == "def"
+    assert chain(last_token, casefold)("git HE") == "he"
+
+
+def test_parse_key_spec() -> None:
+    key = parse_key("last-token, casefold, bounded=2")
+    assert key("say HELLO") == "lo"
+
+    with pytest.raises(ValueError):
+        parse_key("nope")
+
+
+def test_rekey_merges_colliding_prefixes() -> None:
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    history = History()
+    history.record("print he", "hello", timestamp=ts)
+    history.record("he", "hello", timestamp=ts)
+    history.record_bulk("say he", "help", 2, timestamp=ts)
+    history.record("   ", "nothing", timestamp=ts)
+
+    migrated = rekey(history, last_token)
+
+    assert migrated.snapshot() == {"he": {"help": 2, "hello": 2}}
+    assert [e.timestamp for e in migrated.entries()] == [ts, ts]
+
+
+def test_engine_records_and_queries_last_token() -> None:
+    engine = get_preset("default").build(History())
+
+    for _ in range(10):
+        engine.record_selection("echo he", "helium")
+
+    assert set(engine.history.snapshot()) == {"he"}
+
+    values = [s.value for s in engine.suggest("cat he")]
+    assert values.index("helium") < values.index("hero")
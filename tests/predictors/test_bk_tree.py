@@ -0,0 +1,71 @@
+import random
+import string
+
+from aac.predictors.bk_tree import BKTree, _BKNode
+from aac.predictors.edit_distance import LinearIndex, levenshtein
+
+
+def _vocabulary(seed: int, n: int) -> set[str]:
+    rng = random.Random(seed)
+    return {
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        for _ in range(n)
+    }
+
+
+def test_bk_tree_prunes_distance_evaluations() -> None:
+    calls = 0
+
+    def counting(a: str, b: str) -> int:
+        nonlocal calls
+        calls += 1
+        return levenshtein(a, b)
+
+    words = _vocabulary(5, 800)
+    tree = BKTree(words, distance=counting)
+
+    calls = 0
+    assert tree.search("abcdefgh", 1) == LinearIndex(words).search("abcdefgh", 1)
+
+    assert calls < len(words) / 2
+
+
+def test_bk_tree_only_descends_edges_within_triangle_bound() -> None:
+    words = _vocabulary(8, 300)
+    tree = BKTree(words, distance=levenshtein)
+
+    # node word -> (parent word, edge label)
+    parents: dict[str, tuple[str, int]] = {}
+    stack: list[_BKNode] = [] if tree._root is None else [tree._root]
+    while stack:
+        node = stack.pop()
+        for label, child in node.children.items():
+            parents[child.word] = (node.word, label)
+            stack.append(child)
+
+    evaluated: list[str] = []
+
+    def recording(query: str, word: str) -> int:
+        evaluated.append(word)
+        return levenshtein(query, word)
+
+    tree._distance = recording
+    query, k = "abcdefg", 2
+    tree.search(query, k)
+
+    # |d(q, parent) - d(parent, child)| <= d(q, child) <= k
+    for word in evaluated:
+        if word in parents:
+            parent, label = parents[word]
+            assert abs(levenshtein(query, parent) - label) <= k
+
+
+def test_bk_tree_remove_and_readd_moves_word_last() -> None:
+    tree = BKTree(["hello", "help", "hell"], distance=levenshtein)
+
+    assert tree.remove("hello")
+    assert not tree.remove("hello")
+    assert tree.search("hell", 1) == [("help", 1), ("hell", 0)]
+
+    assert tree.add("hello")
+    assert tree.search("hell", 1) == [("help", 1), ("hell", 0), ("hello", 1)]
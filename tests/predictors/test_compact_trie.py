@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from aac.predictors.compact_trie import CompactTrie
+from aac.predictors.trie import Trie, TriePrefixPredictor
+
+
+def test_compact_trie_matches_trie_find_prefix() -> None:
+    rng = random.Random(5)
+
+    for _ in range(100):
+        words = [
+            "".join(rng.choice("abcé") for _ in range(rng.randint(0, 7)))
+            for _ in range(rng.randint(0, 60))
+        ]
+        trie = Trie(words)
+        compact = CompactTrie(words)
+
+        assert len(compact) == len(set(words))
+        assert all(w in compact for w in words)
+
+        for _ in range(20):
+            prefix = "".join(rng.choice("abcé") for _ in range(rng.randint(0, 4)))
+            limit = rng.randint(1, 30)
+            assert compact.find_prefix(prefix, limit=limit) == trie.find_prefix(prefix, limit=limit)
+
+
+def test_compact_trie_shares_suffixes() -> None:
+    compact = CompactTrie(["walking", "talking", "walked", "talked"])
+
+    # w/t -> "alk" -> {"ing", "ed"}: suffix states are shared
+    assert len(compact._terminal) < 6
+    assert compact.find_prefix("wal", limit=10) == ["walked", "walking"]
+    assert "walk" not in compact
+
+
+def test_trie_prefix_predictor_compact_backend() -> None:
+    words = ["hello", "help", "helium", "world"]
+
+    plain = TriePrefixPredictor(words).predict("he")
+    compact = TriePrefixPredictor(words, compact=True).predict("he")
+
+    assert compact == plain
+
+    with pytest.raises(ValueError):
+        TriePrefixPredictor({"hello": 1}, compact=True)
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from aac.predictors.edit_distance import (
+    EditDistancePredictor,
+    LinearIndex,
+    bounded_levenshtein,
+    build_index,
+    levenshtein,
+)
+
+INDEXES = ["bktree", "symspell", "symspell=3", "symspell=4", "numpy"]
+
+
+def _index_spec(spec: str) -> str:
+    if spec == "numpy":
+        # Without NumPy the spec silently falls back to a linear scan
+        pytest.importorskip("numpy")
+    return spec
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice("abcé") for _ in range(rng.randint(0, 8)))
+
+
+def _reference_levenshtein(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        curr = [i]
+        for j, cb in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = curr
+    return prev[-1]
+
+
+def test_levenshtein_matches_reference_dp() -> None:
+    rng = random.Random(2)
+
+    for _ in range(3000):
+        a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+        expected = _reference_levenshtein(a, b)
+
+        assert levenshtein(a, b) == expected
+
+        k = rng.randint(0, 5)
+        assert bounded_levenshtein(a, b, k) == (expected if expected <= k else k + 1)
+
+
+def test_levenshtein_handles_long_strings() -> None:
+    a = "kitten" * 30
+    b = "sitting" * 30
+
+    assert levenshtein(a, b) == _reference_levenshtein(a, b)
+    assert bounded_levenshtein(a, b, 3) == 4
+
+
+def test_edit_distance_add_and_remove_words() -> None:
+    predictor = EditDistancePredictor(["hello", "hello"], max_distance=1)
+
+    assert [r.value for r in predictor.predict("helo")] == ["hello"]
+
+    assert predictor.add_word("halo")
+    assert not predictor.add_word("halo")
+    assert [r.value for r in predictor.predict("helo")] == ["hello", "halo"]
+
+    assert predictor.remove_word("hello")
+    assert not predictor.remove_word("hello")
+    assert [r.value for r in predictor.predict("helo")] == ["halo"]
+
+
+def test_edit_distance_prefix_mode_completes_typos() -> None:
+    vocabulary = ["hello", "helium", "help", "world", "hero", "helots"]
+
+    word_mode = EditDistancePredictor(vocabulary, max_distance=1)
+    prefix_mode = EditDistancePredictor(vocabulary, max_distance=1, mode="prefix")
+
+    assert "helium" not in [r.value for r in word_mode.predict("helo")]
+
+    results = prefix_mode.predict("helo")
+    assert [(r.value, r.score) for r in results] == [
+        ("helots", 1.0),
+        ("helium", 0.5),
+        ("hello", 0.5),
+        ("help", 0.5),
+        ("hero", 0.5),
+    ]
+
+
+def test_edit_distance_prefix_mode_updates_and_limits() -> None:
+    predictor = EditDistancePredictor(
+        ["hello", "help"], max_distance=1, mode="prefix", max_results=1
+    )
+
+    assert predictor.add_word("halo")
+    assert predictor.remove_word("hello")
+
+    assert [r.value for r in predictor.predict("hal")] == ["halo"]
+
+
+def test_edit_distance_prefix_mode_rejects_index() -> None:
+    with pytest.raises(ValueError):
+        EditDistancePredictor(["hello"], mode="prefix", index="bktree")
+
+
+@pytest.mark.parametrize("spec", INDEXES)
+def test_candidate_index_matches_linear_scan(spec: str) -> None:
+    rng = random.Random(spec)
+    words = [_word(rng) for _ in range(120)]
+
+    linear = LinearIndex(words)
+    index = build_index(_index_spec(spec), words, max_distance=2)
+
+    for step in range(100):
+        # Occasional long words exercise growth of fixed-width layouts
+        word = _word(rng) + "x" * rng.choice([0, 0, 0, 12])
+        if step % 3 == 0:
+            assert index.add(word) == linear.add(word)
+        elif step % 3 == 1:
+            assert index.remove(word) == linear.remove(word)
+
+        query = _word(rng)
+        # k=3 exceeds the built distance
+        for k in range(-1, 4):
+            assert index.search(query, k) == linear.search(query, k)
+
+    assert len(index) == len(linear)
+
+
+@pytest.mark.parametrize("spec", INDEXES)
+def test_edit_distance_index_matches_linear_predictor(spec: str) -> None:
+    vocabulary = ["hello", "help", "helium", "hero", "hex", "heap", "world"]
+
+    linear = EditDistancePredictor(vocabulary)
+    indexed = EditDistancePredictor(vocabulary, index=_index_spec(spec))
+
+    for query in ["helo", "hepl", "wrld", "he", "xyz"]:
+        assert indexed.predict(query) == linear.predict(query)
+
+
+def test_edit_distance_rejects_unknown_index() -> None:
+    with pytest.raises(ValueError):
+        EditDistancePredictor(["hello"], index="nope")
@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from aac.predictors.numpy_index import NumpyIndex  # noqa: E402
+
+
+def test_numpy_index_encodes_vocabulary_matrix() -> None:
+    index = NumpyIndex(["hé", "hello", "hé"])
+    codes, lengths, alive = index._state
+
+    # Deduplicated, padded to the longest word, one code point per char
+    assert codes.shape == (16, 5)
+    assert lengths[:2].tolist() == [2, 5]
+    assert alive[:3].tolist() == [True, True, False]
+    assert index.search("he", 1) == [("hé", 1)]
+
+
+def test_numpy_index_grows_rows_and_width() -> None:
+    index = NumpyIndex(["ab"])
+
+    for i in range(16):
+        index.add("a" * (i + 3))
+
+    codes, lengths, _ = index._state
+    assert codes.shape == (32, 18)
+    assert codes[0, :2].tolist() == [ord("a"), ord("b")]
+    assert index.search("a" * 18, 0) == [("a" * 18, 0)]
+    assert index.search("aa", 1) == [("ab", 1), ("aaa", 1)]
+
+
+def test_numpy_index_remove_keeps_rows_in_place() -> None:
+    index = NumpyIndex(["hello", "help", "hell"])
+
+    assert index.remove("help")
+    assert not index.remove("help")
+
+    _, _, alive = index._state
+    assert alive[:3].tolist() == [True, False, True]
+    assert index.search("hel", 1) == [("hell", 1)]
+
+    # Re-added words take a new row at the end
+    assert index.add("help")
+    assert index.search("hel", 1) == [("hell", 1), ("help", 1)]
+
+
+def test_numpy_index_handles_empty_and_out_of_range_queries() -> None:
+    assert NumpyIndex().search("abc", 2) == []
+
+    index = NumpyIndex(["abc"])
+    assert index.search("abcdefgh", 2) == []
+    assert index.search("", 3) == [("abc", 3)]
+    assert index.search("abc", -1) == []
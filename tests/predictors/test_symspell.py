@@ -0,0 +1,53 @@
+import pytest
+
+from aac.predictors.edit_distance import levenshtein
+from aac.predictors.symspell import SymSpellIndex, deletes
+
+
+class _Counting:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, a: str, b: str) -> int:
+        self.calls += 1
+        return levenshtein(a, b)
+
+
+def test_deletes_enumerates_variants() -> None:
+    assert deletes("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert deletes("ab", 5) == {"ab", "a", "b", ""}
+
+
+def test_symspell_rejects_short_prefix() -> None:
+    with pytest.raises(ValueError):
+        SymSpellIndex(distance=levenshtein, max_distance=2, prefix_length=2)
+
+
+def test_symspell_variants_per_word_are_bounded_by_prefix_length() -> None:
+    index = SymSpellIndex(["abcdefghijklmnop"], distance=levenshtein)
+
+    # 1 + C(7, 1) + C(7, 2) for the defaults, whatever the word length
+    assert len(index._variants) == 29
+
+    index.remove("abcdefghijklmnop")
+    assert index._variants == {}
+
+
+def test_symspell_verifies_only_shared_variant_candidates() -> None:
+    words = ["hello", "help", "world", "word", "sword", "zebra"]
+    distance = _Counting()
+    index = SymSpellIndex(words, distance=distance, max_distance=2)
+
+    distance.calls = 0
+    assert index.search("wrld", 1) == [("world", 1)]
+    assert distance.calls == 3  # world, word, sword
+
+    # Beyond the built max_distance every length-compatible word is scanned
+    distance.calls = 0
+    assert index.search("wrld", 3) == [
+        ("help", 3),
+        ("world", 1),
+        ("word", 2),
+        ("sword", 3),
+    ]
+    assert distance.calls == len(words)
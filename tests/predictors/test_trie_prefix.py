@@ -1,5 +1,11 @@
+import random
+import threading
+
+import pytest
+
 from aac.domain.types import CompletionContext
-from aac.predictors.trie import TriePrefixPredictor
+from aac.predictors.edit_distance import levenshtein
+from aac.predictors.trie import ScoredTrie, Trie, TriePrefixPredictor
 
 
 def test_trie_prefix_basic_completion() -> None:
@@ -34,3 +40,186 @@ def test_trie_prefix_explanation_source() -> None:
     assert explanation is not None
     assert explanation.source == "trie_prefix"
     assert explanation.score == 1.0
+
+
+def test_scored_trie_matches_brute_force_top_k() -> None:
+    rng = random.Random(3)
+    scores = {
+        "".join(rng.choice("abc") for _ in range(rng.randint(1, 6))): float(rng.randint(0, 20))
+        for _ in range(200)
+    }
+    trie = ScoredTrie(scores, k=5)
+
+    def expected(prefix: str) -> list[tuple[str, float]]:
+        ranked = sorted(
+            ((w, s) for w, s in scores.items() if w.startswith(prefix)),
+            key=lambda ws: (-ws[1], ws[0]),
+        )
+        return ranked[:5]
+
+    for _ in range(300):
+        word = rng.choice(list(scores))
+        if rng.random() < 0.5:
+            trie.increment(word, 3.0)
+            scores[word] += 3.0
+        else:
+            new = float(rng.randint(0, 20))
+            trie.set(word, new)
+            scores[word] = new
+
+        prefix = word[: rng.randint(0, len(word))]
+        assert trie.top(prefix) == expected(prefix)
+
+
+def test_trie_prefix_weighted_returns_best_ranked() -> None:
+    predictor = TriePrefixPredictor(
+        {"hello": 10, "help": 50, "helium": 1, "hero": 30, "he": 99},
+        max_results=2,
+    )
+
+    results = predictor.predict(CompletionContext("he"))
+
+    assert [(r.value, r.score) for r in results] == [("help", 50.0), ("hero", 30.0)]
+    assert results[0].explanation is not None
+    assert results[0].explanation.confidence == 50 / 99
+
+
+def test_trie_prefix_weighted_learns_from_selection() -> None:
+    predictor = TriePrefixPredictor({"hello": 2, "help": 1}, max_results=1)
+
+    predictor.record(CompletionContext("he"), "help")
+    predictor.record(CompletionContext("he"), "help")
+
+    assert [r.value for r in predictor.predict("he")] == ["help"]
+
+
+def test_trie_iter_prefix_is_lazy_and_ordered() -> None:
+    trie = Trie(["help", "he", "hero", "hello", "helium", "abc"])
+
+    matches = trie.iter_prefix("he")
+
+    assert next(matches) == "he"
+    assert list(matches) == ["helium", "hello", "help", "hero"]
+    assert list(trie.iter_prefix("x")) == []
+
+
+def test_trie_traversal_handles_words_beyond_recursion_limit() -> None:
+    deep = "a" * 5000
+    trie = Trie([deep, "ab"])
+
+    assert trie.find_prefix("a", limit=10) == [deep, "ab"]
+    assert trie.find_prefix("a" * 4999, limit=10) == [deep]
+
+
+def test_trie_insert_after_freeze_keeps_order() -> None:
+    trie = Trie(["hello", "hero"])
+
+    trie.insert("help")
+    trie.insert("ha")
+
+    assert trie.find_prefix("h", limit=10) == ["ha", "hello", "help", "hero"]
+    assert trie.find_prefix("h", limit=0) == []
+
+
+def test_trie_remove_prunes_unused_nodes() -> None:
+    trie = Trie(["help", "hello"])
+
+    assert trie.remove("hello")
+    assert not trie.remove("hello")
+    assert not trie.remove("he")
+
+    assert len(trie) == 1
+    assert "hello" not in trie
+    assert trie.find_prefix("hel", limit=10) == ["help"]
+    assert "l" not in trie._root.children["h"].children["e"].children["l"].children
+
+    assert trie.remove("help")
+    assert trie._root.children == {}
+    assert trie.find_prefix("", limit=10) == []
+
+
+def test_trie_updates_do_not_disturb_concurrent_readers() -> None:
+    stable = [f"stable{i:03d}" for i in range(100)]
+    trie = Trie(stable)
+    errors: list[BaseException] = []
+    done = threading.Event()
+
+    def read() -> None:
+        try:
+            while not done.is_set():
+                found = list(trie.iter_prefix("s"))
+                assert set(stable) <= set(found)
+        except BaseException as exc:
+            errors.append(exc)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for i in range(2000):
+        word = f"stable{i % 100:03d}x{i}"
+        trie.insert(word)
+        trie.remove(word)
+    done.set()
+    reader.join()
+
+    assert errors == []
+    assert trie.find_prefix("s", limit=1000) == stable
+
+
+def test_trie_prefix_add_and_remove_words() -> None:
+    predictor = TriePrefixPredictor(["hello"])
+
+    assert predictor.add_word("help")
+    assert not predictor.add_word("help")
+    assert [r.value for r in predictor.predict("he")] == ["hello", "help"]
+
+    assert predictor.remove_word("hello")
+    assert not predictor.remove_word("hello")
+    assert [r.value for r in predictor.predict("he")] == ["help"]
+
+
+def test_trie_prefix_weighted_add_and_remove_words() -> None:
+    predictor = TriePrefixPredictor({"hello": 5, "help": 3})
+
+    assert predictor.add_word("hero")
+    assert not predictor.add_word("help")
+    assert predictor.remove_word("hello")
+
+    results = predictor.predict("he")
+    assert [(r.value, r.score) for r in results] == [("help", 3.0), ("hero", 0.0)]
+
+
+def test_trie_prefix_compact_rejects_updates() -> None:
+    predictor = TriePrefixPredictor(["hello"], compact=True)
+
+    with pytest.raises(ValueError):
+        predictor.add_word("help")
+
+
+def test_scored_trie_remove_updates_cached_tops() -> None:
+    trie = ScoredTrie({"hello": 5, "help": 3, "hero": 1}, k=2)
+
+    assert trie.remove("hello")
+    assert not trie.remove("hello")
+
+    assert len(trie) == 2
+    assert trie.top("") == [("help", 3.0), ("hero", 1.0)]
+    assert trie.top("hell") == []
+
+
+def test_trie_iter_fuzzy_matches_brute_force() -> None:
+    rng = random.Random(9)
+
+    for _ in range(50):
+        words = sorted({
+            "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+            for _ in range(30)
+        })
+        trie = Trie(words)
+        query = "".join(rng.choice("abc") for _ in range(rng.randint(0, 5)))
+
+        for k in range(3):
+            expected = [
+                (w, min(levenshtein(query, w[:i]) for i in range(len(w) + 1)))
+                for w in words
+            ]
+            assert list(trie.iter_fuzzy(query, k)) == [(w, d) for w, d in expected if d <= k]
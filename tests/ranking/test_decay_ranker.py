@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+
+from aac.domain.history import History
+from aac.domain.types import ScoredSuggestion, Suggestion
+from aac.ranking.decay import DecayedCounts, DecayFunction, DecayRanker
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _exact(history: History, decay: DecayFunction, prefix: str) -> dict[str, float]:
+    counts: dict[str, float] = {}
+    for e in history.entries_for_prefix(prefix):
+        counts[e.value] = counts.get(e.value, 0.0) + decay.weight(
+            now=NOW, event_time=e.timestamp
+        )
+    return counts
+
+
+def test_decayed_counts_match_per_event_formula() -> None:
+    decay = DecayFunction(half_life_seconds=3600)
+    history = History()
+    counts = DecayedCounts(decay)
+    history.subscribe(counts)
+
+    # Out-of-order timestamps exercise both accumulator paths
+    for minutes in (600, 5, 240, 0, 90, 3000, 30):
+        history.record("he", "hello", timestamp=NOW - timedelta(minutes=minutes))
+    history.record("he", "help", timestamp=NOW - timedelta(hours=2))
+
+    decayed = counts.at("he", NOW)
+    expected = _exact(history, decay, "he")
+
+    assert decayed is not None
+    assert decayed.keys() == expected.keys()
+    for value, score in expected.items():
+        assert math.isclose(decayed[value], score, rel_tol=1e-9)
+
+
+def test_decayed_counts_defer_future_events() -> None:
+    counts = DecayedCounts(DecayFunction(half_life_seconds=60))
+    counts.observe("he", "hello", NOW + timedelta(seconds=1))
+
+    assert counts.at("he", NOW) is None
+    assert counts.at("wo", NOW) == {}
+
+
+def test_decay_ranker_sees_history_recorded_before_and_after() -> None:
+    history = History()
+    history.record("he", "help", timestamp=NOW - timedelta(hours=1))
+
+    ranker = DecayRanker(
+        history,
+        DecayFunction(half_life_seconds=3600),
+        now=NOW,
+    )
+    history.record("he", "help", timestamp=NOW)
+
+    suggestions = [
+        ScoredSuggestion(Suggestion("hello"), 1.0),
+        ScoredSuggestion(Suggestion("help"), 0.0),
+    ]
+
+    explanations = ranker.explain("he", suggestions)
+    boosts = {e.value: e.history_boost for e in explanations}
+
+    assert math.isclose(boosts["help"], 1.5, rel_tol=1e-9)
+    assert boosts["hello"] == 0.0
+    assert ranker.rank("he", suggestions)[0].value == "help"
+
+
+def test_decay_ranker_clamps_future_events() -> None:
+    history = History()
+    history.record("he", "help", timestamp=NOW + timedelta(hours=1))
+    history.record("he", "help", timestamp=NOW - timedelta(hours=1))
+
+    ranker = DecayRanker(
+        history,
+        DecayFunction(half_life_seconds=3600),
+        now=NOW,
+    )
+
+    explanations = ranker.explain("he", [ScoredSuggestion(Suggestion("help"), 0.0)])
+
+    assert math.isclose(explanations[0].history_boost, 1.5, rel_tol=1e-9)
+
+
+def test_decay_ranker_hydrates_prefixes_on_first_read() -> None:
+    decay = DecayFunction(half_life_seconds=3600)
+    history = History()
+    for minutes in (600, 5, 240):
+        history.record("he", "hello", timestamp=NOW - timedelta(minutes=minutes))
+    history.record("wo", "world", timestamp=NOW - timedelta(minutes=10))
+
+    ranker = DecayRanker(history, decay, now=NOW)
+    counts = ranker._counts
+
+    # Nothing is replayed up front
+    assert counts is not None
+    assert counts._acc == {}
+
+    history.record("he", "hello", timestamp=NOW - timedelta(minutes=1))
+    history.record("new", "news", timestamp=NOW - timedelta(minutes=1))
+
+    # A prefix's first event is tracked live; older prefixes wait
+    assert counts._acc.keys() == {"new"}
+
+    decayed = ranker._decayed_counts("he")
+    expected = _exact(history, decay, "he")
+    assert math.isclose(decayed["hello"], expected["hello"], rel_tol=1e-9)
+    assert counts._acc.keys() == {"new", "he"}
+
+    # Hydrated prefixes keep tracking new events
+    history.record("he", "help", timestamp=NOW)
+    assert math.isclose(ranker._decayed_counts("he")["help"], 1.0)
+
+
+def test_decay_ranker_close_unsubscribes() -> None:
+    history = History()
+    history.record("he", "help", timestamp=NOW - timedelta(hours=1))
+
+    ranker = DecayRanker(history, DecayFunction(half_life_seconds=3600), now=NOW)
+    ranker.close()
+    ranker.close()
+
+    assert history._listeners == []
+
+    # Closed rankers still see the full history
+    history.record("he", "help", timestamp=NOW)
+    boost = ranker.explain("he", [ScoredSuggestion(Suggestion("help"), 0.0)])[0]
+    assert math.isclose(boost.history_boost, 1.5, rel_tol=1e-9)
+
+
+def test_decayed_counts_publish_reference_before_values() -> None:
+    counts = DecayedCounts(DecayFunction(half_life_seconds=60))
+
+    class _Racing(dict[str, tuple[float, float]]):
+        # Reads at() as a concurrent reader would, mid-update
+        def __setitem__(self, key: str, slot: tuple[float, float]) -> None:
+            super().__setitem__(key, slot)
+            assert counts.at("he", NOW) is not None
+
+    counts._acc["he"] = _Racing()
+    counts.observe("he", "hello", NOW - timedelta(seconds=1))
+    counts.observe("he", "help", NOW - timedelta(seconds=2))
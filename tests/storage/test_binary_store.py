@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from aac.domain.history import History
+from aac.storage.binary_store import (
+    BinaryHistoryStore,
+    BinarySnapshot,
+    MappedHistory,
+    encode_snapshot,
+)
+from aac.storage.json_store import JsonHistoryStore
+
+
+def _ts(minutes: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+def _history() -> History:
+    history = History()
+    history.record_bulk("he", "help", 4, timestamp=_ts(0))
+    history.record("he", "hello", timestamp=_ts(5))
+    history.record("wo", "world", timestamp=_ts(3))
+    history.record("he", "héllo", timestamp=_ts(1))
+    history.record("wo", "world", timestamp=_ts(9))
+    return history
+
+
+class _Recorder:
+    def __init__(self, history: History) -> None:
+        self._history = history
+
+    def observe(self, prefix: str, value: str, timestamp: datetime, count: int = 1) -> None:
+        self._history.record_bulk(prefix, value, count, timestamp=timestamp)
+
+    def reset(self) -> None:
+        pass
+
+
+def test_binary_store_round_trip(tmp_path: Path) -> None:
+    history = _history()
+    store = BinaryHistoryStore(tmp_path / "history.bin")
+    store.save(history)
+
+    loaded = store.load()
+
+    assert isinstance(loaded, MappedHistory)
+    assert loaded.snapshot() == history.snapshot()
+    assert loaded.entries() == history.entries()
+    assert loaded.buckets() == history.buckets()
+    assert loaded.count("world") == 2
+    assert loaded.counts_for_prefix("he") == history.counts_for_prefix("he")
+    assert loaded.counts_for_prefix_between("he", _ts(0), _ts(2)) == (
+        history.counts_for_prefix_between("he", _ts(0), _ts(2))
+    )
+    assert loaded.total_for_prefix_between("wo", _ts(4), _ts(10)) == 1
+
+
+def test_mapped_history_decodes_only_touched_prefixes() -> None:
+    snapshot = BinarySnapshot(encode_snapshot(_history()))
+    history = MappedHistory(snapshot)
+
+    assert history.counts_for_prefix("wo") == {"world": 2}
+    assert history.counts_for_prefix("missing") == {}
+    assert set(snapshot._blocks) == {"wo", "missing"}
+
+
+def test_mapped_history_merges_new_records() -> None:
+    history = MappedHistory(BinarySnapshot(encode_snapshot(_history())))
+
+    history.record("wo", "world", timestamp=_ts(10))
+    history.record("wo", "work", timestamp=_ts(11))
+
+    assert history.counts_for_prefix("wo") == {"world": 3, "work": 1}
+    assert history.count("world") == 3
+    assert [e.value for e in history.entries_for_prefix("wo")] == ["world", "world", "world", "work"]
+
+
+def test_mapped_history_replays_without_caching_blocks() -> None:
+    snapshot = BinarySnapshot(encode_snapshot(_history()))
+    history = MappedHistory(snapshot)
+    history.record("wo", "work", timestamp=_ts(10))
+
+    replayed = History()
+    history.subscribe(_Recorder(replayed))
+
+    assert snapshot._blocks == {}
+    assert replayed.snapshot() == history.snapshot()
+
+
+def test_binary_snapshot_rejects_foreign_data() -> None:
+    with pytest.raises(ValueError):
+        BinarySnapshot(b"{}" * 32)
+
+
+def test_binary_snapshot_open_rejects_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "history.bin"
+    path.touch()
+
+    with pytest.raises(ValueError, match="not a history snapshot"):
+        BinarySnapshot.open(path)
+
+
+def test_convert_json_to_binary_and_back(tmp_path: Path) -> None:
+    history = History()
+    history.record("he", "hello")
+    history.record("he", "hello")
+    JsonHistoryStore(tmp_path / "a.json").save(history)
+
+    BinaryHistoryStore(tmp_path / "b.bin").save(JsonHistoryStore(tmp_path / "a.json").load())
+    JsonHistoryStore(tmp_path / "c.json").save(BinaryHistoryStore(tmp_path / "b.bin").load())
+
+    assert JsonHistoryStore(tmp_path / "c.json").load().snapshot() == {"he": {"hello": 2}}
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from aac.domain.concurrent_history import ConcurrentHistory
+from aac.domain.history import History
+from aac.domain.types import ScoredSuggestion, Suggestion
+from aac.ranking.decay import DecayFunction, DecayRanker
+from aac.storage.follower import LogFollower
+from aac.storage.log_store import LogHistoryStore
+
+
+def _ts(minutes: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.events = 0
+        self.resets = 0
+
+    def observe(self, prefix: str, value: str, timestamp: datetime, count: int = 1) -> None:
+        self.events += count
+
+    def reset(self) -> None:
+        self.resets += 1
+        self.events = 0
+
+
+def test_follower_applies_only_new_events(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    writer_store = LogHistoryStore(path)
+    writer = writer_store.load()
+    writer.record("he", "hello", timestamp=_ts(0))
+
+    follower = LogFollower(path)
+    counter = _Counter()
+    follower.history.subscribe(counter)
+    assert counter.events == 1
+
+    writer.record("he", "help", timestamp=_ts(1))
+    writer.record_bulk("he", "hello", 3, timestamp=_ts(2))
+
+    assert follower.poll() == 2
+    assert follower.history.counts_for_prefix("he") == {"hello": 4, "help": 1}
+    assert counter.events == 5
+    assert counter.resets == 0
+
+    assert follower.poll() == 0
+    writer_store.close()
+
+
+def test_follower_leaves_partial_line_for_next_poll(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path)
+    store.load()
+    follower = LogFollower(path)
+
+    log = store.log_path()
+    with log.open("a") as f:
+        f.write('["he","hello",1704067200000000]\n["he","hel')
+
+    assert follower.poll() == 1
+
+    with log.open("a") as f:
+        f.write('p",1704067200000000]\n')
+
+    assert follower.poll() == 1
+    assert follower.history.counts_for_prefix("he") == {"hello": 1, "help": 1}
+
+
+def test_follower_rebuilds_after_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    writer_store = LogHistoryStore(path, checkpoint_every=1)
+    writer = writer_store.load()
+
+    follower = LogFollower(path, ConcurrentHistory())
+
+    writer.record("he", "hello", timestamp=_ts(0))
+    writer_store.save(writer)
+    writer.record("he", "hello", timestamp=_ts(1))
+
+    follower.poll()
+    follower.poll()
+
+    assert follower.history.counts_for_prefix("he") == {"hello": 2}
+    writer_store.close()
+
+
+def test_follower_background_polling(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    writer_store = LogHistoryStore(path)
+    writer = writer_store.load()
+
+    history = History()
+    with LogFollower(path, history) as follower:
+        follower.start(interval=0.01)
+        writer.record("he", "hello")
+
+        deadline = time.monotonic() + 5
+        while not history.counts_for_prefix("he") and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert history.counts_for_prefix("he") == {"hello": 1}
+    writer_store.close()
+
+
+def test_follower_serves_reads_while_rebuilding(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    writer_store = LogHistoryStore(path, checkpoint_every=1)
+    writer = writer_store.load()
+    writer.record("he", "hello", timestamp=_ts(0))
+    writer_store.save(writer)
+
+    loading = threading.Event()
+    resume = threading.Event()
+
+    class _SlowHistory(ConcurrentHistory):
+        # Stalls loading while `building` is set, until told to resume
+        def record(self, *args: Any, **kwargs: Any) -> None:
+            if building:
+                loading.set()
+                assert resume.wait(5)
+            super().record(*args, **kwargs)
+
+    building = False
+    follower = LogFollower(path, factory=_SlowHistory)
+    view = follower.history
+    counter = _Counter()
+    view.subscribe(counter)
+
+    writer.record("he", "help", timestamp=_ts(1))
+    writer_store.save(writer)
+
+    building = True
+    rebuild = threading.Thread(target=follower.poll)
+    rebuild.start()
+    assert loading.wait(5)
+
+    # Mid-rebuild, reads are served from the previous generation
+    reader_saw: list[dict[str, int]] = []
+    reader = threading.Thread(target=lambda: reader_saw.append(view.counts_for_prefix("he")))
+    reader.start()
+    reader.join(5)
+
+    building = False
+    resume.set()
+    rebuild.join(5)
+
+    assert reader_saw == [{"hello": 1}]
+    assert follower.history is view
+    assert view.counts_for_prefix("he") == {"hello": 1, "help": 1}
+    assert counter.resets == 1
+    assert counter.events == 2
+    writer_store.close()
+
+
+def test_follower_swap_does_not_block_hydration(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    writer_store = LogHistoryStore(path, checkpoint_every=1)
+    writer = writer_store.load()
+    writer.record("he", "hello", timestamp=_ts(0))
+    writer.record("he", "hello", timestamp=_ts(1))
+    writer_store.save(writer)
+
+    replaying = threading.Event()
+    resume = threading.Event()
+
+    class _SlowCounter(_Counter):
+        # Stalls replay while `stall` is set, until told to resume
+        def observe(self, prefix: str, value: str, timestamp: datetime, count: int = 1) -> None:
+            if stall:
+                replaying.set()
+                assert resume.wait(5)
+            super().observe(prefix, value, timestamp, count)
+
+    stall = False
+    follower = LogFollower(path)
+    view = follower.history
+    counter = _SlowCounter()
+    view.subscribe(counter)
+    ranker = DecayRanker(view, DecayFunction(half_life_seconds=3600), now=_ts(60))
+
+    writer.record("he", "help", timestamp=_ts(2))
+    writer_store.save(writer)
+
+    stall = True
+    rebuild = threading.Thread(target=follower.poll)
+    rebuild.start()
+    assert replaying.wait(5)
+
+    # Mid-replay, hydration takes prefix_lock and reads the previous generation
+    suggestions = [ScoredSuggestion(Suggestion("hello"), 0.0)]
+    reader_saw: list[float] = []
+    reader = threading.Thread(
+        target=lambda: reader_saw.append(ranker.explain("he", suggestions)[0].history_boost)
+    )
+    reader.start()
+    reader.join(5)
+    assert not reader.is_alive()
+    assert reader_saw and reader_saw[0] > 0
+
+    stall = False
+    resume.set()
+    rebuild.join(5)
+
+    assert counter.resets == 1
+    assert counter.events == 3
+    assert set(ranker._decayed_counts("he")) == {"hello", "help"}
+    writer_store.close()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.ranking.decay import DecayFunction, DecayRanker
+from aac.storage.json_store import JsonHistoryStore
+
+
+def test_json_store_round_trip(tmp_path: Path) -> None:
+    store = JsonHistoryStore(tmp_path / "history.json")
+
+    history = History()
+    history.record("he", "hello")
+    history.record("he", "hello")
+    history.record("wo", "world")
+    store.save(history)
+
+    loaded = store.load()
+
+    assert loaded.snapshot() == history.snapshot()
+    assert loaded.count("hello") == 2
+
+
+def test_json_store_hydrates_large_counts_in_bulk(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"he": {"hello": 1_000_000, "help": "3", "bad": "x"}}))
+
+    history = JsonHistoryStore(path).load()
+
+    assert history.counts_for_prefix("he") == {"hello": 1_000_000, "help": 3}
+    assert history.count("hello") == 1_000_000
+    assert history.entries() == ()
+
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    assert history.counts_for_prefix_since("he", since)["hello"] == 1_000_000
+
+
+def test_bulk_records_feed_decay_like_individual_records() -> None:
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    now = ts + timedelta(hours=1)
+    decay = DecayFunction(half_life_seconds=3600)
+
+    bulk = History()
+    bulk.record_bulk("he", "hello", 4, timestamp=ts)
+
+    single = History()
+    for _ in range(4):
+        single.record("he", "hello", timestamp=ts)
+
+    bulk_ranker = DecayRanker(bulk, decay, now=now)
+    single_ranker = DecayRanker(single, decay, now=now)
+
+    assert math.isclose(
+        bulk_ranker._decayed_counts("he")["hello"],
+        single_ranker._decayed_counts("he")["hello"],
+    )
+    assert math.isclose(bulk_ranker._decayed_counts("he")["hello"], 2.0)
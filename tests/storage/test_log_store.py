@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.storage.log_store import LogHistoryStore
+
+
+def _ts(minutes: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+def test_log_store_appends_records_without_rewriting_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path)
+
+    history = store.load()
+    history.record("he", "hello", timestamp=_ts(0))
+    history.record_bulk("he", "help", 5, timestamp=_ts(1))
+    store.save(history)
+    store.close()
+
+    assert not path.exists()
+    lines = store.log_path().read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        ["he", "hello", 1704067200000000],
+        ["he", "help", 1704067260000000, 5],
+    ]
+
+    loaded = LogHistoryStore(path).load()
+    assert loaded.counts_for_prefix("he") == {"hello": 1, "help": 5}
+    assert loaded.entries() == history.entries()
+
+
+def test_log_store_checkpoint_rotates_log(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path, checkpoint_every=2)
+
+    history = store.load()
+    history.record("he", "hello", timestamp=_ts(0))
+    history.record("he", "hello", timestamp=_ts(1))
+    old_log = store.log_path()
+    store.save(history)
+
+    assert store.generation == 1
+    assert not old_log.exists()
+    assert json.loads(path.read_text())["generation"] == 1
+
+    history.record("wo", "world", timestamp=_ts(2))
+    store.close()
+
+    loaded = LogHistoryStore(path).load()
+    assert loaded.snapshot() == {"he": {"hello": 2}, "wo": {"world": 1}}
+    assert [e.timestamp for e in loaded.entries()] == [_ts(0), _ts(1), _ts(2)]
+
+
+def test_log_store_ignores_torn_final_line(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path)
+
+    history = store.load()
+    history.record("he", "hello", timestamp=_ts(0))
+    store.close()
+
+    with store.log_path().open("a") as f:
+        f.write('["he","hel')
+
+    loaded = LogHistoryStore(path).load()
+    assert loaded.counts_for_prefix("he") == {"hello": 1}
+
+
+def test_log_store_skips_invalid_records(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path)
+
+    history = store.load()
+    history.record("he", "hello", timestamp=_ts(0))
+    store.close()
+
+    with store.log_path().open("a") as f:
+        f.write('["he","help",0,-3]\n')
+        f.write(f'["he","help",{10**30}]\n')
+        f.write('["wo","world",0,2]\n')
+
+    loaded = LogHistoryStore(path).load()
+    assert loaded.snapshot() == {"he": {"hello": 1}, "wo": {"world": 2}}
+
+
+def test_log_store_migrates_legacy_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"he": {"hello": 3}}))
+
+    store = LogHistoryStore(path)
+    history = store.load()
+    store.save(history)
+    store.close()
+
+    assert json.loads(path.read_text())["version"] == 1
+    assert LogHistoryStore(path).load().counts_for_prefix("he") == {"hello": 3}
+
+
+def test_log_store_checkpoints_foreign_history(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = LogHistoryStore(path)
+
+    history = History()
+    history.record("he", "hello", timestamp=_ts(0))
+    store.save(history)
+
+    history.record("he", "help", timestamp=_ts(1))
+    store.close()
+
+    loaded = LogHistoryStore(path).load()
+    assert loaded.counts_for_prefix("he") == {"hello": 1, "help": 1}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.storage.replica_store import ReplicaHistoryStore, merge_delta_files
+
+
+def test_replica_store_round_trip(tmp_path: Path) -> None:
+    store = ReplicaHistoryStore(tmp_path / "a.jsonl", replica="laptop")
+    history = store.load()
+    history.record("he", "hello")
+    history.record("he", "hello")
+    store.save(history)
+
+    loaded = ReplicaHistoryStore(tmp_path / "a.jsonl", replica="laptop")
+    assert loaded.load().snapshot() == {"he": {"hello": 2}}
+    assert loaded.clock() == {"laptop": 2}
+
+
+def test_merge_delta_files_combines_machines(tmp_path: Path) -> None:
+    laptop = ReplicaHistoryStore(tmp_path / "laptop.jsonl", replica="laptop")
+    desktop = ReplicaHistoryStore(tmp_path / "desktop.jsonl", replica="desktop")
+
+    history = laptop.load()
+    history.record("he", "hello")
+    laptop.save(history)
+
+    history = desktop.load()
+    history.record("he", "hello")
+    history.record("he", "help")
+    desktop.save(history)
+
+    out = tmp_path / "merged.jsonl"
+    assert merge_delta_files([tmp_path / "laptop.jsonl", tmp_path / "desktop.jsonl"], out) == 3
+    # Merging again (including the output itself) is idempotent
+    merge_delta_files([out, tmp_path / "laptop.jsonl"], out)
+
+    merged = ReplicaHistoryStore(out, replica="laptop").load()
+    assert merged.snapshot() == {"he": {"hello": 2, "help": 1}}
+
+
+def test_replica_store_exchanges_deltas(tmp_path: Path) -> None:
+    a = ReplicaHistoryStore(tmp_path / "a.jsonl", replica="a")
+    b = ReplicaHistoryStore(tmp_path / "b.jsonl", replica="b")
+    history_a = a.load()
+    history_b = b.load()
+
+    history_a.record("he", "hello")
+    assert b.apply_delta(a.export_delta(since=b.clock())) == 1
+
+    history_a.record("he", "help")
+    assert b.apply_delta(a.export_delta(since=b.clock())) == 1
+
+    assert history_b.snapshot() == history_a.snapshot()
+
+
+def test_replica_store_attributes_foreign_history_locally(tmp_path: Path) -> None:
+    store = ReplicaHistoryStore(tmp_path / "a.jsonl", replica="a")
+
+    history = History()
+    history.record_bulk("he", "hello", 5)
+    store.save(history)
+
+    assert store.export_delta()[0].count == 5
+    assert ReplicaHistoryStore(tmp_path / "a.jsonl").load().snapshot() == {"he": {"hello": 5}}
+
+
+def test_replica_store_saving_foreign_history_keeps_file_attribution(tmp_path: Path) -> None:
+    path = tmp_path / "a.jsonl"
+    a = ReplicaHistoryStore(path, replica="a")
+    b = ReplicaHistoryStore(tmp_path / "b.jsonl", replica="b")
+    history_a = a.load()
+    history_b = b.load()
+    history_b.record("he", "hello")
+    a.apply_delta(b.export_delta())
+    a.save(history_a)
+
+    foreign = History()
+    foreign.replace(history_a)
+    foreign.record("he", "help")
+
+    store = ReplicaHistoryStore(path, replica="a")
+    store.save(foreign)
+
+    assert [(r.replica, r.value, r.count) for r in store.export_delta()] == [
+        ("a", "help", 1),
+        ("b", "hello", 1),
+    ]
+    assert b.apply_delta(store.export_delta()) == 1
+    assert history_b.snapshot() == {"he": {"hello": 1, "help": 1}}
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.storage.shared_json_store import SharedJsonHistoryStore
+
+
+def test_shared_store_merges_concurrent_recorders(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+
+    a = SharedJsonHistoryStore(path)
+    b = SharedJsonHistoryStore(path)
+    history_a = a.load()
+    history_b = b.load()
+
+    history_a.record("he", "hello")
+    history_b.record("he", "help")
+    history_b.record("he", "hello")
+
+    a.save(history_a)
+    b.save(history_b)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 2, "help": 1}}
+
+
+def test_shared_store_saves_only_new_deltas(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    store = SharedJsonHistoryStore(path)
+
+    history = store.load()
+    history.record("he", "hello")
+    store.save(history)
+    store.save(history)
+    history.record("he", "hello")
+    store.save(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 2}}
+
+
+def test_shared_store_merges_foreign_history(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"he": {"hello": 1}, "wo": {"world": 1}}))
+
+    history = History()
+    history.record("he", "hello")
+    store = SharedJsonHistoryStore(path)
+    store.save(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 2}, "wo": {"world": 1}}
+
+    # Once saved, only new selections are merged
+    history.record("he", "help")
+    store.save(history)
+
+    assert json.loads(path.read_text()) == {
+        "he": {"hello": 2, "help": 1},
+        "wo": {"world": 1},
+    }
+
+
+def test_shared_store_merges_replaced_history(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    other = SharedJsonHistoryStore(path)
+    other_history = other.load()
+    other_history.record("wo", "world")
+    other.save(other_history)
+
+    store = SharedJsonHistoryStore(path)
+    history = store.load()
+    source = History()
+    source.record("he", "hello")
+    history.replace(source)
+    store.save(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 1}, "wo": {"world": 1}}
+
+
+def test_shared_store_overwrite_replaces_file(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"wo": {"world": 1}}))
+
+    history = History()
+    history.record("he", "hello")
+    store = SharedJsonHistoryStore(path)
+    store.overwrite(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 1}}
+
+    history.record("he", "hello")
+    store.save(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 2}}
+
+
+def test_shared_store_never_loses_events_under_contention(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+
+    def worker() -> None:
+        store = SharedJsonHistoryStore(path)
+        history = store.load()
+        for _ in range(20):
+            history.record("he", "hello")
+            store.save(history)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 80}}
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aac.domain.history import History
+from aac.presets import get_preset
+from aac.storage.sqlite_store import SqliteHistory, SqliteHistoryStore
+
+
+def _ts(minutes: int) -> datetime:
+    return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+
+
+def _populate(history: History) -> None:
+    history.record_bulk("he", "help", 4, timestamp=_ts(0))
+    history.record("he", "hello", timestamp=_ts(1))
+    history.record("he", "help", timestamp=_ts(2))
+    history.record("wo", "world", timestamp=_ts(3))
+    history.record("he", "hello", timestamp=_ts(4))
+
+
+def test_sqlite_history_matches_in_memory_history(tmp_path: Path) -> None:
+    sqlite = SqliteHistory(tmp_path / "history.db", batch_size=2)
+    memory = History()
+    _populate(sqlite)
+    _populate(memory)
+
+    assert sqlite.counts_for_prefix("he") == memory.counts_for_prefix("he")
+    assert sqlite.counts_for_prefix_since("he", _ts(1)) == {"hello": 2, "help": 1}
+    assert sqlite.counts_for_prefix_between("he", _ts(0), _ts(2)) == (
+        memory.counts_for_prefix_between("he", _ts(0), _ts(2))
+    )
+    assert sqlite.total_for_prefix_between("he", _ts(1), _ts(5)) == 3
+    assert sqlite.count("help") == memory.count("help") == 5
+    assert sqlite.count("missing") == 0
+    assert sqlite.entries() == memory.entries()
+    assert sqlite.entries_for_prefix("wo") == memory.entries_for_prefix("wo")
+    assert sqlite.buckets() == memory.buckets()
+    assert sqlite.snapshot() == memory.snapshot()
+
+    sqlite.close()
+
+
+def test_sqlite_store_shares_file_between_instances(tmp_path: Path) -> None:
+    store = SqliteHistoryStore(tmp_path / "history.db")
+
+    writer = store.load()
+    writer.record("he", "hello")
+    store.save(writer)
+
+    reader = store.load()
+    assert reader.counts_for_prefix("he") == {"hello": 1}
+
+    writer.record("he", "help")
+    store.save(writer)
+    assert reader.counts_for_prefix("he") == {"hello": 1, "help": 1}
+
+
+def test_sqlite_store_saves_foreign_history(tmp_path: Path) -> None:
+    store = SqliteHistoryStore(tmp_path / "history.db")
+
+    history = History()
+    _populate(history)
+    store.save(history)
+
+    loaded = store.load()
+    assert loaded.snapshot() == history.snapshot()
+    assert loaded.entries() == history.entries()
+
+
+def test_sqlite_history_drives_engine(tmp_path: Path) -> None:
+    sqlite_engine = get_preset("default").build(SqliteHistory(tmp_path / "history.db"))
+    memory_engine = get_preset("default").build(History())
+
+    for engine in (sqlite_engine, memory_engine):
+        engine.record_selection("he", "hero")
+        engine.record_selection("he", "hero")
+
+    assert sqlite_engine.suggest("he") == memory_engine.suggest("he")
+
+
+def test_sqlite_history_is_usable_from_several_threads(tmp_path: Path) -> None:
+    history = SqliteHistory(tmp_path / "history.db", batch_size=3)
+    errors: list[BaseException] = []
+
+    def work(value: str) -> None:
+        try:
+            for i in range(50):
+                history.record("he", value, timestamp=_ts(i))
+                history.counts_for_prefix("he")
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(v,)) for v in ("hello", "help")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert history.counts_for_prefix("he") == {"hello": 50, "help": 50}
+    history.close()
+
+
+def test_sqlite_history_keeps_batching_under_decay_ranker(tmp_path: Path) -> None:
+    history = SqliteHistory(tmp_path / "history.db", batch_size=1000)
+    _populate(history)
+    history.flush()
+    engine = get_preset("recency").build(history)
+
+    commits = 0
+    flush = history.flush
+
+    def counting_flush() -> None:
+        nonlocal commits
+        commits += bool(history._pending)
+        flush()
+
+    history.flush = counting_flush  # type: ignore[method-assign]
+
+    for i in range(100):
+        engine.record_selection("he", f"hero{i % 3}")
+
+    # Only the ranker's one-off check for the existing prefix commits
+    assert commits <= 1
+    history.close()
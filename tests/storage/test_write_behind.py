@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from aac.domain.history import History
+from aac.storage.base import HistoryStore
+from aac.storage.json_store import JsonHistoryStore
+from aac.storage.sqlite_store import SqliteHistoryStore
+from aac.storage.write_behind import WriteBehindStore
+
+
+class _RecordingStore(HistoryStore):
+    def __init__(self) -> None:
+        self.saved: list[dict[str, dict[str, int]]] = []
+        self.fail = False
+        self.event = threading.Event()
+
+    def load(self) -> History:
+        return History()
+
+    def save(self, history: History) -> None:
+        if self.fail:
+            raise OSError("disk full")
+        self.saved.append(history.snapshot())
+        self.event.set()
+
+
+def test_write_behind_coalesces_saves_until_flush() -> None:
+    inner = _RecordingStore()
+    store = WriteBehindStore(inner, max_pending=1000, interval=60)
+
+    history = History()
+    for _ in range(10):
+        history.record("he", "hello")
+        store.save(history)
+
+    assert inner.saved == []
+
+    store.flush()
+
+    assert inner.saved == [{"he": {"hello": 10}}]
+    assert store.stats.flushes == 1
+    assert store.stats.saves == 10
+    assert store.stats.coalesced == 9
+    assert store.stats.max_latency >= store.stats.last_latency > 0
+    store.close()
+
+
+def test_write_behind_flushes_on_size_threshold() -> None:
+    inner = _RecordingStore()
+
+    with WriteBehindStore(inner, max_pending=3, interval=60) as store:
+        history = History()
+        for _ in range(3):
+            store.save(history)
+
+        assert inner.event.wait(5)
+
+
+def test_write_behind_context_manager_flushes_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+
+    with WriteBehindStore(JsonHistoryStore(path), interval=60) as store:
+        history = store.load()
+        history.record("he", "hello")
+        store.save(history)
+
+    assert json.loads(path.read_text()) == {"he": {"hello": 1}}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_behind_surfaces_and_retries_failed_flush() -> None:
+    inner = _RecordingStore()
+    store = WriteBehindStore(inner, interval=60)
+
+    history = History()
+    history.record("he", "hello")
+    store.save(history)
+
+    inner.fail = True
+    with pytest.raises(OSError):
+        store.flush()
+
+    inner.fail = False
+    store.close()
+
+    assert inner.saved == [{"he": {"hello": 1}}]
+
+
+def test_write_behind_clears_background_error_after_successful_flush() -> None:
+    inner = _RecordingStore()
+    store = WriteBehindStore(inner, max_pending=1, interval=0.01)
+
+    inner.fail = True
+    history = History()
+    history.record("he", "hello")
+    store.save(history)
+
+    while store._error is None:
+        threading.Event().wait(0.01)
+
+    inner.fail = False
+    store.flush()
+    store.close()
+
+    assert inner.saved[-1] == {"he": {"hello": 1}}
+
+
+def test_write_behind_wraps_sqlite_store(tmp_path: Path) -> None:
+    path = tmp_path / "history.db"
+
+    with WriteBehindStore(SqliteHistoryStore(path), max_pending=1, interval=60) as store:
+        history = store.load()
+        history.record("he", "hello")
+        store.save(history)
+
+        for _ in range(500):
+            if store.stats.flushes:
+                break
+            threading.Event().wait(0.01)
+
+        assert store.stats.flushes == 1
+
+    assert SqliteHistoryStore(path).load().counts_for_prefix("he") == {"hello": 1}
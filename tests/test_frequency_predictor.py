@@ -18,3 +18,37 @@ def test_frequency_predictor_orders_by_frequency() -> None:
 
     assert set(values) == {"hello", "help", "helium"}
     assert scores == [10.0, 5.0, 1.0]
+
+
+def test_frequency_predictor_matches_linear_scan() -> None:
+    import random
+
+    rng = random.Random(7)
+    alphabet = "abé\U0010ffff"
+    frequencies = {
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))): rng.randint(0, 50)
+        for _ in range(300)
+    }
+    predictor = FrequencyPredictor(frequencies)
+    max_freq = max(frequencies.values())
+
+    for prefix in ["a", "ab", "é", "\U0010ffff", "b\U0010ffff", "zzz"]:
+        expected = [
+            (word, float(count), count / max_freq)
+            for word, count in frequencies.items()
+            if word.startswith(prefix)
+        ]
+        actual = [
+            (r.value, r.score, r.explanation.confidence if r.explanation else None)
+            for r in predictor.predict(prefix)
+        ]
+        assert actual == expected
+
+
+def test_frequency_predictor_coerces_counts_to_int() -> None:
+    predictor = FrequencyPredictor({"hello": 4.0, "help": True})  # type: ignore[dict-item]
+
+    assert [(r.value, r.score) for r in predictor.predict("he")] == [
+        ("hello", 4.0),
+        ("help", 1.0),
+    ]
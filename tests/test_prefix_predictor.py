@@ -23,3 +23,14 @@ def test_prefix_predictor_exact_match_not_repeated() -> None:
     predictor = StaticPrefixPredictor(vocabulary=["hello"])
 
     assert predictor.predict("hello") == []
+
+
+def test_prefix_predictor_add_and_remove_words() -> None:
+    predictor = StaticPrefixPredictor(vocabulary=["hello"])
+
+    assert predictor.add_word("help")
+    assert not predictor.add_word("hello")
+    assert predictor.remove_word("hello")
+    assert not predictor.remove_word("hello")
+
+    assert [r.value for r in predictor.predict("he")] == ["help"]